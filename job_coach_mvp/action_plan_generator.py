@@ -1,310 +1,104 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 from gap_analyzer import GapAnalyzer
+from learning_catalog import LearningCatalog, freeze, get_catalog, thaw
+from link_health import LinkHealth, get_link_health
+from pipeline_timing import recording
+from plan_scheduler import DEFAULT_HOURS_PER_WEEK, apply_schedule, format_weeks, weeks_needed
+import hashlib
+import json
 import re
+import threading
+
+# Gap fields that affect the generated plan
+PLAN_GAP_FIELDS = ('skill', 'type', 'importance', 'current_level', 'target_level')
+
+# Task fields kept when a plan is stored; the rest is resolved from the catalog
+STORED_TASK_FIELDS = ('id', 'skill', 'priority', 'current_level', 'target_level', 'score_delta')
+
+# Number of distinct plan templates kept per generator
+PLAN_CACHE_SIZE = 512
 
 class ActionPlanGenerator:
     """Generate personalized action plans with learning resources"""
     
-    # LinkedIn Learning course mappings (Updated - Only working URLs)
-    LINKEDIN_LEARNING_COURSES = {
-        'Python': {
-            'beginner': {
-                'title': 'Python Essential Training',
-                'url': 'https://www.linkedin.com/learning/python-essential-training-18764650',
-                'duration': '4h 30m',
-                'instructor': 'Ryan Mitchell'
-            },
-            'intermediate': {
-                'title': 'Advanced Python',
-                'url': 'https://www.linkedin.com/learning/advanced-python',
-                'duration': '3h 45m',
-                'instructor': 'Joe Marini'
-            },
-            'advanced': {
-                'title': 'Python Design Patterns',
-                'url': 'https://www.linkedin.com/learning/python-design-patterns',
-                'duration': '2h 15m',
-                'instructor': 'Jungwoo Ryoo'
-            },
-            'data_science': {
-                'title': 'Python for Data Science Essential Training',
-                'url': 'https://www.linkedin.com/learning/python-for-data-science-essential-training',
-                'duration': '4h 30m',
-                'instructor': 'Lillian Pierson'
-            }
-        },
-        'JavaScript': {
-            'beginner': {
-                'title': 'JavaScript Essential Training',
-                'url': 'https://www.linkedin.com/learning/javascript-essential-training-3',
-                'duration': '5h 15m',
-                'instructor': 'Morten Rand-Hendriksen'
-            },
-            'backend': {
-                'title': 'Node.js Essential Training',
-                'url': 'https://www.linkedin.com/learning/node-js-essential-training',
-                'duration': '5h 20m',
-                'instructor': 'Alex Banks'
-            }
-        },
-        'React': {
-            'beginner': {
-                'title': 'React.js Essential Training',
-                'url': 'https://www.linkedin.com/learning/react-js-essential-training',
-                'duration': '4h 45m',
-                'instructor': 'Eve Porcello'
-            },
-            'testing': {
-                'title': 'React: Testing and Debugging',
-                'url': 'https://www.linkedin.com/learning/react-testing-and-debugging',
-                'duration': '4h 10m',
-                'instructor': 'Eve Porcello'
-            }
-        },
-        'Django': {
-            'beginner': {
-                'title': 'Django Essential Training',
-                'url': 'https://www.linkedin.com/learning/django-essential-training',
-                'duration': '4h 10m',
-                'instructor': 'Justin Mitchel'
-            }
-        },
-        'AWS': {
-            'beginner': {
-                'title': 'AWS Essential Training for Developers',
-                'url': 'https://www.linkedin.com/learning/aws-essential-training-for-developers',
-                'duration': '5h 30m',
-                'instructor': 'Jeremy Villeneuve'
-            },
-            'intermediate': {
-                'title': 'Complete Guide to AWS Software Deployment',
-                'url': 'https://www.linkedin.com/learning/complete-guide-to-aws-software-deployment',
-                'duration': '6h 26m',
-                'instructor': 'Brandon Rich'
-            }
-        },
-        'Docker': {
-            'beginner': {
-                'title': 'Docker Essential Training',
-                'url': 'https://www.linkedin.com/learning/docker-essential-training',
-                'duration': '3h 45m',
-                'instructor': 'James Williams'
-            },
-            'intermediate': {
-                'title': 'Docker Essential Training: 2 Orchestration',
-                'url': 'https://www.linkedin.com/learning/docker-essential-training-2-orchestration',
-                'duration': '3h 20m',
-                'instructor': 'James Williams'
-            },
-            'networking': {
-                'title': 'Docker Essential Training: 5 Networking',
-                'url': 'https://www.linkedin.com/learning/docker-essential-training-5-networking',
-                'duration': '2h 45m',
-                'instructor': 'James Williams'
-            },
-            'storage': {
-                'title': 'Docker Essential Training: 4 Storage and Volumes',
-                'url': 'https://www.linkedin.com/learning/docker-essential-training-4-storage-and-volumes',
-                'duration': '2h 30m',
-                'instructor': 'James Williams'
-            }
-        },
-        'Git': {
-            'beginner': {
-                'title': 'Git Essential Training',
-                'url': 'https://www.linkedin.com/learning/git-essential-training-the-basics',
-                'duration': '3h 15m',
-                'instructor': 'Kevin Skoglund'
-            }
-        },
-        'SQL': {
-            'beginner': {
-                'title': 'SQL Essential Training',
-                'url': 'https://www.linkedin.com/learning/sql-essential-training-2',
-                'duration': '4h 20m',
-                'instructor': 'Bill Weinman'
-            }
-        },
-        'PostgreSQL': {
-            'beginner': {
-                'title': 'PostgreSQL Essential Training',
-                'url': 'https://www.linkedin.com/learning/postgresql-essential-training',
-                'duration': '4h 15m',
-                'instructor': 'Adam Wilbert'
-            }
-        },
-        'MongoDB': {
-            'beginner': {
-                'title': 'MongoDB Essential Training',
-                'url': 'https://www.linkedin.com/learning/mongodb-essential-training',
-                'duration': '3h 50m',
-                'instructor': 'Justin Jenkins'
-            }
-        },
-        'Data Science': {
-            'intermediate': {
-                'title': 'Data Cleaning in Python Essential Training',
-                'url': 'https://www.linkedin.com/learning/data-cleaning-in-python-essential-training-17061364',
-                'duration': '3h 30m',
-                'instructor': 'LinkedIn Learning'
-            }
-        }
-    }
-    
-    # YouTube fallback resources
-    YOUTUBE_RESOURCES = {
-        'Python': {
-            'beginner': {
-                'title': 'Python for Beginners - Full Course',
-                'url': 'https://www.youtube.com/watch?v=_uQrJ0TkZlc',
-                'channel': 'Programming with Mosh',
-                'duration': '6h 14m'
-            },
-            'intermediate': {
-                'title': 'Python Intermediate Tutorial',
-                'url': 'https://www.youtube.com/watch?v=HGOBQPFzWKo',
-                'channel': 'Corey Schafer',
-                'duration': '4h 30m'
-            }
-        },
-        'React': {
-            'beginner': {
-                'title': 'React Tutorial for Beginners',
-                'url': 'https://www.youtube.com/watch?v=Ke90Tje7VS0',
-                'channel': 'Programming with Mosh',
-                'duration': '5h 20m'
-            }
-        },
-        'AWS': {
-            'beginner': {
-                'title': 'AWS Tutorial for Beginners',
-                'url': 'https://www.youtube.com/watch?v=ulprqHHWlng',
-                'channel': 'Simplilearn',
-                'duration': '4h 15m'
-            }
-        },
-        'Data Science': {
-            'intermediate': {
-                'title': 'Data Science Full Course',
-                'url': 'https://www.youtube.com/watch?v=ua-CiDNNj30',
-                'channel': 'edureka!',
-                'duration': '11h 52m'
-            }
-        }
-    }
+    def __init__(self, catalog: Optional[LearningCatalog] = None, cache_size: int = PLAN_CACHE_SIZE,
+                 link_health: Optional[LinkHealth] = None, gap_analyzer: Optional[GapAnalyzer] = None):
+        self.gap_analyzer = gap_analyzer or GapAnalyzer()
+        self._catalog = catalog
+        self._link_health = link_health
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._templates: 'OrderedDict[Tuple[str, str, str, int], Any]' = OrderedDict()
+        self._templates_lock = threading.Lock()
     
-    # Task templates with time estimates
-    TASK_TEMPLATES = {
-        'Python': {
-            'beginner': {
-                'title': 'Complete Python Fundamentals Course',
-                'description': 'Learn Python basics including syntax, data structures, and control flow',
-                'estimated_hours': 20,
-                'timeline': 'Week 1-2',
-                'priority': 'high'
-            },
-            'intermediate': {
-                'title': 'Build 2-3 Python Projects for Portfolio',
-                'description': 'Create practical projects to demonstrate Python skills',
-                'estimated_hours': 30,
-                'timeline': 'Week 2-4',
-                'priority': 'high'
-            },
-            'advanced': {
-                'title': 'Master Advanced Python Concepts',
-                'description': 'Learn decorators, generators, context managers, and design patterns',
-                'estimated_hours': 25,
-                'timeline': 'Week 3-5',
-                'priority': 'medium'
-            }
-        },
-        'React': {
-            'beginner': {
-                'title': 'Complete React Basics Tutorial',
-                'description': 'Learn React fundamentals including components, state, and props',
-                'estimated_hours': 25,
-                'timeline': 'Week 1-3',
-                'priority': 'high'
-            },
-            'intermediate': {
-                'title': 'Build Full-Stack React Application',
-                'description': 'Create a complete web application with React frontend and API backend',
-                'estimated_hours': 35,
-                'timeline': 'Week 3-6',
-                'priority': 'high'
-            }
-        },
-        'AWS': {
-            'beginner': {
-                'title': 'Get AWS Cloud Practitioner Certification',
-                'description': 'Study and pass the AWS Cloud Practitioner exam',
-                'estimated_hours': 15,
-                'timeline': 'Week 1-2',
-                'priority': 'high'
-            },
-            'intermediate': {
-                'title': 'Deploy Application Using AWS Services',
-                'description': 'Deploy a real application using EC2, S3, and other AWS services',
-                'estimated_hours': 20,
-                'timeline': 'Week 2-4',
-                'priority': 'high'
-            }
-        },
-        'Docker': {
-            'beginner': {
-                'title': 'Learn Docker Fundamentals',
-                'description': 'Understand containers, images, and basic Docker commands',
-                'estimated_hours': 15,
-                'timeline': 'Week 1-2',
-                'priority': 'medium'
-            },
-            'intermediate': {
-                'title': 'Containerize Your Applications',
-                'description': 'Dockerize existing applications and create multi-container setups',
-                'estimated_hours': 20,
-                'timeline': 'Week 2-4',
-                'priority': 'medium'
-            }
-        },
-        'Kubernetes': {
-            'beginner': {
-                'title': 'Learn Kubernetes Basics',
-                'description': 'Understand pods, services, deployments, and basic kubectl commands',
-                'estimated_hours': 20,
-                'timeline': 'Week 2-4',
-                'priority': 'medium'
-            }
-        },
-        'Git': {
-            'beginner': {
-                'title': 'Master Git Fundamentals',
-                'description': 'Learn version control, branching, merging, and collaboration',
-                'estimated_hours': 10,
-                'timeline': 'Week 1',
-                'priority': 'medium'
-            },
-            'intermediate': {
-                'title': 'Advanced Git Workflows',
-                'description': 'Learn Git hooks, rebasing, and advanced collaboration techniques',
-                'estimated_hours': 15,
-                'timeline': 'Week 1-2',
-                'priority': 'low'
-            }
-        }
-    }
+    @property
+    def catalog(self) -> LearningCatalog:
+        """Learning catalog (the hot-reloaded shared one unless pinned)"""
+        return self._catalog or get_catalog()
     
-    def __init__(self):
-        self.gap_analyzer = GapAnalyzer()
+    @property
+    def link_health(self) -> LinkHealth:
+        """Latest link check results (the shared cached ones unless pinned)"""
+        return self._link_health or get_link_health()
     
-    def generate_action_plan(self, analysis_id: int, skill_gaps: List[Dict]) -> Dict[str, Any]:
-        """Generate a comprehensive action plan from skill gaps"""
+    def generate_action_plan(self, analysis_id: int, skill_gaps: List[Dict],
+                             hours_per_week: int = DEFAULT_HOURS_PER_WEEK,
+                             score_deltas: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Generate a comprehensive action plan from skill gaps.
         
-        tasks = []
-        total_hours = 0
+        score_deltas (see ScoringModel.skill_deltas) gives each task the
+        readiness score its skill would add if it were the only task completed.
+        """
         
         # Sort gaps by importance (critical first)
         importance_order = {'critical': 0, 'high': 1, 'preferred': 2}
         sorted_gaps = sorted(skill_gaps, key=lambda x: importance_order.get(x.get('importance', 'preferred'), 3))
+        normalized_gaps = [{field: gap.get(field) for field in PLAN_GAP_FIELDS} for gap in sorted_gaps]
+        
+        # Identical gap sets share one immutable template per catalog version
+        # and set of dead links
+        catalog = self.catalog
+        key = (self._gaps_fingerprint(normalized_gaps), catalog.version, self.link_health.version, hours_per_week)
+        with self._templates_lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                if recording():
+                    self.cache_hits += 1
+        
+        if template is None:
+            template = freeze(self._build_plan_template(sorted_gaps, catalog, hours_per_week))
+            with self._templates_lock:
+                if recording():
+                    self.cache_misses += 1
+                self._templates[key] = template
+                while len(self._templates) > self.cache_size:
+                    self._templates.popitem(last=False)
+        
+        # Layer the per-user fields onto a private copy of the template
+        plan = thaw(template)
+        plan['analysis_id'] = analysis_id
+        plan['completed_tasks'] = []
+        plan['updated_readiness_score'] = None
+        if score_deltas is not None:
+            for task in plan['tasks']:
+                task['score_delta'] = round(score_deltas.get(task['skill'].lower(), 0.0), 4)
+        return plan
+    
+    @staticmethod
+    def _gaps_fingerprint(normalized_gaps: List[Dict]) -> str:
+        """Canonical hash of the plan-relevant gap fields"""
+        canonical = json.dumps(normalized_gaps, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def _build_plan_template(self, sorted_gaps: List[Dict], catalog: LearningCatalog,
+                             hours_per_week: int = DEFAULT_HOURS_PER_WEEK) -> Dict[str, Any]:
+        """Build the user-independent part of an action plan"""
+        
+        tasks = []
+        total_hours = 0
         
         for gap in sorted_gaps:
             skill_name = gap['skill']
@@ -312,10 +106,10 @@ class ActionPlanGenerator:
             
             if gap_type == 'missing':
                 # Generate task for missing skill
-                task = self._create_task_for_missing_skill(skill_name, gap)
+                task = self._create_task_for_missing_skill(skill_name, gap, catalog)
             elif gap_type == 'level_gap':
                 # Generate task for skill improvement
-                task = self._create_task_for_skill_improvement(skill_name, gap)
+                task = self._create_task_for_skill_improvement(skill_name, gap, catalog)
             else:
                 continue
             
@@ -323,42 +117,31 @@ class ActionPlanGenerator:
                 tasks.append(task)
                 total_hours += task['estimated_hours']
         
-        # Calculate timeline
-        timeline = self._calculate_timeline(total_hours)
+        # Pack tasks into weeks by priority, prerequisites first
+        tasks = apply_schedule(tasks, hours_per_week, catalog.prerequisites)
+        timeline = self._calculate_timeline(total_hours, hours_per_week)
         
         # Generate summary
         summary = self._generate_plan_summary(tasks, total_hours, timeline)
         
         return {
-            'analysis_id': analysis_id,
             'tasks': tasks,
             'total_hours': total_hours,
             'timeline': timeline,
-            'summary': summary,
-            'completed_tasks': [],
-            'updated_readiness_score': None
+            'summary': summary
         }
     
-    def _create_task_for_missing_skill(self, skill_name: str, gap: Dict) -> Optional[Dict]:
+    def _create_task_for_missing_skill(self, skill_name: str, gap: Dict,
+                                       catalog: Optional[LearningCatalog] = None) -> Optional[Dict]:
         """Create a task for a completely missing skill"""
+        catalog = catalog or self.catalog
         
         # Determine target level based on job requirements
         target_level = self._determine_target_level(gap)
-        
-        # Get task template
-        task_template = self.TASK_TEMPLATES.get(skill_name, {}).get(target_level)
-        if not task_template:
-            # Create generic task if no template exists
-            task_template = {
-                'title': f'Learn {skill_name}',
-                'description': f'Study and practice {skill_name} to meet job requirements',
-                'estimated_hours': 20,
-                'timeline': 'Week 1-3',
-                'priority': gap.get('importance', 'preferred')
-            }
+        task_template = self._task_template(skill_name, target_level, None, catalog)
         
         # Get learning resources
-        resources = self._get_learning_resources(skill_name, target_level)
+        resources = self._get_learning_resources(skill_name, target_level, catalog)
         
         return {
             'id': f"task_{skill_name.lower().replace(' ', '_')}_{target_level}",
@@ -373,25 +156,17 @@ class ActionPlanGenerator:
             'completed': False
         }
     
-    def _create_task_for_skill_improvement(self, skill_name: str, gap: Dict) -> Optional[Dict]:
+    def _create_task_for_skill_improvement(self, skill_name: str, gap: Dict,
+                                           catalog: Optional[LearningCatalog] = None) -> Optional[Dict]:
         """Create a task for improving an existing skill"""
+        catalog = catalog or self.catalog
         
         current_level = gap.get('current_level', 'basic')
         target_level = gap.get('target_level', 'intermediate')
-        
-        # Get task template for improvement
-        task_template = self.TASK_TEMPLATES.get(skill_name, {}).get(target_level)
-        if not task_template:
-            task_template = {
-                'title': f'Improve {skill_name} from {current_level} to {target_level}',
-                'description': f'Enhance your {skill_name} skills to reach {target_level} level',
-                'estimated_hours': 15,
-                'timeline': 'Week 1-2',
-                'priority': gap.get('importance', 'preferred')
-            }
+        task_template = self._task_template(skill_name, target_level, current_level, catalog)
         
         # Get learning resources
-        resources = self._get_learning_resources(skill_name, target_level)
+        resources = self._get_learning_resources(skill_name, target_level, catalog)
         
         return {
             'id': f"task_{skill_name.lower().replace(' ', '_')}_{target_level}",
@@ -407,103 +182,96 @@ class ActionPlanGenerator:
             'completed': False
         }
     
-    def _determine_target_level(self, gap: Dict) -> str:
-        """Determine the target skill level based on job requirements"""
-        # Default to intermediate for most skills
-        return 'intermediate'
-    
-    def _get_learning_resources(self, skill_name: str, target_level: str) -> List[Dict]:
-        """Get learning resources prioritizing LinkedIn Learning and official docs"""
-        resources = []
+    def _task_template(self, skill_name: str, target_level: str, current_level: Optional[str],
+                       catalog: LearningCatalog) -> Dict[str, Any]:
+        """Catalog task template, or a generic one for a missing skill or an improvement"""
+        task_template = catalog.task_template(skill_name, target_level)
+        if task_template:
+            return task_template
         
-        # Add official documentation first (always available)
-        official_docs = self._get_official_documentation(skill_name)
-        if official_docs:
-            resources.append({
-                'name': f"Official Documentation: {skill_name}",
-                'url': official_docs,
-                'type': 'documentation',
-                'platform': 'Official',
-                'priority': 'reference'
-            })
+        if current_level is None:
+            # Create generic task if no template exists
+            return {
+                'title': f'Learn {skill_name}',
+                'description': f'Study and practice {skill_name} to meet job requirements',
+                'estimated_hours': 20,
+                'timeline': 'Week 1-3'
+            }
+        return {
+            'title': f'Improve {skill_name} from {current_level} to {target_level}',
+            'description': f'Enhance your {skill_name} skills to reach {target_level} level',
+            'estimated_hours': 15,
+            'timeline': 'Week 1-2'
+        }
+    
+    def compact_tasks(self, tasks: List[Dict]) -> List[Dict]:
+        """Reduce tasks to the ids and per-plan fields that are stored.
         
-        # Try LinkedIn Learning second (premium structured learning)
-        linkedin_course = self.LINKEDIN_LEARNING_COURSES.get(skill_name, {}).get(target_level)
-        if linkedin_course:
-            resources.append({
-                'name': f"LinkedIn Learning: {linkedin_course['title']}",
-                'url': linkedin_course['url'],
-                'type': 'course',
-                'platform': 'LinkedIn Learning',
-                'duration': linkedin_course['duration'],
-                'instructor': linkedin_course['instructor'],
-                'priority': 'primary'
-            })
+        Titles, descriptions, hours and resource details are resolved from the
+        catalog by hydrate_tasks, so catalog fixes reach existing plans.
+        """
+        compacted = []
+        for task in tasks:
+            stored = {field: task[field] for field in STORED_TASK_FIELDS if field in task}
+            stored['resource_ids'] = [resource['id'] for resource in task.get('resources', [])]
+            compacted.append(stored)
+        return compacted
+    
+    def hydrate_tasks(self, stored_tasks: List[Dict], completed_tasks: Optional[List[str]] = None,
+                      hours_per_week: Optional[int] = None) -> List[Dict]:
+        """Resolve stored tasks against the catalog and schedule the open ones.
         
-        # Add YouTube as backup (free alternative)
-        youtube_resource = self.YOUTUBE_RESOURCES.get(skill_name, {}).get(target_level)
-        if youtube_resource:
-            resources.append({
-                'name': f"YouTube: {youtube_resource['title']}",
-                'url': youtube_resource['url'],
-                'type': 'video',
-                'platform': 'YouTube',
-                'channel': youtube_resource['channel'],
-                'duration': youtube_resource['duration'],
-                'priority': 'secondary'
-            })
+        Plans saved before tasks were compacted hold full task dicts; those are
+        passed through unchanged apart from their schedule.
+        """
+        catalog = self.catalog
+        completed = set(completed_tasks or [])
+        tasks = []
+        for stored in stored_tasks or []:
+            if 'title' in stored:
+                task = dict(stored)
+            else:
+                task_template = self._task_template(
+                    stored['skill'], stored['target_level'], stored.get('current_level'), catalog
+                )
+                resources_by_id = catalog.resources_by_id
+                dead_urls = self.link_health.dead_urls
+                task = {
+                    **stored,
+                    'title': task_template['title'],
+                    'description': task_template['description'],
+                    'estimated_hours': task_template['estimated_hours'],
+                    'resources': [dict(resources_by_id[resource_id]) for resource_id in stored['resource_ids']
+                                  if resource_id in resources_by_id
+                                  and resources_by_id[resource_id]['url'] not in dead_urls]
+                }
+                del task['resource_ids']
+            task['completed'] = task['id'] in completed
+            tasks.append(task)
         
-        return resources
+        return apply_schedule(tasks, hours_per_week or DEFAULT_HOURS_PER_WEEK, catalog.prerequisites, completed)
+    
+    def _determine_target_level(self, gap: Dict) -> str:
+        """Determine the target skill level based on job requirements"""
+        # Use the level the job asks for, defaulting to intermediate
+        return gap.get('target_level') or 'intermediate'
+    
+    def _get_learning_resources(self, skill_name: str, target_level: str,
+                                catalog: Optional[LearningCatalog] = None) -> List[Dict]:
+        """Get learning resources prioritizing LinkedIn Learning and official docs"""
+        # Docs first, then the nearest-level LinkedIn Learning and YouTube courses,
+        # leaving out links the link checker found dead
+        dead_urls = self.link_health.dead_urls
+        return [dict(resource) for resource in (catalog or self.catalog).resources(skill_name, target_level)
+                if resource['url'] not in dead_urls]
     
     def _get_official_documentation(self, skill_name: str) -> Optional[str]:
         """Get official documentation URLs for skills"""
-        docs_mapping = {
-            'Python': 'https://docs.python.org/3/',
-            'Python PEPs': 'https://www.python.org/dev/peps/',
-            'PyPI': 'https://pypi.org/',
-            'React': 'https://react.dev/',
-            'React Native': 'https://reactnative.dev/docs/getting-started',
-            'MDN React Guide': 'https://developer.mozilla.org/en-US/docs/Learn/Tools_and_testing/Client-side_JavaScript_frameworks/React_getting_started',
-            'Django': 'https://docs.djangoproject.com/',
-            'Django REST Framework': 'https://www.django-rest-framework.org/',
-            'Django Start Page': 'https://www.djangoproject.com/start/',
-            'AWS': 'https://docs.aws.amazon.com/',
-            'AWS Lambda Function URLs': 'https://docs.aws.amazon.com/lambda/latest/dg/urls-configuration.html',
-            'AWS Lambda URL Auth': 'https://docs.aws.amazon.com/lambda/latest/dg/urls-auth.html',
-            'AWS CLI Endpoints': 'https://docs.aws.amazon.com/cli/v1/userguide/cli-configure-endpoints.html',
-            'Docker': 'https://docs.docker.com/',
-            'Docker Guides': 'https://docs.docker.com/guides/',
-            'Docker Manuals': 'https://docs.docker.com/manuals/',
-            'Docker Engine': 'https://docs.docker.com/engine/',
-            'Kubernetes': 'https://kubernetes.io/docs/',
-            'Kubernetes Concepts': 'https://kubernetes.io/docs/concepts/overview/',
-            'Kubernetes Tutorials': 'https://kubernetes.io/docs/tutorials/',
-            'Kubernetes Deployments': 'https://kubernetes.io/docs/concepts/workloads/controllers/deployment/',
-            'Kubernetes Resource Management': 'https://docs.kubernetes.io/docs/concepts/configuration/manage-resources-containers/',
-            'Git': 'https://git-scm.com/doc',
-            'Git User Manual': 'https://git-scm.com/docs/user-manual',
-            'Git Log': 'https://git-scm.com/docs/git-log',
-            'Git Branch': 'https://git-scm.com/docs/git-branch',
-            'Git Add': 'https://git-scm.com/docs/git-add',
-            'Git Commit': 'https://git-scm.com/docs/git-commit',
-            'JavaScript': 'https://developer.mozilla.org/en-US/docs/Web/JavaScript',
-            'SQL': 'https://www.w3schools.com/sql/',
-            'Data Science': 'https://pandas.pydata.org/docs/'
-        }
-        return docs_mapping.get(skill_name)
+        return self.catalog.documentation_url(skill_name)
     
-    def _calculate_timeline(self, total_hours: int) -> str:
+    def _calculate_timeline(self, total_hours: int, hours_per_week: int = DEFAULT_HOURS_PER_WEEK) -> str:
         """Calculate realistic timeline based on total hours"""
-        # Assume 10 hours per week for learning
-        weeks = max(1, round(total_hours / 10))
-        
-        if weeks == 1:
-            return "1 week"
-        elif weeks <= 4:
-            return f"{weeks} weeks"
-        else:
-            months = round(weeks / 4, 1)
-            return f"{months} months"
+        return format_weeks(weeks_needed(total_hours, hours_per_week))
     
     def _generate_plan_summary(self, tasks: List[Dict], total_hours: int, timeline: str) -> Dict[str, Any]:
         """Generate a summary of the action plan"""
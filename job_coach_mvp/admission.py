@@ -0,0 +1,137 @@
+"""
+Admission control for extraction and analysis.
+
+Without a bound, a burst of uploads or API batches piles CPU-bound work onto
+a worker until requests time out and the work is wasted. AdmissionController
+caps the analyses running in a process at `slots`. Requests that find every
+slot busy wait in a short queue for at most `queue_timeout` seconds. When the
+queue is full, or the wait times out, they fail fast with Overloaded, which
+the app turns into a 503 with Retry-After.
+
+Cheap work (text-only submissions, small uploads) goes first. Expensive work
+(large PDFs) may not use the last `reserved` slots or more than half the
+queue, and it only gets a freed slot when no cheap request is waiting. Page
+views never go through admission.
+
+Background job workers use try_acquire(). It takes a slot only if one is
+free (or frees up within its timeout). It never takes a place in the request
+queue and never counts as a rejection, so a worker claims a job only once it
+holds the slot to run it.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+# The app sizes slots from its analysis job workers (ADMISSION_SLOTS overrides)
+DEFAULT_SLOTS = 2
+DEFAULT_QUEUE_SIZE = int(os.environ.get('ADMISSION_QUEUE', 8))
+
+# Seconds a request may wait for a slot
+QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 2.0))
+
+# Seconds clients are told to wait before retrying a refused request
+RETRY_AFTER = int(os.environ.get('ADMISSION_RETRY_AFTER', 5))
+
+_DEFAULT = object()
+
+
+class Overloaded(Exception):
+    """Work refused because the process is saturated"""
+
+    def __init__(self, retry_after: int = RETRY_AFTER):
+        super().__init__(f"Server busy, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bounded in-flight slots with a short wait queue that favours cheap work"""
+
+    def __init__(self, slots: int = DEFAULT_SLOTS, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 queue_timeout: float = QUEUE_TIMEOUT, reserved: int = 1, retry_after: int = RETRY_AFTER):
+        self.slots = max(1, slots)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        # Slots only cheap work may take; expensive work always keeps at least one
+        self.reserved = min(reserved, self.slots - 1)
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiting = {False: 0, True: 0}
+        self._queued = 0
+        self._condition = threading.Condition()
+
+    def _has_room(self, expensive: bool) -> bool:
+        if expensive:
+            return self.in_flight < self.slots - self.reserved and not self._waiting[False]
+        return self.in_flight < self.slots
+
+    def _queue_full(self, expensive: bool) -> bool:
+        return self._queued >= (self.queue_size // 2 if expensive else self.queue_size)
+
+    def saturated(self, expensive: bool = False) -> bool:
+        """Whether a request would be refused right now, without queueing it"""
+        with self._condition:
+            return not self._has_room(expensive) and self._queue_full(expensive)
+
+    def reject(self):
+        """Refuse work decided outside the controller (e.g. a full job backlog)"""
+        with self._condition:
+            self._reject()
+
+    def _reject(self):
+        self.rejected += 1
+        raise Overloaded(self.retry_after)
+
+    def acquire(self, expensive: bool = False, timeout: Optional[float] = _DEFAULT):
+        """Take a slot, waiting up to timeout seconds (None waits indefinitely)
+
+        Raises Overloaded when the queue is full or the wait times out.
+        """
+        if timeout is _DEFAULT:
+            timeout = self.queue_timeout
+        with self._condition:
+            if not self._has_room(expensive):
+                if timeout is not None and (timeout <= 0 or self._queue_full(expensive)):
+                    self._reject()
+                if not self._wait(expensive, timeout, queued=timeout is not None):
+                    self._reject()
+            self.in_flight += 1
+
+    def try_acquire(self, expensive: bool = False, timeout: float = 0.0) -> bool:
+        """Take a slot for background work if one frees up within timeout seconds
+
+        Never queues behind requests or counts as a rejection; False when no slot was free.
+        """
+        with self._condition:
+            if not self._has_room(expensive) and (timeout <= 0 or not self._wait(expensive, timeout, queued=False)):
+                return False
+            self.in_flight += 1
+            return True
+
+    def _wait(self, expensive: bool, timeout: Optional[float], queued: bool) -> bool:
+        self._waiting[expensive] += 1
+        self._queued += queued
+        try:
+            return self._condition.wait_for(lambda: self._has_room(expensive), timeout)
+        finally:
+            self._waiting[expensive] -= 1
+            self._queued -= queued
+            # Waiting cheap work may have been holding back an expensive waiter
+            self._condition.notify_all()
+
+    def release(self):
+        """Give back a slot"""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def admit(self, expensive: bool = False, timeout: Optional[float] = _DEFAULT):
+        """Hold a slot for the duration of the block"""
+        self.acquire(expensive, timeout)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,250 @@
+"""
+Background analysis jobs backed by the app database.
+
+/upload only saves the resume and records an AnalysisJob row, then returns.
+A small pool of worker threads claims queued jobs with an atomic UPDATE, so
+several processes (e.g. gunicorn workers) can share the same queue without
+an external broker. A claimed job holds a lease; if its process dies the
+lease expires and another worker picks the job up again, up to MAX_ATTEMPTS
+times.
+
+With an AdmissionController, a worker first takes an admission slot and
+only then claims a job that the slot may run. Cheap jobs are tried first.
+A job over large_job_bytes (see AnalysisJob.upload_bytes) is claimed only
+when an expensive slot is free. So a claimed job never waits for a slot
+while its lease runs out, and a large upload never ties up a worker thread
+that cheap jobs could use.
+
+Workers are started lazily in each process and recreated after a fork. They
+wake up when a job is enqueued in the same process and otherwise poll every
+POLL_INTERVAL seconds, which also recovers jobs left behind by a restart.
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import and_, not_, or_
+
+from models import db, AnalysisJob
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+DEFAULT_WORKERS = 2
+
+# Seconds an idle worker waits before checking the queue again
+POLL_INTERVAL = 2.0
+
+# Seconds a claimed job may run before another worker may reclaim it
+LEASE_SECONDS = 300
+
+# Claims per job before it is failed (each lost lease counts as an attempt)
+MAX_ATTEMPTS = 3
+
+
+def complete_job(job: AnalysisJob, analysis_id: int):
+    """Mark a job done; the caller commits it with the analysis"""
+    job.status = DONE
+    job.analysis_id = analysis_id
+    job.error = None
+    job.finished_at = datetime.utcnow()
+    job.lease_expires_at = None
+
+
+class AnalysisJobQueue:
+    """Database-backed job queue with an in-process worker pool"""
+
+    def __init__(self, app, handler: Callable[[AnalysisJob], None], workers: int = DEFAULT_WORKERS,
+                 eager: bool = False, poll_interval: float = POLL_INTERVAL, lease_seconds: int = LEASE_SECONDS,
+                 admission=None, large_job_bytes: Optional[int] = None):
+        self.app = app
+        # handler(job) does the work and completes the job with complete_job()
+        self.handler = handler
+        self.workers = workers
+        # Eager mode runs jobs inline on enqueue (tests, single-threaded tools)
+        self.eager = eager
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        # Optional AdmissionController; jobs over large_job_bytes need an expensive slot
+        self.admission = admission
+        self.large_job_bytes = large_job_bytes
+        self._threads: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+        self._wakeup = threading.Condition()
+        self._signals = 0
+        self._stopping = False
+        self._lock = threading.Lock()
+
+    def enqueue(self, **fields) -> AnalysisJob:
+        """Store a new queued job and hand it to a worker"""
+        job = AnalysisJob(status=QUEUED, attempts=0, **fields)
+        db.session.add(job)
+        db.session.commit()
+
+        if self.eager:
+            expensive = self._is_expensive(job)
+            if self.admission is not None:
+                self.admission.acquire(expensive, timeout=None)
+            try:
+                if self._claim(job.id):
+                    self._execute(job.id)
+            finally:
+                if self.admission is not None:
+                    self.admission.release()
+            db.session.refresh(job)
+        else:
+            self.start()
+            self._notify()
+        return job
+
+    def pending(self) -> int:
+        """Jobs waiting for a worker, across all processes"""
+        return AnalysisJob.query.filter_by(status=QUEUED).count()
+
+    def start(self):
+        """Start this process's worker threads (threads don't survive a fork)"""
+        if self.eager or (self._pid == os.getpid() and not self._stopping):
+            return
+        with self._lock:
+            if self._pid == os.getpid() and not self._stopping:
+                return
+            self._stopping = False
+            self._signals = 0
+            self._threads = [
+                threading.Thread(target=self._run, name=f'analysis-job-{index}', daemon=True)
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            self._pid = os.getpid()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the worker threads once they finish their current job"""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _notify(self):
+        """Wake one idle worker"""
+        with self._wakeup:
+            self._signals += 1
+            self._wakeup.notify()
+
+    def _run(self):
+        """Worker loop: run claimable jobs, then sleep until notified or polled"""
+        while not self._stopping:
+            try:
+                job_id = self._claim_admitted()
+            except Exception:
+                logger.exception("Failed to claim an analysis job")
+                job_id = None
+
+            if job_id is not None:
+                try:
+                    self._execute(job_id)
+                finally:
+                    if self.admission is not None:
+                        self.admission.release()
+                continue
+
+            with self._wakeup:
+                if not self._signals and not self._stopping:
+                    self._wakeup.wait(self.poll_interval)
+                self._signals = max(0, self._signals - 1)
+
+    def _claim_admitted(self) -> Optional[int]:
+        """Claim the next job this process has a slot for, cheap jobs first; the slot stays held"""
+        if self.admission is None:
+            return self.claim_next()
+        for expensive in (False, True):
+            with self.app.app_context():
+                if self._next_id(expensive) is None:
+                    continue
+            if not self.admission.try_acquire(expensive):
+                continue
+            try:
+                job_id = self.claim_next(expensive)
+            except Exception:
+                self.admission.release()
+                raise
+            if job_id is not None:
+                return job_id
+            self.admission.release()
+        return None
+
+    def _is_expensive(self, job: AnalysisJob) -> bool:
+        return self.large_job_bytes is not None and (job.upload_bytes or 0) > self.large_job_bytes
+
+    def _claimable(self, now: datetime, expensive: Optional[bool] = None):
+        """Queued jobs, and running jobs whose worker lost its lease (of one cost when expensive is set)"""
+        claimable = or_(
+            AnalysisJob.status == QUEUED,
+            and_(AnalysisJob.status == RUNNING, AnalysisJob.lease_expires_at < now)
+        )
+        if expensive is None or self.large_job_bytes is None:
+            return claimable
+        large = and_(AnalysisJob.upload_bytes.isnot(None), AnalysisJob.upload_bytes > self.large_job_bytes)
+        return and_(claimable, large if expensive else not_(large))
+
+    def _next_id(self, expensive: Optional[bool] = None) -> Optional[int]:
+        """Oldest claimable job"""
+        return db.session.query(AnalysisJob.id).filter(
+            self._claimable(datetime.utcnow(), expensive)
+        ).order_by(AnalysisJob.id).limit(1).scalar()
+
+    def _claim(self, job_id: int) -> bool:
+        """Atomically take a job; False if another worker got it first
+
+        A reclaimed job starts its progress over, as its stages run again.
+        """
+        now = datetime.utcnow()
+        claimed = AnalysisJob.query.filter(AnalysisJob.id == job_id, self._claimable(now)).update({
+            AnalysisJob.status: RUNNING,
+            AnalysisJob.progress: None,
+            AnalysisJob.attempts: AnalysisJob.attempts + 1,
+            AnalysisJob.started_at: now,
+            AnalysisJob.lease_expires_at: now + timedelta(seconds=self.lease_seconds)
+        }, synchronize_session=False)
+        db.session.commit()
+        return claimed == 1
+
+    def claim_next(self, expensive: Optional[bool] = None) -> Optional[int]:
+        """Claim the oldest claimable job (only cheap or only expensive ones when set), returning its id"""
+        with self.app.app_context():
+            while True:
+                job_id = self._next_id(expensive)
+                if job_id is None or self._claim(job_id):
+                    return job_id
+
+    def _execute(self, job_id: int):
+        """Run the handler for a claimed job, failing the job if it raises"""
+        with self.app.app_context():
+            job = db.session.get(AnalysisJob, job_id)
+            if job is None:
+                return
+            if job.attempts > MAX_ATTEMPTS:
+                self._fail(job_id, 'Analysis was interrupted too many times. Please try again.')
+                return
+
+            try:
+                self.handler(job)
+            except Exception as e:
+                logger.exception("Analysis job %s failed", job_id)
+                db.session.rollback()
+                self._fail(job_id, str(e))
+
+    def _fail(self, job_id: int, error: str):
+        """Record a job's final failure"""
+        job = db.session.get(AnalysisJob, job_id)
+        job.status = FAILED
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        job.lease_expires_at = None
+        db.session.commit()
@@ -0,0 +1,161 @@
+"""
+Versioned JSON API for internal tools.
+
+    POST /api/v1/analyses                    analyze resume/job pairs, streamed back as NDJSON
+    GET  /api/v1/analyses/<id>               a stored analysis
+    GET  /api/v1/analyses/<id>/action-plan   its stored action plan, with scheduled tasks
+
+A batch is a JSON array of pairs, an object {"pairs": [...], "include_plan": true},
+or NDJSON with one pair per line:
+
+    {"id": "learner-1", "resume_text": "...", "job_description": "...", "hours_per_week": 8}
+
+Each pair yields one line, in input order, as soon as it is analyzed (see
+cohort_batch.CohortWorker.process); a pair that fails yields {"id", "error"}
+without stopping the batch. Batches hold at most API_MAX_PAIRS pairs.
+
+Every request needs `Authorization: Bearer <API_TOKEN>`. Without API_TOKEN
+configured, the API answers 503 rather than run open.
+
+Pairs are analyzed one at a time in the request thread, each under one of the
+process's bounded admission slots (see admission.py), so a batch never fans
+out past them. A batch is refused with 503 and Retry-After while the process
+is saturated, and a pair that can't get a slot mid-stream yields
+{"id", "error", "retry_after"}.
+"""
+
+import hmac
+import json
+import os
+
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from werkzeug.exceptions import HTTPException
+
+from admission import Overloaded
+from models import db, Analysis, ActionPlan
+
+API_MAX_PAIRS = int(os.environ.get('API_MAX_PAIRS', 50))
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+api = Blueprint('api', __name__, url_prefix='/api/v1')
+
+
+class BatchError(ValueError):
+    """A batch request body that can't be processed"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _error(status: int, message: str):
+    """JSON error response"""
+    return jsonify({'error': message}), status
+
+
+@api.before_request
+def _require_token():
+    """Let through only requests bearing the configured API token"""
+    token = current_app.config.get('API_TOKEN')
+    if not token:
+        return _error(503, "API disabled: API_TOKEN is not configured")
+
+    scheme, _, supplied = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(supplied.strip().encode(), token.encode()):
+        response, status = _error(401, "Missing or invalid API token")
+        response.headers['WWW-Authenticate'] = 'Bearer'
+        return response, status
+
+
+@api.errorhandler(HTTPException)
+def _http_error(e):
+    """Answer API errors in JSON rather than HTML"""
+    return _error(e.code, e.description)
+
+
+def _read_batch():
+    """Pairs and options from the request body"""
+    body = request.get_data(as_text=True)
+    include_plan = True
+    try:
+        if request.mimetype == NDJSON_MIMETYPE:
+            pairs = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            payload = json.loads(body or 'null')
+            if isinstance(payload, dict):
+                include_plan = bool(payload.get('include_plan', True))
+                payload = payload.get('pairs')
+            pairs = payload
+    except json.JSONDecodeError as e:
+        raise BatchError(f"Invalid JSON: {e}") from e
+
+    if not isinstance(pairs, list) or not all(isinstance(pair, dict) for pair in pairs):
+        raise BatchError("Expected a list of resume/job pair objects")
+    if not pairs:
+        raise BatchError("No pairs submitted")
+    if len(pairs) > API_MAX_PAIRS:
+        raise BatchError(f"At most {API_MAX_PAIRS} pairs per request", 413)
+    return pairs, include_plan
+
+
+@api.route('/analyses', methods=['POST'])
+def analyze_batch():
+    """Analyze resume/job pairs and stream one NDJSON result per pair"""
+    try:
+        pairs, include_plan = _read_batch()
+    except BatchError as e:
+        return _error(e.status, str(e))
+
+    # Text-only pairs are cheap work
+    admission = current_app.extensions['admission']
+    if admission.saturated():
+        response, status = _error(503, str(Overloaded(admission.retry_after)))
+        response.headers['Retry-After'] = str(admission.retry_after)
+        return response, status
+
+    worker = current_app.extensions['cohort_worker']
+
+    def results():
+        for index, pair in enumerate(pairs):
+            try:
+                # A slot per pair, so nothing is held between lines or after the client leaves
+                with admission.admit():
+                    result = worker.process(index, pair, allow_paths=False, include_plan=include_plan)
+            except Overloaded as e:
+                result = {'id': pair.get('id', index), 'error': str(e), 'retry_after': e.retry_after}
+            yield json.dumps(result) + '\n'
+
+    return Response(stream_with_context(results()), mimetype=NDJSON_MIMETYPE)
+
+
+@api.route('/analyses/<int:analysis_id>')
+def get_analysis(analysis_id):
+    """A stored analysis"""
+    analysis = db.get_or_404(Analysis, analysis_id)
+    return jsonify({
+        'id': analysis.id,
+        'readiness_score': analysis.readiness_score,
+        'extracted_skills': analysis.extracted_skills or [],
+        'required_skills': analysis.required_skills or [],
+        'skill_gaps': analysis.skill_gaps or [],
+        'created_at': analysis.created_at.isoformat() if analysis.created_at else None
+    })
+
+
+@api.route('/analyses/<int:analysis_id>/action-plan')
+def get_action_plan(analysis_id):
+    """A stored action plan with its tasks resolved and scheduled"""
+    action_plan = ActionPlan.query.filter_by(analysis_id=analysis_id).first()
+    if action_plan is None:
+        return _error(404, f"No action plan for analysis {analysis_id}")
+
+    generator = current_app.extensions['cohort_worker'].action_plan_generator
+    return jsonify({
+        'analysis_id': analysis_id,
+        'hours_per_week': action_plan.hours_per_week,
+        'updated_readiness_score': action_plan.updated_readiness_score,
+        'completed_tasks': action_plan.completed_tasks or [],
+        'tasks': generator.hydrate_tasks(action_plan.tasks, action_plan.completed_tasks, action_plan.hours_per_week),
+        'created_at': action_plan.created_at.isoformat() if action_plan.created_at else None
+    })
@@ -1,11 +1,39 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import (Flask, Response, abort, render_template, request, redirect, url_for, flash, jsonify, make_response,
+                   session, stream_with_context)
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from werkzeug.utils import secure_filename
+import click
+import logging
 import os
+import time
+import uuid
 from datetime import datetime
-from models import db, Analysis, ActionPlan
+from models import db, Analysis, ActionPlan, AnalysisJob, upgrade_schema
+from admission import AdmissionController, Overloaded
+from analysis_jobs import AnalysisJobQueue, complete_job, DEFAULT_WORKERS as DEFAULT_JOB_WORKERS, DONE, FAILED, QUEUED
 from text_processor import TextProcessor
 from gap_analyzer import GapAnalyzer
 from action_plan_generator import ActionPlanGenerator
+from api import api
+from assets import asset_bundled, asset_url, assets
+from cohort_batch import CohortWorker
+from metrics import (CONTENT_TYPE as METRICS_CONTENT_TYPE, UPLOAD_PAGES, UPLOAD_SIZE, instrument_app,
+                     register_cache, render_metrics)
+from page_cache import PageCache, make_etag, not_modified, with_validators
+from pipeline_timing import span, start_trace
+from plan_diff import PlanDiff
+from plan_prefetch import SingleFlightPrefetcher
+from plan_scheduler import DEFAULT_HOURS_PER_WEEK, format_weeks, weeks_needed
+from progress import (EVENT_STREAM_MIMETYPE, KEEPALIVE_SECONDS, POLL_INTERVAL as PROGRESS_POLL_INTERVAL,
+                      STREAM_SECONDS, ProgressBroker, format_event)
+from warmup import Warmup
+
+# Level-gated logging (LOG_LEVEL=DEBUG shows per-request plan details)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+                    format='%(asctime)s %(levelname)s %(name)s %(message)s')
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
@@ -15,18 +43,58 @@ app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:/
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['API_TOKEN'] = os.environ.get('API_TOKEN')  # Bearer token for /api/v1
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 
+# Seconds a request waits for an in-flight background plan
+PLAN_WAIT_TIMEOUT = 30
+
+# Accepted weekly study budget range (hours)
+MIN_HOURS_PER_WEEK, MAX_HOURS_PER_WEEK = 1, 80
+
+# Uploads larger than this (bytes) count as expensive for admission control
+LARGE_UPLOAD_BYTES = int(os.environ.get('LARGE_UPLOAD_BYTES', 1_000_000))
+
+# Queued analysis jobs beyond which uploads are refused (large ones at half)
+MAX_PENDING_JOBS = int(os.environ.get('MAX_PENDING_JOBS', 20))
+
 # Initialize database
 db.init_app(app)
 
 # Initialize gap analyzer
 gap_analyzer = GapAnalyzer()
 
-# Initialize action plan generator
-action_plan_generator = ActionPlanGenerator()
+# Initialize action plan generator, scoring tasks with the same analyzer
+action_plan_generator = ActionPlanGenerator(gap_analyzer=gap_analyzer)
+
+# Rendered analysis and action plan pages
+page_cache = PageCache()
+
+# Request, upload, cache and query metrics served at /metrics
+instrument_app(app)
+register_cache('plan_template', lambda: (action_plan_generator.cache_hits, action_plan_generator.cache_misses))
+register_cache('rendered_page', lambda: (page_cache.hits, page_cache.misses))
+
+# Readiness thresholds shared with the templates
+app.jinja_env.globals['readiness_band'] = gap_analyzer.scoring_model.readiness_band
+
+# JSON API, sharing the app's analyzer and plan generator
+app.extensions['cohort_worker'] = CohortWorker(gap_analyzer=gap_analyzer, action_plan_generator=action_plan_generator)
+
+# Background analysis threads per process
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', DEFAULT_JOB_WORKERS))
+
+# Bounds the extraction and analysis running in this process (see admission.py).
+# One slot per job worker, so large PDFs hold at most ANALYSIS_WORKERS - 1 of them.
+admission = AdmissionController(slots=int(os.environ.get('ADMISSION_SLOTS', ANALYSIS_WORKERS)))
+app.extensions['admission'] = admission
+app.register_blueprint(api)
+
+# Fingerprinted static assets (see build_assets.py)
+app.register_blueprint(assets)
+app.jinja_env.globals.update(asset_url=asset_url, asset_bundled=asset_bundled)
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
@@ -42,106 +110,365 @@ def home():
 def upload():
     """Handle resume and job description upload"""
     if request.method == 'POST':
-        resume_text = ""
-        job_description = ""
-        
-        # Handle resume upload
-        if 'resume_file' in request.files:
-            resume_file = request.files['resume_file']
-            if resume_file and resume_file.filename != '':
-                if allowed_file(resume_file.filename):
-                    try:
-                        filename = secure_filename(resume_file.filename)
-                        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                        
-                        # Ensure uploads directory exists
-                        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                        
-                        resume_file.save(file_path)
-                        
-                        try:
-                            resume_text = TextProcessor.extract_text_from_file(file_path)
-                            resume_text = TextProcessor.clean_text(resume_text)
-                        except Exception as e:
-                            flash(f'Error processing resume: {str(e)}', 'error')
-                            return redirect(request.url)
-                        finally:
-                            # Clean up uploaded file
-                            if os.path.exists(file_path):
-                                os.remove(file_path)
-                    except Exception as e:
-                        flash(f'Error saving file: {str(e)}', 'error')
-                        return redirect(request.url)
-                else:
-                    flash('Invalid file type for resume. Please upload PDF or DOCX only.', 'error')
-                    return redirect(request.url)
-        
-
-        
-        # Handle job description
-        if request.form.get('job_description'):
-            job_description = TextProcessor.clean_text(request.form.get('job_description'))
-        
-        if not resume_text:
-            flash('Please upload a resume file.', 'error')
-            return redirect(request.url)
-        
-        if not job_description:
-            flash('Please provide a job description.', 'error')
-            return redirect(request.url)
-        
-        # Perform skill analysis
-        analysis_result = gap_analyzer.analyze_skills(resume_text, job_description)
-        
-        # Create analysis record
-        analysis = Analysis(
-            resume_text=resume_text,
-            job_description=job_description,
-            extracted_skills=analysis_result['extracted_skills'],
-            required_skills=analysis_result['required_skills'],
-            skill_gaps=analysis_result['skill_gaps'],
-            readiness_score=analysis_result['readiness_score']
-        )
-        db.session.add(analysis)
-        db.session.commit()
-        
-        return redirect(url_for('analysis', analysis_id=analysis.id))
+        try:
+            _admit_upload()
+        except Overloaded as e:
+            flash('We are processing a lot of resumes right now. Please try again in a few seconds.', 'error')
+            return _overloaded(render_template('upload.html'), e)
+        with start_trace() as trace:
+            return _handle_upload(trace)
     
     return render_template('upload.html')
 
+def _admit_upload():
+    """Refuse an upload, before reading its body, while the analysis backlog is full
+    
+    Large uploads (mostly long PDFs) are refused once the backlog is half full,
+    keeping room for cheaper submissions.
+    """
+    expensive = (request.content_length or 0) > LARGE_UPLOAD_BYTES
+    limit = MAX_PENDING_JOBS // 2 if expensive else MAX_PENDING_JOBS
+    if analysis_queue.pending() >= limit:
+        admission.reject()
+
+def _overloaded(body, error):
+    """503 response telling the client when to retry"""
+    response = make_response(body, 503)
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def _handle_upload(trace):
+    """Validate and save a submitted resume and job description, then queue its analysis"""
+    resume_file = request.files.get('resume_file')
+    if not resume_file or resume_file.filename == '':
+        flash('Please upload a resume file.', 'error')
+        return redirect(request.url)
+    
+    if not allowed_file(resume_file.filename):
+        flash('Invalid file type for resume. Please upload PDF or DOCX only.', 'error')
+        return redirect(request.url)
+    
+    job_description = request.form.get('job_description', '')
+    if not job_description.strip():
+        flash('Please provide a job description.', 'error')
+        return redirect(request.url)
+    
+    # Unique name so concurrent uploads of e.g. resume.pdf don't overwrite each other
+    filename = f"{uuid.uuid4().hex}_{secure_filename(resume_file.filename)}"
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    try:
+        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+        with span('upload.save_file'):
+            resume_file.save(file_path)
+        UPLOAD_SIZE.observe(os.path.getsize(file_path), file_path.rsplit('.', 1)[1].lower())
+    except Exception as e:
+        flash(f'Error saving file: {str(e)}', 'error')
+        return redirect(request.url)
+    
+    # Extraction and analysis run on a background worker
+    job = analysis_queue.enqueue(resume_path=file_path, upload_bytes=os.path.getsize(file_path),
+                                 job_description=job_description, stage_timings=trace.breakdown())
+    
+    if job.status == DONE:
+        return redirect(url_for('analysis', analysis_id=job.analysis_id))
+    return redirect(url_for('analysis_job', job_id=job.id))
+
+# Wakes /jobs/<id>/events streams as stages finish
+progress_broker = ProgressBroker()
+
+def _record_progress(job, stage, details):
+    """Store a finished pipeline stage and wake the job's progress streams"""
+    job.progress = (job.progress or []) + [dict(details, stage=stage)]
+    db.session.commit()
+    progress_broker.notify(job.id)
+
+def _run_analysis_job(job):
+    """Extract and analyze a queued upload, storing its Analysis
+    
+    The queue claims the job only once it holds the admission slot to run it.
+    The job's progress counter is dropped after its last notification: when it
+    fails, once it is stored without gaps, or once its plan is prefetched.
+    """
+    job_id = job.id
+    try:
+        analysis = _analyze_job(job)
+    except Exception:
+        progress_broker.forget(job_id)
+        raise
+    
+    # Generate the action plan in the background before it is first opened
+    if analysis.skill_gaps:
+        plan_prefetcher.submit(analysis.id).add_done_callback(lambda _: _finish_progress(job_id))
+    else:
+        progress_broker.forget(job_id)
+
+def _finish_progress(job_id):
+    """Wake a job's progress streams one last time and drop its counter"""
+    progress_broker.notify(job_id)
+    progress_broker.forget(job_id)
+
+def _analyze_job(job):
+    """Run the analysis pipeline for a job and store the Analysis it produces"""
+    try:
+        with start_trace() as trace:
+            try:
+                with span('upload.extract_text'):
+                    resume_text, pages = TextProcessor.extract_text_and_pages(job.resume_path)
+                if pages is not None:
+                    UPLOAD_PAGES.observe(pages)
+                    _record_progress(job, 'pages_extracted', {'pages': pages})
+                with span('upload.clean_text'):
+                    resume_text = TextProcessor.clean_text(resume_text)
+                    job_description = TextProcessor.clean_text(job.job_description)
+            except Exception as e:
+                raise ValueError(f'Error processing resume: {str(e)}') from e
+            
+            if not resume_text:
+                raise ValueError('No text could be extracted from the resume. Please upload a different file.')
+            if not job_description:
+                raise ValueError('Please provide a job description.')
+            
+            # Perform skill analysis
+            analysis_result = gap_analyzer.analyze_skills(
+                resume_text, job_description,
+                on_stage=lambda stage, details: _record_progress(job, stage, details)
+            )
+    finally:
+        # Clean up uploaded file
+        if os.path.exists(job.resume_path):
+            os.remove(job.resume_path)
+    
+    # Request-side stages (saving the upload) plus the worker's stages
+    stage_timings = {stage: ms for stage, ms in (job.stage_timings or {}).items() if stage != 'total'}
+    stage_timings.update(trace.breakdown())
+    stage_timings['total'] = round(sum(ms for stage, ms in stage_timings.items() if stage != 'total'), 2)
+    
+    # Create analysis record
+    analysis = Analysis(
+        resume_text=resume_text,
+        job_description=job_description,
+        extracted_skills=analysis_result['extracted_skills'],
+        required_skills=analysis_result['required_skills'],
+        skill_gaps=analysis_result['skill_gaps'],
+        readiness_score=analysis_result['readiness_score'],
+        stage_timings=stage_timings
+    )
+    db.session.add(analysis)
+    db.session.flush()
+    complete_job(job, analysis.id)
+    with span('upload.db_commit'):
+        db.session.commit()
+    progress_broker.notify(job.id)
+    return analysis
+
+# Background analysis of uploads
+analysis_queue = AnalysisJobQueue(app, _run_analysis_job,
+                                  workers=ANALYSIS_WORKERS,
+                                  eager=os.environ.get('ANALYSIS_JOBS') == 'inline',
+                                  admission=admission, large_job_bytes=LARGE_UPLOAD_BYTES)
+
+@app.before_request
+def _start_analysis_workers():
+    """Start this process's analysis workers, recovering jobs left by a restart"""
+    analysis_queue.start()
+
+@app.route('/jobs/<int:job_id>')
+def analysis_job(job_id):
+    """Progress page for a queued analysis"""
+    job = AnalysisJob.query.get_or_404(job_id)
+    if job.status == DONE:
+        return redirect(url_for('analysis', analysis_id=job.analysis_id))
+    return render_template('job.html', job=job)
+
+@app.route('/jobs/<int:job_id>/status')
+def analysis_job_status(job_id):
+    """JSON status of a queued analysis, polled by the progress page"""
+    job = AnalysisJob.query.get_or_404(job_id)
+    status = {'id': job.id, 'status': job.status}
+    if job.status == DONE:
+        status['analysis_url'] = url_for('analysis', analysis_id=job.analysis_id)
+    elif job.status == FAILED:
+        status['error'] = job.error
+    elif job.status == QUEUED:
+        status['position'] = AnalysisJob.query.filter(AnalysisJob.status == QUEUED, AnalysisJob.id < job.id).count()
+    return jsonify(status)
+
+@app.route('/jobs/<int:job_id>/events')
+def analysis_job_events(job_id):
+    """Server-sent progress events for a queued analysis (see progress.py)"""
+    db.get_or_404(AnalysisJob, job_id)
+    last_event_id = request.headers.get('Last-Event-ID', -1, type=int)
+    response = Response(stream_with_context(_progress_events(job_id, last_event_id)),
+                        mimetype=EVENT_STREAM_MIMETYPE)
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop proxies from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def _job_events(job):
+    """Progress events of a job so far, in order; the last is done or failed once it has finished"""
+    events = [(stage['stage'], {key: value for key, value in stage.items() if key != 'stage'})
+              for stage in job.progress or []]
+    if job.status == FAILED:
+        events.append(('failed', {'error': job.error}))
+    elif job.status == DONE:
+        gaps = next((data['gaps'] for event, data in events if event == 'gaps_computed'), 0)
+        plan_stored = db.session.query(ActionPlan.id).filter_by(analysis_id=job.analysis_id).first() is not None
+        if plan_stored:
+            events.append(('plan_ready', {'action_plan_url': url_for('action_plan', analysis_id=job.analysis_id)}))
+        waited = (datetime.utcnow() - job.finished_at).total_seconds() if job.finished_at else 0
+        # Open the analysis once its plan is stored, or when no plan is coming
+        if plan_stored or not gaps or waited > PLAN_WAIT_TIMEOUT:
+            events.append(('done', {'analysis_url': url_for('analysis', analysis_id=job.analysis_id)}))
+    return events
+
+def _progress_events(job_id, last_event_id):
+    """Send a job's progress events until it finishes or the stream times out"""
+    if not progress_broker.open_stream():
+        yield format_event('unavailable', {'status_url': url_for('analysis_job_status', job_id=job_id)})
+        return
+    try:
+        deadline = time.monotonic() + STREAM_SECONDS
+        last_sent = time.monotonic()
+        while True:
+            version = progress_broker.version(job_id)
+            events = _job_events(db.session.get(AnalysisJob, job_id))
+            # Don't hold a pooled connection while waiting
+            db.session.close()
+            
+            for event_id, (event, data) in enumerate(events):
+                if event_id > last_event_id:
+                    yield format_event(event, data, event_id)
+                    last_event_id = event_id
+                    last_sent = time.monotonic()
+            if events and events[-1][0] in ('done', 'failed'):
+                return
+            
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            if now - last_sent >= KEEPALIVE_SECONDS:
+                yield ': keep-alive\n\n'
+                last_sent = now
+            progress_broker.wait(job_id, version, min(PROGRESS_POLL_INTERVAL, deadline - now))
+    finally:
+        progress_broker.close_stream()
+
 @app.route('/analysis/<int:analysis_id>')
 def analysis(analysis_id):
     """Display skill gap analysis"""
-    analysis = Analysis.query.get_or_404(analysis_id)
-    return render_template('analysis.html', analysis=analysis)
+    # Only the score of a stored analysis can change (rescore-analyses)
+    version = db.session.query(Analysis.readiness_score).filter_by(id=analysis_id).first()
+    if version is None:
+        abort(404)
+    etag = make_etag('analysis', analysis_id, version.readiness_score)
+    response = _not_modified(etag)
+    if response is not None:
+        return response
+    
+    def render():
+        return render_template('analysis.html', analysis=db.session.get(Analysis, analysis_id))
+    return _cached_page(analysis_id, etag, render)
 
 @app.route('/action-plan/<int:analysis_id>')
 def action_plan(analysis_id):
     """Display personalized action plan"""
-    analysis = Analysis.query.get_or_404(analysis_id)
     action_plan = ActionPlan.query.filter_by(analysis_id=analysis_id).first()
     
-    # Debug: Print action plan state
     if action_plan:
-        print(f"Action Plan Debug - ID: {action_plan.id}")
-        print(f"  Tasks: {len(action_plan.tasks) if action_plan.tasks else 0}")
-        print(f"  Completed Tasks: {action_plan.completed_tasks}")
-        print(f"  Completed Tasks Type: {type(action_plan.completed_tasks)}")
-        print(f"  Completed Tasks Length: {len(action_plan.completed_tasks) if action_plan.completed_tasks else 0}")
-    
-    # Generate action plan if it doesn't exist
-    if not action_plan and analysis.skill_gaps:
-        action_plan_data = action_plan_generator.generate_action_plan(analysis_id, analysis.skill_gaps)
+        # Answer revalidations and cached renders without loading the analysis
+        etag = _plan_etag(action_plan)
+        response = _not_modified(etag)
+        if response is not None:
+            return response
+        return _cached_page(analysis_id, etag,
+                            lambda: _render_action_plan(Analysis.query.get_or_404(analysis_id), action_plan))
+    
+    analysis = Analysis.query.get_or_404(analysis_id)
+    
+    # Generate action plan if it doesn't exist yet, joining the background
+    # generation started at upload rather than running a duplicate
+    if analysis.skill_gaps:
+        action_plan = _store_action_plan(analysis_id)
+    
+    return _render_action_plan(analysis, action_plan)
+
+def _render_action_plan(analysis, action_plan):
+    """Render the action plan page"""
+    if action_plan:
+        logger.debug("Rendering action plan id=%s analysis_id=%s tasks=%d completed=%d", action_plan.id,
+                     action_plan.analysis_id, len(action_plan.tasks or []), len(action_plan.completed_tasks or []))
+    
+    # Resolve stored task references against the catalog and schedule them
+    tasks = []
+    if action_plan:
+        tasks = action_plan_generator.hydrate_tasks(action_plan.tasks, action_plan.completed_tasks,
+                                                    action_plan.hours_per_week)
+    
+    return render_template('action_plan.html', analysis=analysis, action_plan=action_plan, tasks=tasks,
+                           plan_timeline=_remaining_timeline(tasks, action_plan))
+
+def _plan_etag(action_plan):
+    """Validator for an action plan page: the plan's version and what its tasks resolve against"""
+    return make_etag('action-plan', action_plan.analysis_id, action_plan.version_id,
+                     action_plan_generator.catalog.version, action_plan_generator.link_health.version)
+
+def _not_modified(etag):
+    """304 response when the client's copy of a page is current"""
+    if '_flashes' in session:
+        return None
+    return not_modified(etag)
+
+def _cached_page(analysis_id, etag, render):
+    """Serve a page from the page cache, with validators"""
+    if '_flashes' in session:
+        # Flash messages are shown once, so this render can't be reused
+        return render()
+    html = page_cache.get_or_render(analysis_id, etag, render)
+    return with_validators(make_response(html), etag)
+
+def _ensure_action_plan(analysis_id):
+    """Generate and store the action plan for an analysis unless it already has one"""
+    with app.app_context():
+        if ActionPlan.query.filter_by(analysis_id=analysis_id).first():
+            return
+        analysis = db.session.get(Analysis, analysis_id)
+        if not analysis or not analysis.skill_gaps:
+            return
+        
+        with span('plan.generate'):
+            action_plan_data = _generate_plan_data(analysis)
         action_plan = ActionPlan(
             analysis_id=analysis_id,
-            tasks=action_plan_data['tasks'],
+            tasks=action_plan_generator.compact_tasks(action_plan_data['tasks']),
             completed_tasks=action_plan_data['completed_tasks'],
-            updated_readiness_score=action_plan_data['updated_readiness_score']
+            updated_readiness_score=analysis.readiness_score
         )
-        db.session.add(action_plan)
-        db.session.commit()
-    
-    return render_template('action_plan.html', analysis=analysis, action_plan=action_plan)
+        with span('plan.db_commit'):
+            db.session.add(action_plan)
+            try:
+                db.session.commit()
+            except IntegrityError:
+                # Another process stored this analysis's plan first; keep theirs
+                db.session.rollback()
+
+def _store_action_plan(analysis_id):
+    """Create an analysis's plan unless it has one, joining any generation already in flight"""
+    try:
+        plan_prefetcher.submit(analysis_id).result(timeout=PLAN_WAIT_TIMEOUT)
+    except Exception as e:
+        logger.warning("Background action plan generation failed analysis_id=%s error=%s", analysis_id, e)
+        _ensure_action_plan(analysis_id)
+    return ActionPlan.query.filter_by(analysis_id=analysis_id).first()
+
+def _generate_plan_data(analysis, hours_per_week=DEFAULT_HOURS_PER_WEEK):
+    """Generate an analysis's plan with each task's readiness score gain"""
+    score_deltas = gap_analyzer.scoring_model.skill_deltas(analysis.extracted_skills or [],
+                                                           analysis.required_skills or [])
+    return action_plan_generator.generate_action_plan(analysis.id, analysis.skill_gaps, hours_per_week, score_deltas)
+
+# Speculative plan generation, at most one in flight per analysis
+plan_prefetcher = SingleFlightPrefetcher(_ensure_action_plan, eager=os.environ.get('PLAN_PREFETCH') == 'inline')
 
 @app.route('/generate-action-plan/<int:analysis_id>')
 def generate_action_plan(analysis_id):
@@ -152,31 +479,55 @@ def generate_action_plan(analysis_id):
         flash('No skill gaps found to generate action plan.', 'error')
         return redirect(url_for('analysis', analysis_id=analysis_id))
     
-    # Generate action plan
-    action_plan_data = action_plan_generator.generate_action_plan(analysis_id, analysis.skill_gaps)
-    
     # Check if action plan already exists
     existing_plan = ActionPlan.query.filter_by(analysis_id=analysis_id).first()
-    if existing_plan:
-        # Update existing plan - preserve completed tasks
-        existing_plan.tasks = action_plan_data['tasks']
-        # Don't overwrite completed_tasks - preserve user progress
-        # existing_plan.completed_tasks = action_plan_data['completed_tasks']
-        existing_plan.updated_readiness_score = action_plan_data['updated_readiness_score']
-    else:
-        # Create new plan
-        action_plan = ActionPlan(
-            analysis_id=analysis_id,
-            tasks=action_plan_data['tasks'],
-            completed_tasks=action_plan_data['completed_tasks'],
-            updated_readiness_score=action_plan_data['updated_readiness_score']
-        )
-        db.session.add(action_plan)
+    if not existing_plan:
+        # Create it through the single-flight generator, so a click during the
+        # background generation started at upload doesn't store a second plan
+        _store_action_plan(analysis_id)
+        flash('Action plan generated successfully!', 'success')
+        return redirect(url_for('action_plan', analysis_id=analysis_id))
     
-    db.session.commit()
-    flash('Action plan generated successfully!', 'success')
+    # Regenerate the plan
+    with span('plan.generate'):
+        action_plan_data = _generate_plan_data(analysis, existing_plan.hours_per_week or DEFAULT_HOURS_PER_WEEK)
+    
+    # Write only what changed; keep progress on tasks that survive
+    new_tasks = action_plan_generator.compact_tasks(action_plan_data['tasks'])
+    plan_diff = PlanDiff(existing_plan.tasks, new_tasks)
+    if plan_diff.is_empty:
+        flash('Action plan is already up to date.', 'info')
+        return redirect(url_for('action_plan', analysis_id=analysis_id))
+    
+    existing_plan.tasks = new_tasks
+    completed = plan_diff.prune_completed(existing_plan.completed_tasks)
+    if completed != (existing_plan.completed_tasks or []):
+        existing_plan.completed_tasks = completed
+    updated_score = _progress_score(existing_plan, analysis)
+    if updated_score != existing_plan.updated_readiness_score:
+        existing_plan.updated_readiness_score = updated_score
+    
+    with span('plan.db_commit'):
+        committed = _commit_plan()
+    if not committed:
+        flash(PLAN_CONFLICT_MESSAGE, 'error')
+        return redirect(url_for('action_plan', analysis_id=analysis_id))
+    page_cache.invalidate(analysis_id)
+    flash(f'Action plan updated: {plan_diff.summary()}.', 'success')
     return redirect(url_for('action_plan', analysis_id=analysis_id))
 
+PLAN_CONFLICT_MESSAGE = 'The plan changed in another window. Please reload and try again.'
+
+def _commit_plan():
+    """Commit a plan change; False (rolled back) if another request changed the plan first"""
+    try:
+        db.session.commit()
+    except StaleDataError:
+        # ActionPlan.version_id no longer matched: the other write wins
+        db.session.rollback()
+        return False
+    return True
+
 @app.route('/complete-task/<int:analysis_id>/<task_id>', methods=['POST'])
 def complete_task(analysis_id, task_id):
     """Mark a task as complete and update progress"""
@@ -186,53 +537,224 @@ def complete_task(analysis_id, task_id):
         flash('Action plan not found.', 'error')
         return redirect(url_for('action_plan', analysis_id=analysis_id))
     
-    # Initialize completed_tasks if None
-    if action_plan.completed_tasks is None:
-        action_plan.completed_tasks = []
-    
-    # Toggle task completion - create new list to ensure SQLAlchemy detects the change
-    current_completed = list(action_plan.completed_tasks) if action_plan.completed_tasks else []
+    completing = task_id not in (action_plan.completed_tasks or [])
+    _apply_task_changes(action_plan, {task_id: completing})
+    if not _commit_plan():
+        flash(PLAN_CONFLICT_MESSAGE, 'error')
+        return redirect(url_for('action_plan', analysis_id=analysis_id))
+    page_cache.invalidate(analysis_id)
     
-    if task_id in current_completed:
-        current_completed.remove(task_id)
-        action_plan.completed_tasks = current_completed
-        flash('Task marked as incomplete.', 'info')
-    else:
-        current_completed.append(task_id)
-        action_plan.completed_tasks = current_completed
+    if completing:
         flash('Task marked as complete!', 'success')
+    else:
+        flash('Task marked as incomplete.', 'info')
     
-    # Update readiness score based on completed tasks
-    if action_plan.completed_tasks:
-        # Calculate new readiness score
-        total_tasks = len(action_plan.tasks) if action_plan.tasks else 1
-        completed_count = len(action_plan.completed_tasks)
-        progress_percentage = (completed_count / total_tasks) * 100
-        
-        # Get original analysis
-        analysis = Analysis.query.get(analysis_id)
-        if analysis:
-            # Increase readiness score based on progress
-            original_score = analysis.readiness_score or 0
-            max_improvement = 100 - original_score
-            improvement = (progress_percentage / 100) * max_improvement
-            action_plan.updated_readiness_score = min(100, original_score + improvement)
+    logger.debug("Toggled task analysis_id=%s task_id=%s completed=%s completed_count=%d", analysis_id, task_id,
+                 completing, len(action_plan.completed_tasks))
     
-    db.session.commit()
+    return redirect(url_for('action_plan', analysis_id=analysis_id))
+
+@app.route('/action-plan/<int:analysis_id>/tasks', methods=['POST'])
+def update_tasks(analysis_id):
+    """Complete or reopen several tasks at once, answering in JSON.
+    
+    Takes {"tasks": {"<task id>": true | false, ...}} and returns the new
+    completion set, projected score and schedule for the page to update in place.
+    """
+    action_plan = ActionPlan.query.filter_by(analysis_id=analysis_id).first()
+    if not action_plan:
+        return jsonify({'error': 'Action plan not found.'}), 404
+    
+    payload = request.get_json(silent=True) or {}
+    changes = payload.get('tasks')
+    if not isinstance(changes, dict) or not changes or not all(isinstance(done, bool) for done in changes.values()):
+        return jsonify({'error': 'Expected {"tasks": {"<task id>": true | false}}.'}), 400
     
-    # Debug: Print what was saved
-    print(f"After commit - Task {task_id} completion toggled")
-    print(f"  Completed tasks in DB: {action_plan.completed_tasks}")
-    print(f"  Completed tasks count: {len(action_plan.completed_tasks) if action_plan.completed_tasks else 0}")
+    task_ids = {task['id'] for task in action_plan.tasks or []}
+    unknown = sorted(task_id for task_id in changes if task_id not in task_ids)
+    if unknown:
+        return jsonify({'error': f"Unknown tasks: {', '.join(unknown)}"}), 400
+    
+    if _apply_task_changes(action_plan, changes):
+        if not _commit_plan():
+            return jsonify({'error': PLAN_CONFLICT_MESSAGE}), 409
+        page_cache.invalidate(analysis_id)
+    
+    logger.debug("Updated tasks analysis_id=%s changes=%d completed_count=%d", analysis_id, len(changes),
+                 len(action_plan.completed_tasks or []))
+    
+    tasks = action_plan_generator.hydrate_tasks(action_plan.tasks, action_plan.completed_tasks,
+                                                action_plan.hours_per_week)
+    return jsonify({
+        'completed_tasks': action_plan.completed_tasks or [],
+        'total_tasks': len(tasks),
+        'updated_readiness_score': action_plan.updated_readiness_score,
+        'timelines': {task['id']: task['timeline'] for task in tasks},
+        'plan_timeline': _remaining_timeline(tasks, action_plan)
+    })
+
+def _apply_task_changes(action_plan, changes):
+    """Set tasks complete (True) or open (False) and update the projected score.
     
+    Returns whether anything changed.
+    """
+    # Create a new list so SQLAlchemy detects the change
+    completed = list(action_plan.completed_tasks or [])
+    changed = False
+    
+    for task_id, done in changes.items():
+        if (task_id in completed) == done:
+            continue
+        changed = True
+        if done:
+            completed.append(task_id)
+        else:
+            completed.remove(task_id)
+    
+    if not changed:
+        return False
+    
+    # Load the analysis before touching the plan, so autoflush doesn't write it twice
+    analysis = db.session.get(Analysis, action_plan.analysis_id)
+    action_plan.completed_tasks = completed
+    if analysis:
+        action_plan.updated_readiness_score = _progress_score(action_plan, analysis)
+    return True
+
+@app.route('/action-plan/<int:analysis_id>/hours-per-week', methods=['POST'])
+def update_hours_per_week(analysis_id):
+    """Change the weekly study budget and reschedule the plan"""
+    action_plan = ActionPlan.query.filter_by(analysis_id=analysis_id).first_or_404()
+    
+    try:
+        hours_per_week = int(request.form.get('hours_per_week', ''))
+    except ValueError:
+        hours_per_week = 0
+    if not MIN_HOURS_PER_WEEK <= hours_per_week <= MAX_HOURS_PER_WEEK:
+        flash(f'Please enter between {MIN_HOURS_PER_WEEK} and {MAX_HOURS_PER_WEEK} hours per week.', 'error')
+        return redirect(url_for('action_plan', analysis_id=analysis_id))
+    
+    action_plan.hours_per_week = hours_per_week
+    if not _commit_plan():
+        flash(PLAN_CONFLICT_MESSAGE, 'error')
+        return redirect(url_for('action_plan', analysis_id=analysis_id))
+    page_cache.invalidate(analysis_id)
+    
+    flash(f'Plan rescheduled for {hours_per_week} hours per week.', 'success')
     return redirect(url_for('action_plan', analysis_id=analysis_id))
 
-# Create uploads directory if it doesn't exist (for both local and production)
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+def _progress_score(action_plan, analysis):
+    """Projected readiness score once the plan's completed tasks are done.
+    
+    Rescores the resume with each completed task's skill at its target level,
+    so related requirements gain credit too (summing per-task score_delta
+    would not count that).
+    """
+    completed = set(action_plan.completed_tasks or [])
+    if analysis.required_skills:
+        acquired = [{'name': task['skill'], 'level': task.get('target_level') or 'basic'}
+                    for task in action_plan.tasks or [] if task['id'] in completed]
+        if not acquired:
+            return analysis.readiness_score
+        return gap_analyzer.scoring_model.score_with_skills(analysis.extracted_skills or [],
+                                                            analysis.required_skills, acquired)
+    
+    # Analyses stored without their skills: interpolate on the completed count
+    if not action_plan.completed_tasks:
+        return None
+    
+    # Calculate new readiness score
+    total_tasks = len(action_plan.tasks) if action_plan.tasks else 1
+    completed_count = len(action_plan.completed_tasks)
+    progress_percentage = (completed_count / total_tasks) * 100
+    
+    # Increase readiness score based on progress
+    original_score = analysis.readiness_score or 0
+    max_improvement = 100 - original_score
+    improvement = (progress_percentage / 100) * max_improvement
+    return min(100, original_score + improvement)
+
+def _remaining_timeline(tasks, action_plan):
+    """Time needed for the plan's open tasks at its weekly budget"""
+    if not tasks:
+        return None
+    remaining_hours = sum(task.get('estimated_hours') or 0 for task in tasks if not task['completed'])
+    if not remaining_hours:
+        return 'Done'
+    return format_weeks(weeks_needed(remaining_hours, action_plan.hours_per_week or DEFAULT_HOURS_PER_WEEK))
 
-# Initialize database tables (for both local and production)
-with app.app_context():
-    db.create_all()
+# Times a rescore batch is redone when learners keep changing its plans
+RESCORE_CONFLICT_RETRIES = 3
+
+@app.cli.command('rescore-analyses')
+@click.option('--batch-size', default=1000, show_default=True, help='Analyses scored per vectorized pass')
+def rescore_analyses(batch_size):
+    """Recompute stored readiness scores and plan score gains after the scoring model changes"""
+    # `flask --app app` skips wsgi.py, so make sure the tables exist and are current
+    create_app()
+    scoring_model = gap_analyzer.scoring_model
+    updated = 0
+    updated_plans = 0
+    last_id = 0
+    conflicts = 0
+    
+    while True:
+        batch = Analysis.query.filter(Analysis.id > last_id).order_by(Analysis.id).limit(batch_size).all()
+        if not batch:
+            break
+        
+        batch_updated, batch_plans = _rescore_batch(batch, scoring_model)
+        if not _commit_plan():
+            # A learner changed one of these plans mid-pass; redo the batch from fresh rows
+            conflicts += 1
+            if conflicts > RESCORE_CONFLICT_RETRIES:
+                raise click.ClickException(f'Plans kept changing while rescoring analyses after id {last_id}')
+            continue
+        updated += batch_updated
+        updated_plans += batch_plans
+        conflicts = 0
+        last_id = batch[-1].id
+    
+    click.echo(f'Rescored analyses: {updated} updated, {updated_plans} action plans updated')
+
+def _rescore_batch(batch, scoring_model):
+    """Rescore a batch of analyses and their plans; returns how many of each changed"""
+    updated = 0
+    scores = scoring_model.score_batch([
+        (analysis.extracted_skills or [], analysis.required_skills or []) for analysis in batch
+    ])
+    for analysis, score in zip(batch, scores):
+        if analysis.readiness_score != float(score):
+            analysis.readiness_score = float(score)
+            updated += 1
+    
+    # Plans store each task's score gain and the projected score built on the old model
+    plans = ActionPlan.query.filter(ActionPlan.analysis_id.in_([analysis.id for analysis in batch])).all()
+    analyses = {analysis.id: analysis for analysis in batch}
+    updated_plans = sum(_rescore_plan(action_plan, analyses[action_plan.analysis_id], scoring_model)
+                        for action_plan in plans)
+    return updated, updated_plans
+
+def _rescore_plan(action_plan, analysis, scoring_model):
+    """Recompute a stored plan's task score gains and projected score; returns whether it changed"""
+    deltas = scoring_model.skill_deltas(analysis.extracted_skills or [], analysis.required_skills or [])
+    # New task dicts so SQLAlchemy detects the change
+    tasks = [dict(task, score_delta=round(deltas.get(task['skill'].lower(), 0.0), 4))
+             for task in action_plan.tasks or []]
+    changed = False
+    if tasks != (action_plan.tasks or []):
+        action_plan.tasks = tasks
+        changed = True
+    updated_score = _progress_score(action_plan, analysis)
+    if updated_score != action_plan.updated_readiness_score:
+        action_plan.updated_readiness_score = updated_score
+        changed = True
+    return changed
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for this process"""
+    return render_metrics(), 200, {'Content-Type': METRICS_CONTENT_TYPE}
 
 # Health check endpoint for Render
 @app.route('/health')
@@ -240,9 +762,83 @@ def health_check():
     """Health check endpoint for Render"""
     return jsonify({'status': 'healthy', 'timestamp': datetime.utcnow().isoformat()})
 
+# Sample pair analyzed (never stored) to warm up each process
+WARMUP_RESUME = 'Software engineer with Python, Flask, SQL and Git experience. Built REST APIs on AWS.'
+WARMUP_JOB_DESCRIPTION = 'Required: Python, Docker and PostgreSQL. Kubernetes and communication skills are a plus.'
+
+def _warm_skill_matcher():
+    gap_analyzer.skill_extractor.extract_skills_from_resume(WARMUP_RESUME)
+
+def _warm_catalogs():
+    action_plan_generator.catalog
+    action_plan_generator.link_health
+    gap_analyzer.scoring_model
+
+def _warm_database():
+    # Check out (and return) a pooled connection
+    db.session.execute(text('SELECT 1'))
+    db.session.remove()
+
+def _warm_analysis():
+    resume_text = TextProcessor.clean_text(WARMUP_RESUME)
+    job_description = TextProcessor.clean_text(WARMUP_JOB_DESCRIPTION)
+    result = gap_analyzer.analyze_skills(resume_text, job_description)
+    score_deltas = gap_analyzer.scoring_model.skill_deltas(result['extracted_skills'], result['required_skills'])
+    action_plan_generator.generate_action_plan(0, result['skill_gaps'], DEFAULT_HOURS_PER_WEEK, score_deltas)
+
+warmup = Warmup(app, [
+    ('skill_matcher', _warm_skill_matcher),
+    ('catalogs', _warm_catalogs),
+    ('database', _warm_database),
+    ('synthetic_analysis', _warm_analysis)
+])
+
+@app.before_request
+def _start_warmup():
+    """Warm up a process that wasn't warmed on start (e.g. the Flask dev server)"""
+    warmup.start()
+
+# Readiness check for load balancers and the keep-alive ping
+@app.route('/ready')
+def readiness_check():
+    """200 once this process has warmed up, 503 until then"""
+    report = warmup.status()
+    report['timestamp'] = datetime.utcnow().isoformat()
+    return jsonify(report), 200 if warmup.ready else 503
+
+def create_app():
+    """Prepare the app to serve: storage, tables (created or upgraded) and shared analysis state
+    
+    wsgi.py calls this once in the gunicorn master (preload_app in
+    gunicorn.conf.py), so the skill matcher, learning catalog, link health and
+    scoring model are built before workers fork and shared copy-on-write.
+    Safe to call more than once.
+    """
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    
+    with app.app_context():
+        db.create_all()
+        added = upgrade_schema()
+        if added:
+            logger.info("Upgraded database schema: added %s", ', '.join(added))
+        # Forked workers must not inherit the connections create_all opened
+        db.engine.dispose()
+    
+    # Load the lazily built state so it exists before fork
+    _warm_catalogs()
+    return app
+
+def reset_db_after_fork():
+    """Drop pooled connections inherited from the parent process"""
+    with app.app_context():
+        # close=False leaves the parent's sockets alone; the worker opens its own
+        db.engine.dispose(close=False)
+
 if __name__ == '__main__':
     # Get port from environment variable (for Railway)
     port = int(os.environ.get('PORT', 5000))
     
     # Run in production mode on Railway
+    create_app()
+    warmup.start()
     app.run(host='0.0.0.0', port=port, debug=False)
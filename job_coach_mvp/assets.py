@@ -0,0 +1,104 @@
+"""
+Fingerprinted static assets built by build_assets.py.
+
+asset_url('css/app.css') gives the URL of the built, content-named file
+(/assets/css/app.3f2a9c1b07.css) when static/dist/manifest.json lists it.
+Those files never change, so /assets serves them with a one-year immutable
+Cache-Control, picking the brotli or gzip copy the client accepts. Without a
+build, asset_url falls back to the source file under /static with a content
+hash query string, so edits still bust browser caches.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+from flask import Blueprint, abort, request, send_file, url_for
+from werkzeug.security import safe_join
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(APP_DIR, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_NAME = 'manifest.json'
+
+# Seconds browsers and proxies may keep a fingerprinted asset
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Precompressed copies, in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+assets = Blueprint('assets', __name__, url_prefix='/assets')
+
+
+class AssetManifest:
+    """Logical asset names mapped to their built files, read once per process"""
+
+    def __init__(self, dist_dir: str = DIST_DIR):
+        self.dist_dir = dist_dir
+        self._entries: Optional[Dict[str, str]] = None
+
+    @property
+    def entries(self) -> Dict[str, str]:
+        if self._entries is None:
+            try:
+                with open(os.path.join(self.dist_dir, MANIFEST_NAME)) as file:
+                    self._entries = json.load(file)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, name: str) -> Optional[str]:
+        return self.entries.get(name)
+
+    def reload(self):
+        """Forget the loaded manifest (after a rebuild)"""
+        self._entries = None
+
+
+manifest = AssetManifest()
+
+
+@lru_cache(maxsize=64)
+def _source_hash(path: str, mtime: float) -> str:
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()[:10]
+
+
+def asset_bundled(name: str) -> bool:
+    """Whether a built bundle exists for a logical asset"""
+    return manifest.get(name) is not None
+
+
+def asset_url(name: str) -> str:
+    """URL of a static asset: its fingerprinted build, else the source with a content hash"""
+    built = manifest.get(name)
+    if built is not None:
+        return url_for('assets.serve', filename=built)
+
+    path = os.path.join(STATIC_DIR, name)
+    if not os.path.isfile(path):
+        return url_for('static', filename=name)
+    return url_for('static', filename=name, v=_source_hash(path, os.path.getmtime(path)))
+
+
+@assets.route('/<path:filename>')
+def serve(filename):
+    """A built asset, precompressed when the client accepts it, cached for a year"""
+    path = safe_join(manifest.dist_dir, filename)
+    if path is None or not os.path.isfile(path) or filename.endswith(('.gz', '.br')):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    encoding = next((encoding for encoding, suffix in ENCODINGS
+                     if encoding in request.accept_encodings and os.path.isfile(path + suffix)), None)
+    if encoding is not None:
+        path += dict(ENCODINGS)[encoding]
+    response = send_file(path, mimetype=mimetype, conditional=True, max_age=IMMUTABLE_MAX_AGE)
+    if encoding is not None:
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.immutable = True
+    return response
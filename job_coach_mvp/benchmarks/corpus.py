@@ -0,0 +1,169 @@
+"""
+Deterministic synthetic corpus for benchmarks.
+
+Generates resumes, job postings, PDFs, DOCX files and skill taxonomies of a
+requested size. The same seed always produces byte-identical output, so
+benchmark runs are comparable across machines and commits.
+"""
+
+import random
+from typing import Dict, List
+
+from docx import Document
+
+from skill_extractor import SkillExtractor
+
+KB = 1024
+MB = 1024 * KB
+
+FILLER_WORDS = [
+    'delivered', 'designed', 'improved', 'maintained', 'scalable', 'services', 'platform', 'customers',
+    'reliability', 'performance', 'features', 'internal', 'tooling', 'migration', 'reporting', 'team',
+    'stakeholders', 'quality', 'automation', 'pipeline', 'release', 'production', 'analytics', 'roadmap'
+]
+
+RESUME_TEMPLATES = [
+    'Developed {filler} {filler} using {skill} and {skill} for {years} years.',
+    'Senior engineer experienced with {skill}, {skill} and {skill}.',
+    'Led {filler} {filler} initiatives with {skill} across {years} teams.',
+    'Junior contributor to {filler} {filler} built on {skill}.',
+    'Intermediate knowledge of {skill}; {filler} {filler} {filler}.'
+]
+
+JOB_TEMPLATES = [
+    '{skill} experience is required.',
+    'Must have hands-on {skill} and {skill} skills.',
+    '{skill} is a plus; {filler} {filler} is nice to have.',
+    'Essential: {years}+ years with {skill}.',
+    'You will own {filler} {filler} using {skill}.'
+]
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ne', 'ru', 'ta', 'vo', 'zi', 'bex', 'dor', 'fyn', 'gal', 'hox', 'jul', 'pra', 'qua']
+SUFFIXES = ['', 'DB', 'JS', 'ML', 'Ops', 'Kit', 'Flow', 'Grid', 'Stack', 'Cloud']
+
+
+def taxonomy_skill_names() -> List[str]:
+    """Skill names from the real taxonomy"""
+    return list(dict.fromkeys(SkillExtractor().all_skills))
+
+
+def generate_taxonomy(size: int, seed: int = 0) -> Dict[str, List[str]]:
+    """Generate a taxonomy of `size` unique skills, starting from the real one"""
+    rng = random.Random(seed)
+    real_skills = taxonomy_skill_names()[:size]
+    names = list(real_skills)
+    seen = {name.lower() for name in names}
+
+    while len(names) < size:
+        name = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        name += rng.choice(SUFFIXES)
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            names.append(name)
+
+    categories: Dict[str, List[str]] = {}
+    category_count = max(1, size // 250)
+    for index, name in enumerate(names):
+        categories.setdefault(f'Category {index % category_count:03d}', []).append(name)
+    return categories
+
+
+def _generate_text(target_bytes: int, templates: List[str], skills: List[str], seed: int) -> str:
+    """Fill templates with skills and filler words until the text reaches target_bytes"""
+    rng = random.Random(seed)
+    sentences = []
+    size = 0
+    while size < target_bytes:
+        sentence = rng.choice(templates)
+        while '{' in sentence:
+            sentence = (sentence
+                        .replace('{skill}', rng.choice(skills), 1)
+                        .replace('{filler}', rng.choice(FILLER_WORDS), 1)
+                        .replace('{years}', str(rng.randint(1, 12)), 1))
+        sentences.append(sentence)
+        size += len(sentence) + 1
+    return ' '.join(sentences)[:target_bytes]
+
+
+def generate_resume(target_bytes: int, seed: int = 0, skills: List[str] = None) -> str:
+    """Generate a synthetic resume of roughly target_bytes"""
+    return _generate_text(target_bytes, RESUME_TEMPLATES, skills or taxonomy_skill_names(), seed)
+
+
+def generate_job_description(target_bytes: int, seed: int = 0, skills: List[str] = None) -> str:
+    """Generate a synthetic job posting of roughly target_bytes"""
+    return _generate_text(target_bytes, JOB_TEMPLATES, skills or taxonomy_skill_names(), seed + 1)
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    """Split text into lines of at most width characters"""
+    lines, line = [], ''
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f'{line} {word}' if line else word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _pdf_escape(text: str) -> str:
+    """Escape a string for a PDF text literal"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path: str, pages: int, seed: int = 0, lines_per_page: int = 50) -> str:
+    """Write a text PDF with the given number of pages"""
+    text = generate_resume(pages * lines_per_page * 90, seed)
+    lines = _wrap(text, 90)
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # page tree, filled in once page object numbers are known
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+    ]
+    page_ids = []
+    for page in range(pages):
+        page_lines = lines[page * lines_per_page:(page + 1) * lines_per_page] or ['']
+        content = 'BT /F1 9 Tf 40 760 Td 14 TL ' + ' '.join(
+            f'({_pdf_escape(line)}) Tj T*' for line in page_lines
+        ) + ' ET'
+        stream = content.encode('latin-1', 'replace')
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        content_id = len(objects)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % content_id
+        )
+        page_ids.append(len(objects))
+
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects[1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode()
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        output += b'%010d 00000 n \n' % offset
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%EOF\n' % (len(objects) + 1, xref_offset)
+
+    with open(path, 'wb') as file:
+        file.write(bytes(output))
+    return path
+
+
+def write_docx(path: str, target_bytes: int, seed: int = 0) -> str:
+    """Write a DOCX resume with roughly target_bytes of text"""
+    document = Document()
+    text = generate_resume(target_bytes, seed)
+    for paragraph in _wrap(text, 400):
+        document.add_paragraph(paragraph)
+    document.save(path)
+    return path
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+HTTP load test for the Flask routes.
+
+Starts the app under gunicorn with a throwaway SQLite database (or targets an
+already running deployment with --url, e.g. one backed by a local Postgres)
+and replays user journeys from concurrent virtual users:
+
+    upload -> wait for analysis job -> analysis -> action plan -> toggle tasks
+
+Reports throughput, latency percentiles and error rate per route.
+
+Usage (from job_coach_mvp/):
+    python -m benchmarks.load_test --users 8 --duration 30 --workers 2 --threads 4
+    python -m benchmarks.load_test --url http://127.0.0.1:5000 --users 4 --journeys 20
+"""
+
+import argparse
+import http.client
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from docx import Document
+
+from benchmarks.corpus import KB, generate_job_description, generate_resume
+from benchmarks.run_benchmarks import _percentile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TASK_ID_PATTERN = re.compile(r'data-task-id="([^"]+)"')
+ANALYSIS_LOCATION_PATTERN = re.compile(r'/analysis/(\d+)')
+UPLOAD_LOCATION_PATTERN = re.compile(r'/(analysis|jobs)/(\d+)')
+
+# Seconds a journey waits for its analysis job, and between status polls
+JOB_TIMEOUT = 120
+JOB_POLL_INTERVAL = 0.25
+
+
+class RouteStats:
+    """Thread-safe latency and error collection per route"""
+
+    def __init__(self):
+        self._latencies: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, seconds: float, ok: bool):
+        """Record one request"""
+        with self._lock:
+            self._latencies.setdefault(route, []).append(seconds)
+            if not ok:
+                self._errors[route] = self._errors.get(route, 0) + 1
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        """Summarize throughput, latency percentiles and error rate per route"""
+        with self._lock:
+            latencies = {route: sorted(values) for route, values in self._latencies.items()}
+            errors = dict(self._errors)
+
+        summary = {}
+        for route, values in sorted(latencies.items()):
+            count = len(values)
+            summary[route] = {
+                'requests': count,
+                'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+                'p50_ms': round(_percentile(values, 0.50) * 1000, 1),
+                'p95_ms': round(_percentile(values, 0.95) * 1000, 1),
+                'p99_ms': round(_percentile(values, 0.99) * 1000, 1),
+                'error_rate': round(errors.get(route, 0) / count, 4)
+            }
+        return summary
+
+
+def _docx_bytes(seed: int) -> bytes:
+    """Build a small DOCX resume in memory"""
+    document = Document()
+    document.add_paragraph(generate_resume(4 * KB, seed=seed))
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _multipart(fields: Dict[str, str], files: Dict[str, Tuple[str, bytes]]) -> Tuple[bytes, str]:
+    """Encode a multipart/form-data body"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+class VirtualUser:
+    """Replays journeys over one keep-alive connection"""
+
+    def __init__(self, base_url: str, stats: RouteStats, seed: int, toggles: int):
+        parsed = urlparse(base_url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.stats = stats
+        self.seed = seed
+        self.toggles = toggles
+        self.connection: Optional[http.client.HTTPConnection] = None
+        self.resume = _docx_bytes(seed)
+        self.job_description = generate_job_description(2 * KB, seed=seed)
+
+    def request(self, route: str, method: str, path: str, body: bytes = None,
+                headers: Dict[str, str] = None, expect_location: re.Pattern = None) -> Tuple[int, Dict[str, str], str]:
+        """Send one request, recording its latency under the route label.
+
+        With expect_location, a response is only successful when it redirects
+        to a matching URL (failed form posts redirect back with a flash).
+        """
+        start = time.perf_counter()
+        try:
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=180)
+            self.connection.request(method, path, body=body, headers=headers or {})
+            response = self.connection.getresponse()
+            text = response.read().decode('utf-8', 'replace')
+            status, response_headers = response.status, dict(response.getheaders())
+        except (OSError, http.client.HTTPException):
+            if self.connection is not None:
+                self.connection.close()
+            self.connection = None
+            self.stats.record(route, time.perf_counter() - start, False)
+            return 0, {}, ''
+
+        ok = status < 400
+        if expect_location is not None:
+            ok = ok and bool(expect_location.search(response_headers.get('Location', '')))
+        self.stats.record(route, time.perf_counter() - start, ok)
+        return status, response_headers, text
+
+    def wait_for_job(self, job_id: str) -> Optional[str]:
+        """Poll an analysis job until it finishes, returning its analysis id"""
+        started = time.perf_counter()
+        deadline = started + JOB_TIMEOUT
+        while time.perf_counter() < deadline:
+            status, _, text = self.request('/jobs/<id>/status', 'GET', f'/jobs/{job_id}/status')
+            job = json.loads(text) if status == 200 else {}
+            if job.get('status') in ('done', 'failed'):
+                break
+            time.sleep(JOB_POLL_INTERVAL)
+        else:
+            job = {}
+
+        # Time from upload response to analysis ready, as the user experiences it
+        match = ANALYSIS_LOCATION_PATTERN.search(job.get('analysis_url', ''))
+        self.stats.record('analysis job', time.perf_counter() - started, bool(match))
+        return match.group(1) if match else None
+
+    def journey(self) -> bool:
+        """Run one upload -> job -> analysis -> plan -> toggle journey"""
+        body, content_type = _multipart(
+            {'job_description': self.job_description},
+            {'resume_file': ('resume.docx', self.resume)}
+        )
+        status, headers, _ = self.request('/upload', 'POST', '/upload', body, {'Content-Type': content_type},
+                                          expect_location=UPLOAD_LOCATION_PATTERN)
+        match = UPLOAD_LOCATION_PATTERN.search(headers.get('Location', ''))
+        if status != 302 or not match:
+            return False
+        analysis_id = match.group(2) if match.group(1) == 'analysis' else self.wait_for_job(match.group(2))
+        if analysis_id is None:
+            return False
+
+        self.request('/analysis/<id>', 'GET', f'/analysis/{analysis_id}')
+        status, _, page = self.request('/action-plan/<id>', 'GET', f'/action-plan/{analysis_id}')
+        if status != 200:
+            return False
+
+        # Each checkbox click, as the plan page sends it to the JSON endpoint
+        for task_id in TASK_ID_PATTERN.findall(page)[:self.toggles]:
+            self.request('/action-plan/<id>/tasks', 'POST', f'/action-plan/{analysis_id}/tasks',
+                         json.dumps({'tasks': {task_id: True}}).encode(),
+                         {'Content-Type': 'application/json', 'Accept': 'application/json'})
+        return True
+
+
+def run_load(base_url: str, users: int, duration: float, journeys: Optional[int], toggles: int) -> Dict[str, object]:
+    """Run concurrent virtual users until the duration or journey budget is spent"""
+    stats = RouteStats()
+    deadline = time.perf_counter() + duration
+    remaining = [journeys] if journeys else None
+    budget_lock = threading.Lock()
+    completed = [0, 0]  # successful, failed
+
+    def take_journey() -> bool:
+        if remaining is None:
+            return time.perf_counter() < deadline
+        with budget_lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+
+    def user_loop(seed: int):
+        user = VirtualUser(base_url, stats, seed, toggles)
+        while take_journey():
+            ok = user.journey()
+            with budget_lock:
+                completed[0 if ok else 1] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(user_loop, range(users)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'elapsed_s': round(elapsed, 2),
+        'journeys': completed[0],
+        'failed_journeys': completed[1],
+        'routes': stats.summary(elapsed)
+    }
+
+
+def start_server(port: int, workers: int, threads: int, database_url: str) -> subprocess.Popen:
+    """Start the app under gunicorn and wait until /ready answers"""
+    env = dict(os.environ, DATABASE_URL=database_url, PYTHONUNBUFFERED='1')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads)],
+        cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/ready')
+            # 503 until the worker has warmed up
+            if connection.getresponse().status == 200:
+                return process
+        except OSError:
+            pass
+        time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError("Timed out waiting for the app to start")
+
+
+def _print_report(report: Dict[str, object]):
+    """Print a per-route table"""
+    print(f"\nElapsed {report['elapsed_s']}s, journeys {report['journeys']} ok / {report['failed_journeys']} failed\n")
+    print(f"{'route':<20} {'requests':>9} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    for route, stats in report['routes'].items():
+        print(f"{route:<20} {stats['requests']:>9} {stats['throughput_rps']:>8} {stats['p50_ms']:>9} "
+              f"{stats['p95_ms']:>9} {stats['p99_ms']:>9} {stats['error_rate']:>8.2%}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='Target an already running app instead of starting one')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--workers', type=int, default=1, help='gunicorn workers for the local app')
+    parser.add_argument('--threads', type=int, default=1, help='gunicorn threads per worker for the local app')
+    parser.add_argument('--database-url', help='Database for the local app (default: throwaway SQLite file)')
+    parser.add_argument('--users', type=int, default=4, help='Concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run')
+    parser.add_argument('--journeys', type=int, help='Stop after this many journeys instead of --duration')
+    parser.add_argument('--toggles', type=int, default=3, help='Task toggles per journey')
+    parser.add_argument('--output', help='Write the report to this JSON file')
+    args = parser.parse_args(argv)
+
+    process = None
+    with tempfile.TemporaryDirectory() as workdir:
+        base_url = args.url
+        if not base_url:
+            database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'load_test.db')}"
+            process = start_server(args.port, args.workers, args.threads, database_url)
+            base_url = f'http://127.0.0.1:{args.port}'
+
+        try:
+            report = run_load(base_url, args.users, args.duration, args.journeys, args.toggles)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+
+    report['config'] = {
+        'url': args.url or 'local', 'workers': args.workers, 'threads': args.threads, 'users': args.users
+    }
+    _print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    return 0 if report['failed_journeys'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for TextProcessor, SkillExtractor and GapAnalyzer.
+
+Reports throughput and p50/p99 latency per component on a deterministic
+synthetic corpus, and compares the results against a stored baseline.
+
+Usage (from job_coach_mvp/):
+    python -m benchmarks.run_benchmarks                      # quick profile vs baseline
+    python -m benchmarks.run_benchmarks --profile full
+    python -m benchmarks.run_benchmarks --update-baseline    # record a new baseline
+
+Exits with status 1 when a case's p50 regresses past the threshold, and with
+status 2 when a case has no baseline to compare against.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.corpus import (
+    KB, MB, generate_job_description, generate_resume, generate_taxonomy, write_docx, write_pdf
+)
+from gap_analyzer import GapAnalyzer
+from skill_extractor import SkillExtractor
+from text_processor import TextProcessor
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.25
+
+# (text sizes, PDF pages, DOCX sizes, taxonomy sizes as (skills, text size))
+PROFILES = {
+    'quick': {
+        'text_sizes': [1 * KB, 64 * KB],
+        'pdf_pages': [10],
+        'docx_sizes': [16 * KB],
+        'taxonomies': [(150, 4 * KB), (1000, 4 * KB)],
+        'min_iterations': 5,
+        'time_budget': 1.0
+    },
+    'full': {
+        'text_sizes': [1 * KB, 64 * KB, 1 * MB, 5 * MB],
+        'pdf_pages': [10, 100, 500],
+        'docx_sizes': [16 * KB, 1 * MB],
+        'taxonomies': [(150, 64 * KB), (1000, 64 * KB), (10000, 16 * KB), (50000, 4 * KB)],
+        'min_iterations': 3,
+        'time_budget': 5.0
+    }
+}
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted values"""
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(fn: Callable[[], Any], min_iterations: int, time_budget: float, payload_bytes: int = 0) -> Dict[str, float]:
+    """Run fn repeatedly and summarize its latency distribution"""
+    fn()  # warm-up
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < min_iterations or time.perf_counter() - started < time_budget:
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+        if len(latencies) >= 1000:
+            break
+
+    latencies.sort()
+    total = sum(latencies)
+    result = {
+        'iterations': len(latencies),
+        'p50_ms': round(_percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(_percentile(latencies, 0.99) * 1000, 3),
+        'ops_per_sec': round(len(latencies) / total, 2) if total else 0.0
+    }
+    if payload_bytes:
+        result['mb_per_sec'] = round(payload_bytes * len(latencies) / total / MB, 3) if total else 0.0
+    return result
+
+
+def _extractor_for(taxonomy: Dict[str, List[str]]) -> SkillExtractor:
+    """Build a SkillExtractor over a synthetic taxonomy"""
+    extractor_class = type('SyntheticSkillExtractor', (SkillExtractor,), {'SKILL_CATEGORIES': taxonomy})
+    return extractor_class()
+
+
+def build_cases(profile: Dict[str, Any], workdir: str) -> Dict[str, Callable[[], Dict[str, float]]]:
+    """Build named benchmark cases for a profile"""
+    min_iterations, budget = profile['min_iterations'], profile['time_budget']
+    cases: Dict[str, Callable[[], Dict[str, float]]] = {}
+    gap_analyzer = GapAnalyzer()
+
+    for size in profile['text_sizes']:
+        resume = generate_resume(size)
+        job = generate_job_description(size)
+        label = f'{size // KB}kb'
+        cases[f'text_processor.clean_text[{label}]'] = (
+            lambda text=resume, size=size: measure(lambda: TextProcessor.clean_text(text), min_iterations, budget, size)
+        )
+        cases[f'skill_extractor.resume[{label}]'] = (
+            lambda text=resume, size=size: measure(
+                lambda: gap_analyzer.skill_extractor.extract_skills_from_resume(text), min_iterations, budget, size)
+        )
+        cases[f'skill_extractor.job[{label}]'] = (
+            lambda text=job, size=size: measure(
+                lambda: gap_analyzer.skill_extractor.extract_requirements_from_job_description(text),
+                min_iterations, budget, size)
+        )
+        cases[f'gap_analyzer.analyze_skills[{label}]'] = (
+            lambda resume=resume, job=job, size=size: measure(
+                lambda: gap_analyzer.analyze_skills(resume, job), min_iterations, budget, 2 * size)
+        )
+
+    for pages in profile['pdf_pages']:
+        path = write_pdf(os.path.join(workdir, f'resume_{pages}p.pdf'), pages)
+        cases[f'text_processor.extract_pdf[{pages}p]'] = (
+            lambda path=path: measure(lambda: TextProcessor.extract_text_from_file(path),
+                                      min_iterations, budget, os.path.getsize(path))
+        )
+
+    for size in profile['docx_sizes']:
+        path = write_docx(os.path.join(workdir, f'resume_{size // KB}kb.docx'), size)
+        cases[f'text_processor.extract_docx[{size // KB}kb]'] = (
+            lambda path=path, size=size: measure(lambda: TextProcessor.extract_text_from_file(path),
+                                                 min_iterations, budget, size)
+        )
+
+    for skill_count, size in profile['taxonomies']:
+        def taxonomy_case(skill_count=skill_count, size=size):
+            taxonomy = generate_taxonomy(skill_count)
+            extractor = _extractor_for(taxonomy)
+            skills = extractor.all_skills
+            resume = generate_resume(size, skills=skills)
+            return measure(lambda: extractor.extract_skills_from_resume(resume), min_iterations, budget, size)
+        cases[f'skill_extractor.taxonomy[{skill_count}skills,{size // KB}kb]'] = taxonomy_case
+
+    return cases
+
+
+def run(profile_name: str, only: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """Run every case in a profile (optionally filtered by substring)"""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = build_cases(PROFILES[profile_name], workdir)
+        for name, case in cases.items():
+            if only and only not in name:
+                continue
+            results[name] = case()
+            print(_format_result(name, results[name]), flush=True)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """List cases whose p50 latency regressed by more than threshold"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        limit = expected['p50_ms'] * (1 + threshold)
+        if result['p50_ms'] > limit:
+            change = (result['p50_ms'] / expected['p50_ms'] - 1) * 100
+            regressions.append(
+                f"{name}: p50 {result['p50_ms']}ms vs baseline {expected['p50_ms']}ms (+{change:.0f}%)"
+            )
+    return regressions
+
+
+def missing_baselines(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> List[str]:
+    """Cases with no baseline entry, which compare() can't check"""
+    return sorted(name for name in results if not baseline.get(name))
+
+
+def _format_result(name: str, result: Dict[str, float]) -> str:
+    """Format one result line"""
+    line = f"{name:<55} p50 {result['p50_ms']:>10.3f}ms  p99 {result['p99_ms']:>10.3f}ms  {result['ops_per_sec']:>9.2f} ops/s"
+    if 'mb_per_sec' in result:
+        line += f"  {result['mb_per_sec']:>8.3f} MB/s"
+    return line
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    """Load stored baseline results"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick')
+    parser.add_argument('--only', help='Run only cases whose name contains this string')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed p50 slowdown before failing (0.25 = 25%%)')
+    parser.add_argument('--update-baseline', action='store_true', help='Merge these results into the baseline')
+    parser.add_argument('--output', help='Also write results to this JSON file')
+    args = parser.parse_args(argv)
+
+    results = run(args.profile, args.only)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write('\n')
+        print(f"Updated baseline: {args.baseline}")
+        return 0
+
+    missing = missing_baselines(results, baseline)
+    if missing:
+        print(f"\nNo baseline for {len(missing)} case(s) in {args.baseline}:")
+        for name in missing:
+            print(f"  - {name}")
+        print(f"Record one with: python -m benchmarks.run_benchmarks --profile {args.profile} --update-baseline")
+        return 2
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Build fingerprinted, precompressed static assets.
+
+Usage (from job_coach_mvp/, run on deploy before the app starts):
+    python build_assets.py
+
+1. Runs the Tailwind CLI over the templates and scripts (tailwind.config.js),
+   keeping only the classes they use, and appends static/css/style.css to
+   make css/app.css
+2. Copies static/js/main.js
+3. Names each file after its content (css/app.3f2a9c1b07.css) and writes
+   .gz and, when the brotli package is installed, .br copies next to it
+4. Writes static/dist/manifest.json mapping logical names to built files
+
+assets.py serves the built files under /assets with immutable cache headers,
+and base.html drops the Tailwind CDN and web fonts once a bundle exists.
+TAILWIND_CMD overrides the Tailwind CLI command.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional
+
+from assets import DIST_DIR, MANIFEST_NAME, STATIC_DIR
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+TAILWIND_CMD = os.environ.get('TAILWIND_CMD', 'npx --yes tailwindcss@3')
+
+# Logical name -> source files concatenated into it (Tailwind output comes first for app.css)
+BUNDLES = {
+    'css/app.css': ['css/style.css'],
+    'js/main.js': ['js/main.js'],
+}
+
+
+def run_tailwind() -> str:
+    """Purged, minified Tailwind CSS for the templates and scripts"""
+    command = shlex.split(TAILWIND_CMD) + ['-c', 'tailwind.config.js', '-i', 'static/css/tailwind.css', '--minify']
+    result = subprocess.run(command, cwd=APP_DIR, check=True, capture_output=True, text=True)
+    return result.stdout
+
+
+def fingerprint(name: str, content: bytes) -> str:
+    """css/app.css -> css/app.<content hash>.css"""
+    stem, extension = os.path.splitext(name)
+    return f'{stem}.{hashlib.sha256(content).hexdigest()[:10]}{extension}'
+
+
+def _brotli_compress() -> Optional[Callable[[bytes], bytes]]:
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return lambda content: brotli.compress(content, quality=11)
+
+
+def write_asset(dist_dir: str, name: str, content: bytes) -> List[str]:
+    """Write a file with its precompressed copies; returns the paths written"""
+    path = os.path.join(dist_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(content)
+    written = [path]
+
+    # mtime=0 keeps the .gz byte-identical across builds of the same content
+    with open(path + '.gz', 'wb') as file:
+        file.write(gzip.compress(content, compresslevel=9, mtime=0))
+    written.append(path + '.gz')
+
+    compress = _brotli_compress()
+    if compress is not None:
+        with open(path + '.br', 'wb') as file:
+            file.write(compress(content))
+        written.append(path + '.br')
+    return written
+
+
+def build(dist_dir: str = DIST_DIR, tailwind: Callable[[], str] = run_tailwind) -> Dict[str, str]:
+    """Build every bundle into dist_dir and return the manifest"""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for name, sources in BUNDLES.items():
+        parts = [tailwind()] if name == 'css/app.css' else []
+        for source in sources:
+            with open(os.path.join(STATIC_DIR, source), encoding='utf-8') as file:
+                parts.append(file.read())
+        content = '\n'.join(parts).encode('utf-8')
+        manifest[name] = fingerprint(name, content)
+        write_asset(dist_dir, manifest[name], content)
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=DIST_DIR, help='Directory for the built assets')
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = build(args.output)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Asset build failed: {e}", file=sys.stderr)
+        return 1
+
+    if _brotli_compress() is None:
+        print("brotli is not installed; wrote gzip copies only", file=sys.stderr)
+    for name, built in sorted(manifest.items()):
+        size = os.path.getsize(os.path.join(args.output, built))
+        print(f"{name:<14} -> {built} ({size:,} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
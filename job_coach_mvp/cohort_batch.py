@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Bulk action plan generation for cohorts.
+
+Reads (resume, job) pairs as NDJSON and streams one result per line, in
+input order:
+
+    {"id": "learner-1", "resume_text": "...", "job_description": "..."}
+    {"id": "learner-2", "resume_path": "cv.pdf", "job_path": "role.txt"}
+
+    -> {"id": "learner-1", "readiness_score": 62.5, "skill_gaps": [...], "action_plan": {...}}
+    -> {"id": "learner-2", "error": "..."}
+
+Work is spread over a process pool. Each worker builds its GapAnalyzer and
+ActionPlanGenerator once, so the taxonomy, scoring model and learning catalog
+are shared by every pair it handles. Requirements extracted from a job
+description are memoized per worker, since cohorts target the same roles.
+At most `window` pairs are in flight at a time, so memory stays bounded
+however long the input is.
+
+Usage (from job_coach_mvp/):
+    python cohort_batch.py cohort.ndjson -o plans.ndjson --workers 4
+    cat cohort.ndjson | python cohort_batch.py > plans.ndjson
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from action_plan_generator import ActionPlanGenerator
+from gap_analyzer import GapAnalyzer
+from plan_scheduler import DEFAULT_HOURS_PER_WEEK
+from text_processor import TextProcessor
+
+# Pairs in flight per worker process
+WINDOW_PER_WORKER = 4
+
+# Distinct job descriptions whose requirements each worker keeps
+REQUIREMENTS_CACHE_SIZE = 256
+
+
+class CohortWorker:
+    """Per-process analysis state shared by every pair in the batch"""
+
+    def __init__(self, hours_per_week: int = DEFAULT_HOURS_PER_WEEK, gap_analyzer: Optional[GapAnalyzer] = None,
+                 action_plan_generator: Optional[ActionPlanGenerator] = None):
+        self.gap_analyzer = gap_analyzer or GapAnalyzer()
+        self.action_plan_generator = action_plan_generator or ActionPlanGenerator()
+        self.hours_per_week = hours_per_week
+        self._requirements: 'OrderedDict[str, List[Dict]]' = OrderedDict()
+        # The JSON API shares one worker between request threads
+        self._lock = threading.Lock()
+
+    def required_skills(self, job_description: str) -> List[Dict]:
+        """Requirements for a job description, memoized by content"""
+        key = hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+        with self._lock:
+            required = self._requirements.get(key)
+            if required is not None:
+                self._requirements.move_to_end(key)
+                return required
+
+        extractor = self.gap_analyzer.skill_extractor
+        required = extractor.extract_requirements_from_job_description(job_description)
+        with self._lock:
+            self._requirements[key] = required
+            if len(self._requirements) > REQUIREMENTS_CACHE_SIZE:
+                self._requirements.popitem(last=False)
+        return required
+
+    def process(self, index: int, record: Dict[str, Any], allow_paths: bool = True,
+                include_plan: bool = True) -> Dict[str, Any]:
+        """Analyze one pair and generate its action plan.
+
+        With allow_paths=False only inline resume_text/job_description are
+        accepted (for pairs submitted over HTTP).
+        """
+        record_id = record.get('id', index)
+        try:
+            resume_text = TextProcessor.clean_text(_read_text(record, 'resume', allow_paths))
+            job_description = TextProcessor.clean_text(_read_text(record, 'job', allow_paths))
+            if not resume_text or not job_description:
+                raise ValueError("Empty resume or job description")
+
+            analysis = self.gap_analyzer.analyze_skills(
+                resume_text, job_description, self.required_skills(job_description)
+            )
+            plan = None
+            if include_plan:
+                score_deltas = self.gap_analyzer.scoring_model.skill_deltas(
+                    analysis['extracted_skills'], analysis['required_skills']
+                )
+                plan = self.action_plan_generator.generate_action_plan(
+                    record_id, analysis['skill_gaps'], record.get('hours_per_week') or self.hours_per_week,
+                    score_deltas
+                )
+        except Exception as e:
+            return {'id': record_id, 'error': str(e)}
+
+        result = {
+            'id': record_id,
+            'readiness_score': analysis['readiness_score'],
+            'skill_gaps': analysis['skill_gaps']
+        }
+        if include_plan:
+            result['action_plan'] = plan
+        return result
+
+
+def _read_text(record: Dict[str, Any], kind: str, allow_paths: bool = True) -> str:
+    """Text for 'resume' or 'job', inline or from a file path"""
+    text_key = 'resume_text' if kind == 'resume' else 'job_description'
+    text = record.get(text_key)
+    if text:
+        if not isinstance(text, str):
+            raise ValueError(f"{text_key} must be a string")
+        return text
+    if not allow_paths:
+        raise ValueError(f"Record needs {text_key}")
+    path = record.get(f'{kind}_path')
+    if not path:
+        raise ValueError(f"Record needs {text_key} or {kind}_path")
+    if path.lower().endswith(('.pdf', '.docx')):
+        return TextProcessor.extract_text_from_file(path)
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+
+_worker: Optional[CohortWorker] = None
+
+
+def _init_worker(hours_per_week: int):
+    """Process pool initializer: build the shared state once per process"""
+    global _worker
+    _worker = CohortWorker(hours_per_week)
+
+
+def _process_in_worker(index: int, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one record with this process's worker"""
+    return _worker.process(index, record)
+
+
+def generate_cohort_plans(records: Iterable[Dict[str, Any]], workers: int = 1, window: Optional[int] = None,
+                          hours_per_week: int = DEFAULT_HOURS_PER_WEEK) -> Iterator[Dict[str, Any]]:
+    """Yield one result per record, in input order.
+
+    With workers > 1 records are processed in a process pool, keeping at most
+    `window` of them in flight.
+    """
+    if workers <= 1:
+        worker = CohortWorker(hours_per_week)
+        for index, record in enumerate(records):
+            yield worker.process(index, record)
+        return
+
+    window = window or workers * WINDOW_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(hours_per_week,)) as pool:
+        in_flight = deque()
+        for index, record in enumerate(records):
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(_process_in_worker, index, record))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Parse NDJSON records, skipping blank lines"""
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', nargs='?', default='-', help='NDJSON input file (default: stdin)')
+    parser.add_argument('-o', '--output', default='-', help='NDJSON output file (default: stdout)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    parser.add_argument('--window', type=int, help='Max pairs in flight (default: 4 per worker)')
+    parser.add_argument('--hours-per-week', type=int, default=DEFAULT_HOURS_PER_WEEK,
+                        help='Weekly study budget used to schedule plans')
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    processed = failed = 0
+    try:
+        for result in generate_cohort_plans(read_ndjson(source), args.workers, args.window, args.hours_per_week):
+            sink.write(json.dumps(result) + '\n')
+            processed += 1
+            failed += 'error' in result
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    print(f"Generated {processed - failed} plans ({failed} failed)", file=sys.stderr)
+    return 0 if not failed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
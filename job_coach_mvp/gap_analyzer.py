@@ -1,28 +1,46 @@
-from typing import List, Dict, Any, Tuple, Optional, Union
-from skill_extractor import SkillExtractor
+from typing import List, Dict, Any, Callable, Tuple, Optional, Union
+from skill_extractor import SkillExtractor, get_skill_extractor
+from scoring_model import ScoringModel, get_scoring_model
+from pipeline_timing import span
 
 class GapAnalyzer:
     """Analyze skill gaps between resume and job requirements"""
     
-    def __init__(self):
-        self.skill_extractor = SkillExtractor()
+    def __init__(self, scoring_model: Optional[ScoringModel] = None, skill_extractor: Optional[SkillExtractor] = None):
+        self.skill_extractor = skill_extractor or get_skill_extractor()
+        self.scoring_model = scoring_model or get_scoring_model()
     
-    def analyze_skills(self, resume_text: str, job_description: str) -> Dict[str, Any]:
-        """Perform complete skill gap analysis"""
+    def analyze_skills(self, resume_text: str, job_description: str,
+                       required_skills: Optional[List[Dict]] = None,
+                       on_stage: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Perform complete skill gap analysis.
+        
+        Pass required_skills to reuse requirements already extracted from the
+        same job description. on_stage(stage, details) is called as skills are
+        matched and as gaps are computed (see progress.py).
+        """
         
         # Extract skills from resume and job description
         resume_skills = self.skill_extractor.extract_skills_from_resume(resume_text)
-        required_skills = self.skill_extractor.extract_requirements_from_job_description(job_description)
-        
-        # Calculate skill gaps
-        skill_gaps = self._calculate_skill_gaps(resume_skills, required_skills)
-        
-        # Calculate readiness score
-        readiness_score = self._calculate_readiness_score(resume_skills, required_skills)
+        if required_skills is None:
+            required_skills = self.skill_extractor.extract_requirements_from_job_description(job_description)
+        if on_stage:
+            on_stage('skills_matched', {'skills': len(resume_skills), 'required': len(required_skills)})
+        
+        with span('analysis.score_gaps'):
+            # Calculate skill gaps
+            skill_gaps = self._calculate_skill_gaps(resume_skills, required_skills)
+            
+            # Calculate readiness score
+            readiness_score = self._calculate_readiness_score(resume_skills, required_skills)
+            summary = self._generate_summary(resume_skills, required_skills, readiness_score)
+        if on_stage:
+            on_stage('gaps_computed', {'gaps': len(skill_gaps), 'readiness_score': readiness_score})
         
         # Extract additional information
-        experience_years = self.skill_extractor.extract_experience_years(resume_text)
-        education_level = self.skill_extractor.extract_education_level(resume_text)
+        with span('analysis.classify_skills'):
+            experience_years = self.skill_extractor.extract_experience_years(resume_text)
+            education_level = self.skill_extractor.extract_education_level(resume_text)
         
         return {
             'extracted_skills': resume_skills,
@@ -31,7 +49,7 @@ class GapAnalyzer:
             'readiness_score': readiness_score,
             'experience_years': experience_years,
             'education_level': education_level,
-            'summary': self._generate_summary(resume_skills, required_skills, readiness_score)
+            'summary': summary
         }
     
     def _calculate_skill_gaps(self, resume_skills: List[Dict], required_skills: List[Dict]) -> List[Dict]:
@@ -92,30 +110,8 @@ class GapAnalyzer:
     
     def _calculate_readiness_score(self, resume_skills: List[Dict], required_skills: List[Dict]) -> float:
         """Calculate overall job readiness score (0-100)"""
-        if not required_skills:
-            return 100.0
-        
-        # Separate critical and preferred skills
-        critical_skills = [s for s in required_skills if s.get('importance') == 'critical']
-        preferred_skills = [s for s in required_skills if s.get('importance') != 'critical']
-        
-        resume_skill_names = {skill['name'].lower() for skill in resume_skills}
-        
-        # Calculate critical skills match (weighted 80%)
-        critical_match = 0
-        if critical_skills:
-            critical_matches = sum(1 for skill in critical_skills if skill['name'].lower() in resume_skill_names)
-            critical_match = (critical_matches / len(critical_skills)) * 0.8
-        
-        # Calculate preferred skills match (weighted 20%)
-        preferred_match = 0
-        if preferred_skills:
-            preferred_matches = sum(1 for skill in preferred_skills if skill['name'].lower() in resume_skill_names)
-            preferred_match = (preferred_matches / len(preferred_skills)) * 0.2
-        
-        total_score = (critical_match + preferred_match) * 100
-        
-        return round(total_score, 1)
+        # Related skills earn partial credit; weights come from the scoring model
+        return self.scoring_model.score(resume_skills, required_skills)
     
     def _generate_summary(self, resume_skills: List[Dict], required_skills: List[Dict], readiness_score: float) -> Dict[str, Any]:
         """Generate a summary of the analysis"""
@@ -149,13 +145,7 @@ class GapAnalyzer:
                 weakest_areas.append(category)
         
         # Generate recommendations
-        recommendations = []
-        if readiness_score < 60:
-            recommendations.append("Focus on developing critical missing skills first")
-        elif readiness_score < 80:
-            recommendations.append("Strengthen your application by improving key skills")
-        else:
-            recommendations.append("You're well-positioned for this role")
+        recommendations = [self.scoring_model.readiness_band(readiness_score)['recommendation']]
         
         if len(weakest_areas) > 0:
             recommendations.append(f"Consider focusing on: {', '.join(weakest_areas[:3])}")
@@ -174,13 +164,4 @@ class GapAnalyzer:
     
     def _get_readiness_level(self, score: float) -> str:
         """Get readiness level based on score"""
-        if score >= 90:
-            return "Excellent"
-        elif score >= 80:
-            return "Strong"
-        elif score >= 70:
-            return "Good"
-        elif score >= 60:
-            return "Fair"
-        else:
-            return "Needs Improvement"
+        return self.scoring_model.readiness_level(score)
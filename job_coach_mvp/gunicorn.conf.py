@@ -0,0 +1,79 @@
+"""
+gunicorn settings for production:
+
+    gunicorn -c gunicorn.conf.py
+
+Analysis is CPU-bound Python, so one process per available core does the
+parsing and matching in parallel. Available cores honour the cgroup CPU
+quota (Docker, Render), since the CPU set still lists every host core, and
+the default is capped at MAX_DEFAULT_WORKERS because each worker holds its
+own copy of whatever it touches after fork. Each worker's threads cover
+requests waiting on the database, uploads, job status polls and progress
+streams. Their count doesn't follow the cores: CPU-bound analysis is already
+bounded by the admission slots (see admission.py), so threads only decide
+how many slow requests a worker can overlap. The app is preloaded in
+the master so the skill matcher, catalogs and scoring model are built once and
+shared copy-on-write; each worker then drops the inherited database pool and
+warms up in the background (see warmup.py), answering /ready once it has.
+
+WEB_CONCURRENCY and GUNICORN_THREADS override the worker and thread counts.
+"""
+
+import math
+import os
+from typing import Optional
+
+CGROUP_ROOT = '/sys/fs/cgroup'
+
+# Default worker ceiling; each preloaded worker can grow to a few hundred MB
+MAX_DEFAULT_WORKERS = 4
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: str = CGROUP_ROOT) -> Optional[float]:
+    """CPUs allowed by the cgroup quota (v2 cpu.max, else v1 CFS quota); None when unlimited"""
+    cpu_max = _read(os.path.join(root, 'cpu.max'))
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(' ')
+        if quota == 'max' or not period:
+            return None
+        return int(quota) / int(period)
+
+    quota = _read(os.path.join(root, 'cpu', 'cpu.cfs_quota_us'))
+    period = _read(os.path.join(root, 'cpu', 'cpu.cfs_period_us'))
+    if quota is None or period is None or int(quota) <= 0:
+        return None
+    return int(quota) / int(period)
+
+
+def available_cores(root: str = CGROUP_ROOT) -> int:
+    """Cores this process may use: its CPU set, limited by any cgroup CPU quota"""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    limit = cgroup_cpu_limit(root)
+    if limit is not None:
+        cores = min(cores, max(1, math.ceil(limit)))
+    return cores
+
+
+wsgi_app = 'wsgi:app'
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+preload_app = True
+workers = int(os.environ.get('WEB_CONCURRENCY', min(available_cores(), MAX_DEFAULT_WORKERS)))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = 120
+
+
+def post_fork(server, worker):
+    from app import reset_db_after_fork, warmup
+    reset_db_after_fork()
+    warmup.start()
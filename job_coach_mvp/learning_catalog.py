@@ -0,0 +1,260 @@
+"""
+Learning resource catalog for action plans.
+
+Courses, documentation links and task templates live in
+data/learning_catalog.json (override with LEARNING_CATALOG_PATH) so the
+catalog can grow and change without a redeploy. Each process loads it once
+into an immutable index and hot-reloads it when the file changes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'learning_catalog.json')
+
+# Minimum seconds between file modification checks
+RELOAD_CHECK_INTERVAL = 5.0
+
+REQUIRED_COURSE_FIELDS = ('id', 'skill', 'level', 'platform', 'title', 'url')
+
+# Standard course levels, easiest first; any other course level is a specialised
+# track (e.g. 'data_science', 'networking')
+STANDARD_LEVELS = ('beginner', 'intermediate', 'advanced')
+
+# Skill levels used by the gap analyzer that map onto catalog levels
+LEVEL_ALIASES = {'basic': 'beginner'}
+
+# Level a specialised track request falls back to when the track has no course
+TRACK_FALLBACK_LEVEL = 'intermediate'
+
+# Platforms in the order their courses are recommended
+COURSE_PLATFORMS = ('LinkedIn Learning', 'YouTube')
+
+
+def _fallback_levels(level: str, available: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Order available course levels by closeness to the requested level.
+
+    Standard levels are ranked by distance, ties going to the easier level.
+    A specialised track prefers its own course, then the standard levels
+    nearest TRACK_FALLBACK_LEVEL; other tracks are only used when a skill has
+    no standard course at all.
+    """
+    standard = [candidate for candidate in available if candidate in STANDARD_LEVELS]
+    tracks = sorted(candidate for candidate in available if candidate not in STANDARD_LEVELS)
+    anchor = STANDARD_LEVELS.index(level if level in STANDARD_LEVELS else TRACK_FALLBACK_LEVEL)
+    standard.sort(key=lambda candidate: (abs(STANDARD_LEVELS.index(candidate) - anchor),
+                                         STANDARD_LEVELS.index(candidate)))
+    if level in tracks:
+        tracks.remove(level)
+        return (level, *standard, *tracks)
+    return (*standard, *tracks)
+
+
+def documentation_resource_id(skill: str) -> str:
+    """Resource id of a skill's official documentation"""
+    return f"docs:{skill}"
+
+
+def _documentation_resource(skill: str, url: str) -> Dict[str, Any]:
+    """Plan resource entry for official documentation"""
+    return {
+        'id': documentation_resource_id(skill),
+        'name': f"Official Documentation: {skill}",
+        'url': url,
+        'type': 'documentation',
+        'platform': 'Official',
+        'priority': 'reference'
+    }
+
+
+def _course_resource(course: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plan resource entry for a catalog course"""
+    if course['platform'] == 'LinkedIn Learning':
+        return {
+            'id': course['id'],
+            'name': f"LinkedIn Learning: {course['title']}",
+            'url': course['url'],
+            'type': 'course',
+            'platform': 'LinkedIn Learning',
+            'duration': course.get('duration'),
+            'instructor': course.get('instructor'),
+            'priority': 'primary'
+        }
+    return {
+        'id': course['id'],
+        'name': f"{course['platform']}: {course['title']}",
+        'url': course['url'],
+        'type': 'video',
+        'platform': course['platform'],
+        'channel': course.get('channel'),
+        'duration': course.get('duration'),
+        'priority': 'secondary'
+    }
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to read-only equivalents"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy frozen mappings and tuples back into dicts and lists"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+class LearningCatalog:
+    """Immutable catalog indexed by (skill, level, platform)"""
+
+    def __init__(self, data: Dict[str, Any], version: Optional[str] = None):
+        courses: Dict[Tuple[str, str, str], Mapping[str, Any]] = {}
+        courses_by_id: Dict[str, Mapping[str, Any]] = {}
+        for course in data.get('courses', []):
+            missing = [field for field in REQUIRED_COURSE_FIELDS if not course.get(field)]
+            if missing:
+                raise ValueError(f"Catalog course missing fields {missing}: {course}")
+            if course['id'] in courses_by_id:
+                raise ValueError(f"Duplicate catalog course id: {course['id']}")
+            frozen = freeze(course)
+            courses[(course['skill'], course['level'], course['platform'])] = frozen
+            courses_by_id[course['id']] = frozen
+
+        self.label = data.get('version', 'unversioned')
+        self.version = version or self.content_version(data)
+        self.courses = MappingProxyType(courses)
+        self.courses_by_id = MappingProxyType(courses_by_id)
+        self.documentation = freeze(data.get('documentation', {}))
+        self.task_templates = MappingProxyType({
+            (skill, level): freeze(template)
+            for skill, levels in data.get('task_templates', {}).items()
+            for level, template in levels.items()
+        })
+        self.prerequisites = MappingProxyType({
+            skill: tuple(required) for skill, required in data.get('prerequisites', {}).items()
+        })
+        self.resources_by_id = MappingProxyType({
+            **{documentation_resource_id(skill): freeze(_documentation_resource(skill, url))
+               for skill, url in self.documentation.items()},
+            **{course_id: freeze(_course_resource(course)) for course_id, course in courses_by_id.items()}
+        })
+        self.resolutions = self._build_resolutions()
+
+    def _build_resolutions(self) -> Mapping[Tuple[str, str], Tuple[Mapping[str, Any], ...]]:
+        """Precompute the ordered resources for every (skill, requested level).
+
+        Each skill gets an entry for the standard levels, their aliases and its
+        own specialised tracks: official documentation first, then the nearest
+        course on each platform in COURSE_PLATFORMS order.
+        """
+        levels_by_skill: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        for skill, level, platform in self.courses:
+            platforms = levels_by_skill.setdefault(skill, {})
+            platforms[platform] = platforms.get(platform, ()) + (level,)
+
+        resolutions: Dict[Tuple[str, str], Tuple[Mapping[str, Any], ...]] = {}
+        for skill in set(levels_by_skill) | set(self.documentation):
+            platforms = levels_by_skill.get(skill, {})
+            tracks = {level for levels in platforms.values() for level in levels if level not in STANDARD_LEVELS}
+            docs_id = documentation_resource_id(skill)
+            docs = (self.resources_by_id[docs_id],) if docs_id in self.resources_by_id else ()
+
+            for level in STANDARD_LEVELS + tuple(sorted(tracks)):
+                resources = list(docs)
+                for platform in COURSE_PLATFORMS:
+                    available = platforms.get(platform)
+                    if available:
+                        nearest = _fallback_levels(level, available)[0]
+                        resources.append(self.resources_by_id[self.courses[(skill, nearest, platform)]['id']])
+                resolutions[(skill, level)] = tuple(resources)
+
+            for alias, level in LEVEL_ALIASES.items():
+                resolutions[(skill, alias)] = resolutions[(skill, level)]
+
+        return MappingProxyType(resolutions)
+
+    @staticmethod
+    def content_version(data: Dict[str, Any]) -> str:
+        """Version derived from the catalog content, so any edit changes it"""
+        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        return f"{data.get('version', 'unversioned')}+{hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:12]}"
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_CATALOG_PATH) -> 'LearningCatalog':
+        """Load a catalog from a JSON file"""
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls(json.load(file))
+
+    def course(self, skill: str, level: str, platform: str) -> Optional[Mapping[str, Any]]:
+        """Look up a course by (skill, level, platform)"""
+        return self.courses.get((skill, level, platform))
+
+    def resources(self, skill: str, level: str) -> Tuple[Mapping[str, Any], ...]:
+        """Ordered plan resources for a skill at a requested level"""
+        return self.resolutions.get((skill, level), ())
+
+    def documentation_url(self, skill: str) -> Optional[str]:
+        """Official documentation URL for a skill"""
+        return self.documentation.get(skill)
+
+    def task_template(self, skill: str, level: str) -> Optional[Mapping[str, Any]]:
+        """Task template for a skill at a level"""
+        return self.task_templates.get((skill, level))
+
+
+class CatalogLoader:
+    """Per-process catalog holder that reloads when the file changes"""
+
+    def __init__(self, path: str, check_interval: float = RELOAD_CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self._catalog: Optional[LearningCatalog] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> LearningCatalog:
+        """Get the current catalog, reloading it if the file has changed"""
+        now = time.monotonic()
+        if self._catalog is not None and now - self._checked_at < self.check_interval:
+            return self._catalog
+
+        with self._lock:
+            if self._catalog is not None and now - self._checked_at < self.check_interval:
+                return self._catalog
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.path)
+                if self._catalog is None or mtime != self._mtime:
+                    self._catalog, self._mtime = LearningCatalog.load(self.path), mtime
+            except (OSError, ValueError):
+                # Keep serving the last good catalog if an edit is broken or
+                # the file is briefly missing mid-deploy
+                if self._catalog is None:
+                    raise
+            return self._catalog
+
+
+_loaders: Dict[str, CatalogLoader] = {}
+_loaders_lock = threading.Lock()
+
+
+def get_catalog(path: Optional[str] = None) -> LearningCatalog:
+    """Get the per-process learning catalog (hot-reloaded on change)"""
+    path = path or os.environ.get('LEARNING_CATALOG_PATH', DEFAULT_CATALOG_PATH)
+    loader = _loaders.get(path)
+    if loader is None:
+        with _loaders_lock:
+            loader = _loaders.setdefault(path, CatalogLoader(path))
+    return loader.get()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Link health for the learning catalog.
+
+check_catalog_links() validates every course and documentation URL
+concurrently over one pooled aiohttp session. It bounds the number of
+requests in flight and sends conditional requests (If-None-Match /
+If-Modified-Since) for links it has seen before. Results go into a JSON
+cache (LINK_HEALTH_PATH, default instance/link_health.json) with separate
+TTLs for live and dead links. Timeouts are inconclusive, and a link that
+fails to connect only counts as dead after several runs in a row (never when
+nothing at all could be reached). ActionPlanGenerator leaves out every link the
+cache currently knows to be dead.
+
+Usage (from job_coach_mvp/), e.g. from a daily cron job:
+    python link_health.py --concurrency 10
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+import aiohttp
+
+from learning_catalog import DEFAULT_CATALOG_PATH, LearningCatalog
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'link_health.json')
+
+# Seconds before a live link is checked again, and before a dead one is retried
+ALIVE_TTL = 7 * 24 * 3600
+DEAD_TTL = 24 * 3600
+
+DEFAULT_CONCURRENCY = 10
+DEFAULT_TIMEOUT = 10.0
+
+# Statuses that mean the page is gone; anything else below 500 counts as
+# reachable (course sites often answer bots with 401/403/429/999)
+DEAD_STATUSES = {404, 410}
+
+# Consecutive runs a link must fail to connect (DNS, refused, TLS) before it
+# counts as dead; a single failure is often a blip on either end
+DEAD_AFTER_CONNECT_FAILURES = 3
+
+# Statuses for which servers reject HEAD, so the check is retried with GET
+HEAD_UNSUPPORTED_STATUSES = {405, 501}
+
+
+class LinkHealth:
+    """Immutable snapshot of cached link check results"""
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]]):
+        self.entries = entries
+        # A dead link stays excluded until a recheck finds it alive again
+        self.dead_urls: FrozenSet[str] = frozenset(
+            url for url, entry in entries.items() if not entry.get('ok', True)
+        )
+        self.version = hashlib.sha256('\n'.join(sorted(self.dead_urls)).encode('utf-8')).hexdigest()[:12]
+
+    def is_dead(self, url: str) -> bool:
+        """Whether the link is known to be dead"""
+        return url in self.dead_urls
+
+    def needs_check(self, url: str, now: Optional[float] = None) -> bool:
+        """Whether the link has no unexpired result"""
+        entry = self.entries.get(url)
+        if entry is None:
+            return True
+        ttl = ALIVE_TTL if entry.get('ok', True) else DEAD_TTL
+        return (time.time() if now is None else now) - entry.get('checked_at', 0) >= ttl
+
+
+EMPTY_LINK_HEALTH = LinkHealth({})
+
+
+def load_cache(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read cached results, or nothing if the cache doesn't exist yet"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save_cache(path: str, entries: Dict[str, Dict[str, Any]]):
+    """Atomically replace the cache file"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(entries, file, indent=2, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def catalog_urls(catalog: LearningCatalog) -> List[str]:
+    """Every distinct URL plans can link to"""
+    return sorted({resource['url'] for resource in catalog.resources_by_id.values()})
+
+
+async def _check_url(session, semaphore: asyncio.Semaphore, url: str,
+                     previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Check one URL; None when the result is inconclusive (timeouts, 5xx)"""
+    headers = {}
+    if previous and previous.get('ok', True):
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
+
+    async with semaphore:
+        try:
+            async with session.head(url, headers=headers, allow_redirects=True) as response:
+                status, response_headers = response.status, response.headers
+            if status in HEAD_UNSUPPORTED_STATUSES:
+                async with session.get(url, headers=headers, allow_redirects=True) as response:
+                    status, response_headers = response.status, response.headers
+        except aiohttp.ClientConnectorError:
+            return _connect_failure(url, previous)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+    if status is not None and status >= 500:
+        return None
+
+    entry = {'url': url, 'status': status, 'checked_at': time.time()}
+    if status == 304 and previous:
+        entry.update(ok=True, etag=previous.get('etag'), last_modified=previous.get('last_modified'))
+    else:
+        entry.update(
+            ok=status is not None and status not in DEAD_STATUSES,
+            etag=response_headers.get('ETag'),
+            last_modified=response_headers.get('Last-Modified')
+        )
+    return entry
+
+
+def _connect_failure(url: str, previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Count a failed connection; the link is dead after DEAD_AFTER_CONNECT_FAILURES in a row"""
+    failures = (previous or {}).get('connect_failures', 0) + 1
+    if failures < DEAD_AFTER_CONNECT_FAILURES:
+        # Keep the last verdict and its checked_at, so the link is retried next run
+        entry = dict(previous) if previous else {'url': url, 'ok': True}
+        entry['connect_failures'] = failures
+        return entry
+    return {'url': url, 'status': None, 'checked_at': time.time(), 'ok': False, 'connect_failures': failures}
+
+
+async def check_urls(urls: Iterable[str], entries: Dict[str, Dict[str, Any]],
+                     concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                     force: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Check URLs whose cached result expired, returning the updated cache"""
+    snapshot = LinkHealth(entries)
+    pending = [url for url in dict.fromkeys(urls) if force or snapshot.needs_check(url)]
+    if not pending:
+        return dict(entries)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers={'User-Agent': 'job-coach-link-checker'}) as session:
+        results = await asyncio.gather(*(
+            _check_url(session, semaphore, url, entries.get(url)) for url in pending
+        ))
+
+    # If none of several links could be reached, the outage is on this host's side
+    if len(pending) > 1 and all(entry is not None and 'connect_failures' in entry for entry in results):
+        return dict(entries)
+
+    updated = dict(entries)
+    for url, entry in zip(pending, results):
+        if entry is not None:
+            updated[url] = entry
+    return updated
+
+
+def check_catalog_links(catalog: LearningCatalog, cache_path: str = DEFAULT_CACHE_PATH,
+                        concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                        force: bool = False) -> LinkHealth:
+    """Check the catalog's links and persist the results"""
+    entries = asyncio.run(check_urls(catalog_urls(catalog), load_cache(cache_path), concurrency, timeout, force))
+    save_cache(cache_path, entries)
+    return LinkHealth(entries)
+
+
+class LinkHealthLoader:
+    """Per-process cache reader that reloads when the file changes"""
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._health = EMPTY_LINK_HEALTH
+        self._mtime: Optional[float] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> LinkHealth:
+        """Current link health (empty until a check has been run)"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return self._health
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                return self._health
+            if mtime != self._mtime:
+                try:
+                    self._health = LinkHealth(load_cache(self.path))
+                    self._mtime = mtime
+                except (OSError, ValueError):
+                    pass
+            return self._health
+
+
+_loaders: Dict[str, LinkHealthLoader] = {}
+_loaders_lock = threading.Lock()
+
+
+def get_link_health(path: Optional[str] = None) -> LinkHealth:
+    """Get the per-process link health snapshot"""
+    path = path or os.environ.get('LINK_HEALTH_PATH', DEFAULT_CACHE_PATH)
+    loader = _loaders.get(path)
+    if loader is None:
+        with _loaders_lock:
+            loader = _loaders.setdefault(path, LinkHealthLoader(path))
+    return loader.get()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', default=os.environ.get('LEARNING_CATALOG_PATH', DEFAULT_CATALOG_PATH))
+    parser.add_argument('--cache', default=os.environ.get('LINK_HEALTH_PATH', DEFAULT_CACHE_PATH))
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Seconds per request')
+    parser.add_argument('--force', action='store_true', help='Recheck links whose results have not expired')
+    args = parser.parse_args(argv)
+
+    catalog = LearningCatalog.load(args.catalog)
+    health = check_catalog_links(catalog, args.cache, args.concurrency, args.timeout, args.force)
+
+    print(f"Checked {len(catalog_urls(catalog))} links, {len(health.dead_urls)} dead")
+    for url in sorted(health.dead_urls):
+        print(f"  dead: {url}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Prometheus-style metrics for the web app.
+
+instrument_app() records, per process:
+
+- request counts by route, method and status, and latency histograms per route
+  (streamed responses are timed until their body has been sent)
+- uploaded resume sizes, and page counts of uploaded PDFs
+- database query latency by statement type (SELECT, INSERT, ...)
+- hit and miss counts, and hit ratios, of registered caches
+- the pipeline stage histograms collected by pipeline_timing
+
+GET /metrics renders them in the Prometheus text exposition format. Metrics
+are per process, so with several gunicorn workers each scrape sees one
+worker; give each worker its own target or aggregate over scrapes.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from pipeline_timing import DEFAULT_BUCKETS, STAGE_TIMINGS, Histogram, recording
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upload size bucket upper bounds in bytes (the upload limit is 16 MB)
+SIZE_BUCKETS = (10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 2_000_000, 5_000_000, 10_000_000, 16_000_000)
+
+# PDF page count bucket upper bounds
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 250, 500)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """Render a label set like {route="/upload",le="0.5"}"""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    """Escape a label value"""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value"""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1):
+        """Add to the counter for a label set"""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        """Current value for a label set"""
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        """Exposition lines"""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        lines.extend(f'{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}'
+                     for labels, value in values)
+        return lines
+
+
+class HistogramFamily:
+    """pipeline_timing Histograms keyed by label values"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = buckets
+        self._histograms: Dict[LabelValues, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        """Record one observation for a label set"""
+        histogram = self._histograms.get(label_values)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(label_values, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def histogram(self, *label_values: str) -> Optional[Histogram]:
+        """Histogram for a label set, if it has been observed"""
+        return self._histograms.get(label_values)
+
+    def render(self) -> List[str]:
+        """Exposition lines"""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        return render_histograms(self.name, self.documentation, self.label_names,
+                                 ((labels, histogram.snapshot()) for labels, histogram in histograms))
+
+
+def render_histograms(name: str, documentation: str, label_names: Sequence[str],
+                      snapshots: Iterable[Tuple[LabelValues, Dict[str, object]]]) -> List[str]:
+    """Exposition lines for histogram snapshots"""
+    lines = [f'# HELP {name} {documentation}', f'# TYPE {name} histogram']
+    for labels, snapshot in snapshots:
+        for bound, count in snapshot['buckets']:
+            bucket_labels = _format_labels(label_names, labels, f'le="{_format_value(bound)}"')
+            lines.append(f'{name}_bucket{bucket_labels} {count}')
+        lines.append(f"{name}_sum{_format_labels(label_names, labels)} {_format_value(float(snapshot['sum']))}")
+        lines.append(f"{name}_count{_format_labels(label_names, labels)} {snapshot['count']}")
+    return lines
+
+
+REQUESTS = Counter('job_coach_http_requests_total', 'HTTP requests served.', ('route', 'method', 'status'))
+REQUEST_LATENCY = HistogramFamily('job_coach_http_request_duration_seconds',
+                                  'HTTP request latency by route.', ('route',))
+UPLOAD_SIZE = HistogramFamily('job_coach_upload_size_bytes', 'Size of uploaded resume files.',
+                              ('format',), SIZE_BUCKETS)
+UPLOAD_PAGES = HistogramFamily('job_coach_upload_pages', 'Page count of uploaded PDF resumes.', (), PAGE_BUCKETS)
+DB_QUERY_LATENCY = HistogramFamily('job_coach_db_query_duration_seconds',
+                                   'Database query latency by statement type.', ('statement',))
+
+# name -> callable returning (hits, misses)
+_caches: Dict[str, Callable[[], Tuple[int, int]]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], Tuple[int, int]]):
+    """Expose a cache's hit and miss counts"""
+    _caches[name] = stats
+
+
+def _render_caches() -> List[str]:
+    """Exposition lines for registered caches"""
+    stats = {name: stats() for name, stats in sorted(_caches.items())}
+    lines = ['# HELP job_coach_cache_hits_total Cache hits.', '# TYPE job_coach_cache_hits_total counter']
+    lines.extend(f'job_coach_cache_hits_total{{cache="{name}"}} {hits}' for name, (hits, _) in stats.items())
+    lines += ['# HELP job_coach_cache_misses_total Cache misses.', '# TYPE job_coach_cache_misses_total counter']
+    lines.extend(f'job_coach_cache_misses_total{{cache="{name}"}} {misses}' for name, (_, misses) in stats.items())
+    lines += ['# HELP job_coach_cache_hit_ratio Share of cache lookups that hit.',
+              '# TYPE job_coach_cache_hit_ratio gauge']
+    lines.extend(f'job_coach_cache_hit_ratio{{cache="{name}"}} {_format_value(hits / (hits + misses))}'
+                 for name, (hits, misses) in stats.items() if hits + misses)
+    return lines
+
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text format"""
+    lines: List[str] = []
+    for metric in (REQUESTS, REQUEST_LATENCY, UPLOAD_SIZE, UPLOAD_PAGES, DB_QUERY_LATENCY):
+        lines.extend(metric.render())
+    lines.extend(_render_caches())
+    stages = [((stage,), snapshot) for stage, snapshot in STAGE_TIMINGS.snapshot().items()]
+    lines.extend(render_histograms('job_coach_pipeline_stage_duration_seconds', 'Pipeline stage latency.',
+                                   ('stage',), stages))
+    return '\n'.join(lines) + '\n'
+
+
+def _statement_type(statement: str) -> str:
+    """SELECT, INSERT, UPDATE, DELETE or OTHER"""
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ''
+    return verb if verb in ('SELECT', 'INSERT', 'UPDATE', 'DELETE') else 'OTHER'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not recording():
+        return
+    conn.info.setdefault('query_start_times', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not recording():
+        return
+    start_times = conn.info.get('query_start_times')
+    if start_times:
+        DB_QUERY_LATENCY.observe(time.perf_counter() - start_times.pop(), _statement_type(statement))
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    connection = context.connection
+    if not recording():
+        return
+    start_times = connection.info.get('query_start_times') if connection is not None else None
+    if start_times and context.execution_context is not None:
+        start_times.pop()
+
+
+def _start_request_timer():
+    g.request_start_time = time.perf_counter()
+
+
+def _record_request(response):
+    start = g.pop('request_start_time', None)
+    # Label by URL rule so ids don't multiply the series
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    REQUESTS.inc(route, request.method, str(response.status_code))
+    if start is None:
+        return response
+    if response.is_streamed:
+        # The body is generated after this hook runs; time it until the server closes it
+        response.call_on_close(lambda: REQUEST_LATENCY.observe(time.perf_counter() - start, route))
+    else:
+        REQUEST_LATENCY.observe(time.perf_counter() - start, route)
+    return response
+
+
+_db_instrumented = False
+
+
+def instrument_app(app):
+    """Record request and database query metrics for an app"""
+    global _db_instrumented
+    app.before_request(_start_request_timer)
+    app.after_request(_record_request)
+    if not _db_instrumented:
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+        _db_instrumented = True
@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 from datetime import datetime
 
 db = SQLAlchemy()
@@ -11,12 +12,83 @@ class Analysis(db.Model):
     required_skills = db.Column(db.JSON)   # Job requirements
     skill_gaps = db.Column(db.JSON)        # Calculated gaps
     readiness_score = db.Column(db.Float)  # Overall match percentage
+    stage_timings = db.Column(db.JSON)     # Per-stage pipeline latency (ms)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class ActionPlan(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    analysis_id = db.Column(db.Integer, db.ForeignKey('analysis.id'))
+    analysis_id = db.Column(db.Integer, db.ForeignKey('analysis.id'), unique=True)  # One plan per analysis
     tasks = db.Column(db.JSON)             # Generated tasks
     completed_tasks = db.Column(db.JSON, default=[])
     updated_readiness_score = db.Column(db.Float)
+    hours_per_week = db.Column(db.Integer, default=10)  # Weekly study budget for scheduling
+    version_id = db.Column(db.Integer, nullable=False)  # Bumped on every update; used for HTTP validators
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __mapper_args__ = {'version_id_col': version_id}
+
+class AnalysisJob(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(16), default='queued', index=True)  # queued, running, done or failed
+    resume_path = db.Column(db.String(255))    # Saved upload awaiting extraction
+    upload_bytes = db.Column(db.Integer)       # Size of the saved upload; large ones need an expensive slot
+    job_description = db.Column(db.Text)
+    analysis_id = db.Column(db.Integer, db.ForeignKey('analysis.id'))
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, default=0)
+    lease_expires_at = db.Column(db.DateTime)  # A running job past its lease is reclaimed
+    stage_timings = db.Column(db.JSON)         # Request-side stage latency (ms)
+    progress = db.Column(db.JSON)              # Finished pipeline stages, streamed by /jobs/<id>/events
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+# Values for rows stored before a column existed
+COLUMN_BACKFILLS = {
+    ('action_plan', 'version_id'): 1,
+    ('action_plan', 'hours_per_week'): 10,
+}
+
+def upgrade_schema():
+    """Bring tables created by an older release up to the current models.
+    
+    create_all() creates missing tables but never alters existing ones. This
+    adds each missing column with ALTER TABLE (nullable, so it works on
+    tables with rows), fills COLUMN_BACKFILLS into old rows, and adds the
+    one-plan-per-analysis unique index, dropping all but the first plan of an
+    analysis that has duplicates. Returns the columns added as "table.column".
+    """
+    inspector = inspect(db.engine)
+    added = []
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                added.append(f'{table.name}.{column.name}')
+        
+        for (table_name, column_name), value in COLUMN_BACKFILLS.items():
+            if inspector.has_table(table_name):
+                connection.execute(text(f'UPDATE {table_name} SET {column_name} = :value WHERE {column_name} IS NULL'),
+                                   {'value': value})
+        
+        if not _has_unique_analysis_id(inspector):
+            connection.execute(text('DELETE FROM action_plan WHERE id NOT IN '
+                                    '(SELECT MIN(id) FROM action_plan GROUP BY analysis_id)'))
+            connection.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS ix_action_plan_analysis_id '
+                                    'ON action_plan (analysis_id)'))
+    return added
+
+def _has_unique_analysis_id(inspector):
+    """Whether action_plan.analysis_id already has a unique constraint or index"""
+    if not inspector.has_table('action_plan'):
+        return True
+    unique = [constraint['column_names'] for constraint in inspector.get_unique_constraints('action_plan')]
+    unique += [index['column_names'] for index in inspector.get_indexes('action_plan') if index['unique']]
+    return ['analysis_id'] in unique
@@ -0,0 +1,108 @@
+"""
+HTTP conditional caching and rendered page caching.
+
+An Analysis changes only when rescore-analyses updates its score, and an
+ActionPlan changes only when a task is toggled, the plan is regenerated or
+its weekly budget changes; each of those bumps ActionPlan.version_id. Pages
+get a validator (ETag) built from those versions plus anything else that
+changes their HTML (the learning catalog, link health and the deployed
+templates), so browsers revalidate with If-None-Match and get a 304 without
+the page being rendered. Pages carry no Last-Modified: no timestamp covers all
+of those inputs, and an If-Modified-Since match would serve stale HTML.
+
+Rendered HTML is also kept in a small per-process LRU keyed by analysis and
+validator. Routes that change a plan drop that analysis's entries; stale
+entries could never be served anyway, since their validator no longer
+matches.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from flask import Response, make_response, request
+from werkzeug.http import is_resource_modified
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Rendered pages kept per process
+DEFAULT_PAGE_CACHE_SIZE = 256
+
+
+def render_version(*directories: str) -> str:
+    """Fingerprint of the files a page render depends on"""
+    digest = hashlib.sha256()
+    for directory in directories:
+        for root, _, files in sorted(os.walk(directory)):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, directory).encode('utf-8'))
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()[:12]
+
+
+RENDER_VERSION = render_version(os.path.join(APP_DIR, 'templates'), os.path.join(APP_DIR, 'static'))
+
+
+def make_etag(*parts: Hashable) -> str:
+    """Validator for a page built from the given versions"""
+    return hashlib.sha256(repr((RENDER_VERSION,) + parts).encode('utf-8')).hexdigest()[:20]
+
+
+class PageCache:
+    """Thread-safe LRU of rendered pages keyed by (analysis id, etag)"""
+
+    def __init__(self, max_size: int = DEFAULT_PAGE_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._pages: 'OrderedDict[Tuple[int, str], str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, analysis_id: int, etag: str, render: Callable[[], str]) -> str:
+        """Cached HTML for the page, rendering it on a miss"""
+        key = (analysis_id, etag)
+        with self._lock:
+            html = self._pages.get(key)
+            if html is not None:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = render()
+        with self._lock:
+            self._pages[key] = html
+            if len(self._pages) > self.max_size:
+                self._pages.popitem(last=False)
+        return html
+
+    def invalidate(self, analysis_id: int):
+        """Drop every cached page of an analysis"""
+        with self._lock:
+            for key in [key for key in self._pages if key[0] == analysis_id]:
+                del self._pages[key]
+
+    def clear(self):
+        """Drop all cached pages"""
+        with self._lock:
+            self._pages.clear()
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """304 response when the client's copy is current, else None"""
+    if is_resource_modified(request.environ, etag=etag):
+        return None
+    response = make_response('', 304)
+    return with_validators(response, etag)
+
+
+def with_validators(response: Response, etag: str) -> Response:
+    """Add the validator, making browsers revalidate before reusing the page"""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,180 @@
+"""
+Lightweight per-stage timing for the analysis and action plan pipelines.
+
+Usage:
+    with pipeline_timing.start_trace() as trace:
+        with pipeline_timing.span('upload.extract_text'):
+            ...
+    trace.breakdown()  # {'upload.extract_text': 12.3, 'total': 12.3}
+
+Every span feeds an in-process latency histogram per stage and, when a trace
+is active, the trace's stage breakdown. Set PIPELINE_TIMING=0 to disable; a
+disabled span is a shared no-op context manager. Work run inside unrecorded()
+(process warm-up) stays out of the histograms and cache statistics.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ENABLED = os.environ.get('PIPELINE_TIMING', '1') != '0'
+
+# Latency bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_NULL_SPAN = nullcontext()
+_current_trace: ContextVar[Optional['Trace']] = ContextVar('pipeline_trace', default=None)
+_recording: ContextVar[bool] = ContextVar('pipeline_recording', default=True)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one observation"""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, object]:
+        """Get cumulative bucket counts, sum and count"""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        cumulative: List[Tuple[float, int]] = []
+        running = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            running += count
+            cumulative.append((bound, running))
+
+        return {'buckets': cumulative, 'sum': total, 'count': running}
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket containing it"""
+        snapshot = self.snapshot()
+        if not snapshot['count']:
+            return None
+        target = q * snapshot['count']
+        for bound, count in snapshot['buckets']:
+            if count >= target:
+                return bound
+        return float('inf')
+
+
+class StageTimings:
+    """Latency histograms keyed by pipeline stage"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float):
+        """Record one stage duration"""
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    def histogram(self, stage: str) -> Optional[Histogram]:
+        """Get the histogram for a stage, if it has been observed"""
+        return self._histograms.get(stage)
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Get a snapshot of every stage histogram"""
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {stage: histogram.snapshot() for stage, histogram in sorted(histograms.items())}
+
+    def reset(self):
+        """Drop all recorded timings"""
+        with self._lock:
+            self._histograms.clear()
+
+
+STAGE_TIMINGS = StageTimings()
+
+
+class Trace:
+    """Stage breakdown for a single request"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float):
+        """Add time to a stage (repeated stages accumulate)"""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def breakdown(self) -> Dict[str, float]:
+        """Get stage durations in milliseconds, plus their total"""
+        result = {stage: round(seconds * 1000, 2) for stage, seconds in self.stages.items()}
+        result['total'] = round(sum(self.stages.values()) * 1000, 2)
+        return result
+
+
+class _Span:
+    """Times one stage into the stage histograms and the active trace"""
+
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        STAGE_TIMINGS.observe(self.stage, elapsed)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add(self.stage, elapsed)
+        return False
+
+
+def span(stage: str):
+    """Time a pipeline stage"""
+    if not ENABLED or not _recording.get():
+        return _NULL_SPAN
+    return _Span(stage)
+
+
+def recording() -> bool:
+    """Whether metrics from the current context are recorded"""
+    return _recording.get()
+
+
+@contextmanager
+def unrecorded() -> Iterator[None]:
+    """Keep the spans, queries and cache lookups run inside this block out of the metrics"""
+    token = _recording.set(False)
+    try:
+        yield
+    finally:
+        _recording.reset(token)
+
+
+@contextmanager
+def start_trace() -> Iterator[Trace]:
+    """Collect a stage breakdown for the spans run inside this block"""
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
@@ -0,0 +1,47 @@
+"""
+Diffing for action plan regeneration.
+
+Regenerating a plan compares the freshly generated tasks with the stored ones
+by task id, so only what actually changed is written back and completion
+state survives for tasks that are still in the plan.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class PlanDiff:
+    """Added, removed and changed tasks between a stored and a new plan"""
+
+    def __init__(self, old_tasks: Sequence[Dict[str, Any]], new_tasks: Sequence[Dict[str, Any]]):
+        old_by_id = {task['id']: task for task in old_tasks or []}
+        new_by_id = {task['id']: task for task in new_tasks or []}
+
+        self.added: List[str] = [task_id for task_id in new_by_id if task_id not in old_by_id]
+        self.removed: List[str] = [task_id for task_id in old_by_id if task_id not in new_by_id]
+        self.changed: List[str] = [
+            task_id for task_id, task in new_by_id.items()
+            if task_id in old_by_id and old_by_id[task_id] != task
+        ]
+        # Same tasks in a different order still need the new order stored
+        self.reordered = (
+            not (self.added or self.removed)
+            and [task['id'] for task in old_tasks or []] != [task['id'] for task in new_tasks or []]
+        )
+        self.surviving_ids = set(new_by_id) & set(old_by_id)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the new plan is identical to the stored one"""
+        return not (self.added or self.removed or self.changed or self.reordered)
+
+    def prune_completed(self, completed_tasks: Optional[Sequence[str]]) -> List[str]:
+        """Completed task ids that are still in the plan, in their original order"""
+        return [task_id for task_id in completed_tasks or [] if task_id in self.surviving_ids]
+
+    def summary(self) -> str:
+        """Short human readable description of the change"""
+        if self.is_empty:
+            return 'no changes'
+        parts = [f"{len(ids)} {label}" for label, ids in
+                 (('added', self.added), ('removed', self.removed), ('changed', self.changed)) if ids]
+        return ', '.join(parts) or 'tasks reordered'
@@ -0,0 +1,81 @@
+"""
+Single-flight background execution for speculative action plan generation.
+
+/upload submits the new analysis id as soon as the analysis is committed, so
+its action plan is usually stored before the user first opens it. Any
+request for an id already in flight waits on that same future instead of
+generating a duplicate plan.
+
+The thread pool is created lazily and recreated after a fork, so it is safe
+under gunicorn's preload mode where the app is imported before workers fork.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+DEFAULT_MAX_WORKERS = 2
+
+
+class SingleFlightPrefetcher:
+    """Run fn(key) in the background at most once at a time per key"""
+
+    def __init__(self, fn: Callable[[Hashable], Any], max_workers: int = DEFAULT_MAX_WORKERS, eager: bool = False):
+        self.fn = fn
+        self.max_workers = max_workers
+        # Eager mode runs work inline on submit (tests, single-threaded tools)
+        self.eager = eager
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._in_flight: Dict[Hashable, Future] = {}
+        # Re-entrant: a future that is already done runs its callback inside submit
+        self._lock = threading.RLock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for this process (threads don't survive a fork)"""
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='plan-prefetch')
+            self._pid = os.getpid()
+            self._in_flight = {}
+        return self._executor
+
+    def submit(self, key: Hashable) -> Future:
+        """Start fn(key) unless it is already running, and return its future"""
+        if self.eager:
+            future: Future = Future()
+            try:
+                future.set_result(self.fn(key))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        with self._lock:
+            executor = self._get_executor()
+            future = self._in_flight.get(key)
+            if future is None:
+                future = executor.submit(self.fn, key)
+                self._in_flight[key] = future
+                future.add_done_callback(lambda done, key=key: self._finished(key, done))
+            return future
+
+    def _finished(self, key: Hashable, future: Future):
+        """Forget a completed future so later submits run fn again"""
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def in_flight(self, key: Hashable) -> Optional[Future]:
+        """Future for a key that is currently running, if any"""
+        with self._lock:
+            if self._pid != os.getpid():
+                return None
+            return self._in_flight.get(key)
+
+    def wait(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """Wait for in-flight work on a key; False if nothing was running"""
+        future = self.in_flight(key)
+        if future is None:
+            return False
+        future.result(timeout=timeout)
+        return True
@@ -0,0 +1,122 @@
+"""
+Capacity-aware weekly scheduling for action plan tasks.
+
+Tasks are ordered by priority with a heap-based topological sort, so a
+prerequisite (e.g. Docker) is always scheduled before the tasks that build
+on it (e.g. Kubernetes), then packed back to back into weeks of the user's
+hours-per-week budget. Scheduling n tasks with e prerequisite edges is
+O((n + e) log n), cheap enough to rerun on every task toggle.
+"""
+
+import heapq
+import math
+from typing import Any, Collection, Dict, List, Mapping, Sequence
+
+DEFAULT_HOURS_PER_WEEK = 10
+
+# Scheduling order of task priorities
+PRIORITY_RANK = {'critical': 0, 'high': 1, 'preferred': 2}
+
+COMPLETED_TIMELINE = 'Completed'
+
+
+def weeks_needed(total_hours: float, hours_per_week: float = DEFAULT_HOURS_PER_WEEK) -> int:
+    """Whole weeks needed to fit total_hours into the weekly budget"""
+    return max(1, math.ceil(total_hours / hours_per_week))
+
+
+def format_weeks(weeks: int) -> str:
+    """Human readable plan duration"""
+    if weeks == 1:
+        return "1 week"
+    elif weeks <= 4:
+        return f"{weeks} weeks"
+    months = round(weeks / 4, 1)
+    return f"{months} months"
+
+
+def format_week_range(first_week: int, last_week: int) -> str:
+    """Timeline label for a task spanning first_week..last_week"""
+    if first_week == last_week:
+        return f"Week {first_week}"
+    return f"Week {first_week}-{last_week}"
+
+
+def order_tasks(tasks: Sequence[Mapping[str, Any]],
+                prerequisites: Mapping[str, Sequence[str]]) -> List[int]:
+    """Topologically order task indexes, most important ready task first.
+
+    A task depends on every other task in the plan whose skill is one of its
+    skill's prerequisites. Among tasks whose prerequisites are done, the heap
+    picks the highest priority, then the earliest in the plan. Tasks caught in
+    a prerequisite cycle keep their priority order after the rest.
+    """
+    indexes_by_skill: Dict[str, List[int]] = {}
+    for index, task in enumerate(tasks):
+        indexes_by_skill.setdefault(task['skill'], []).append(index)
+
+    dependents: List[List[int]] = [[] for _ in tasks]
+    pending = [0] * len(tasks)
+    for index, task in enumerate(tasks):
+        for prerequisite in prerequisites.get(task['skill'], ()):
+            for before in indexes_by_skill.get(prerequisite, ()):
+                if before != index:
+                    dependents[before].append(index)
+                    pending[index] += 1
+
+    def rank(index: int):
+        return PRIORITY_RANK.get(tasks[index].get('priority'), len(PRIORITY_RANK)), index
+
+    ready = [rank(index) for index in range(len(tasks)) if not pending[index]]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in dependents[index]:
+            pending[dependent] -= 1
+            if not pending[dependent]:
+                heapq.heappush(ready, rank(dependent))
+
+    if len(order) < len(tasks):
+        scheduled = set(order)
+        order.extend(sorted((index for index in range(len(tasks)) if index not in scheduled), key=rank))
+    return order
+
+
+def schedule_tasks(tasks: Sequence[Mapping[str, Any]], hours_per_week: float = DEFAULT_HOURS_PER_WEEK,
+                   prerequisites: Mapping[str, Sequence[str]] = None,
+                   completed: Collection[str] = ()) -> Dict[str, Any]:
+    """Pack open tasks into weeks of hours_per_week.
+
+    Returns the timeline label for each task id (completed tasks are marked
+    COMPLETED_TIMELINE) and the number of weeks the open tasks take.
+    """
+    if hours_per_week <= 0:
+        raise ValueError("hours_per_week must be positive")
+
+    completed = set(completed)
+    open_tasks = [task for task in tasks if task['id'] not in completed]
+    timelines = {task['id']: COMPLETED_TIMELINE for task in tasks if task['id'] in completed}
+
+    hours_used = 0.0
+    for index in order_tasks(open_tasks, prerequisites or {}):
+        task = open_tasks[index]
+        hours = max(0.0, float(task.get('estimated_hours') or 0))
+        first_week = int(hours_used // hours_per_week) + 1
+        hours_used += hours
+        last_week = max(first_week, math.ceil(hours_used / hours_per_week))
+        timelines[task['id']] = format_week_range(first_week, last_week)
+
+    return {
+        'timelines': timelines,
+        'total_weeks': weeks_needed(hours_used, hours_per_week) if open_tasks else 0
+    }
+
+
+def apply_schedule(tasks: List[Dict[str, Any]], hours_per_week: float = DEFAULT_HOURS_PER_WEEK,
+                   prerequisites: Mapping[str, Sequence[str]] = None,
+                   completed: Collection[str] = ()) -> List[Dict[str, Any]]:
+    """Copy tasks with their scheduled timeline filled in"""
+    timelines = schedule_tasks(tasks, hours_per_week, prerequisites, completed)['timelines']
+    return [dict(task, timeline=timelines[task['id']]) for task in tasks]
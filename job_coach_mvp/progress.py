@@ -0,0 +1,87 @@
+"""
+Per-stage progress of analysis jobs, streamed as server-sent events.
+
+The analysis pipeline appends each finished stage to AnalysisJob.progress and
+calls ProgressBroker.notify(job_id). A progress stream (GET
+/jobs/<id>/events) sends every stage it hasn't sent yet over one long-lived
+connection:
+
+    pages_extracted   {"pages": 3}            (PDFs only)
+    skills_matched    {"skills": 12, "required": 8}
+    gaps_computed     {"gaps": 4, "readiness_score": 62.5}
+    plan_ready        {"action_plan_url": ...}
+    done              {"analysis_url": ...}
+    failed            {"error": ...}
+
+notify() wakes streams in the same process at once. Streams served by another
+gunicorn worker re-read the job every POLL_INTERVAL seconds. Each stream ends
+after STREAM_SECONDS; EventSource then reconnects with Last-Event-ID and
+resumes. A stream holds a server thread, so at most MAX_STREAMS run per
+process. Beyond that a stream sends a single `unavailable` event, and the
+progress page falls back to polling /jobs/<id>/status, as it does when the
+browser has no EventSource.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+# Seconds between re-reads of a job when no notification arrives
+POLL_INTERVAL = 0.5
+
+# Seconds a stream stays open before the client reconnects
+STREAM_SECONDS = 30
+
+# Seconds between keep-alive comments on an idle stream
+KEEPALIVE_SECONDS = 10
+
+# Concurrent streams per process
+MAX_STREAMS = int(os.environ.get('PROGRESS_STREAMS', 2))
+
+EVENT_STREAM_MIMETYPE = 'text/event-stream'
+
+
+def format_event(event: str, data: Dict[str, object], event_id: Optional[int] = None) -> str:
+    """One server-sent event"""
+    lines = [] if event_id is None else [f'id: {event_id}']
+    lines += [f'event: {event}', f'data: {json.dumps(data)}']
+    return '\n'.join(lines) + '\n\n'
+
+
+class ProgressBroker:
+    """Wakes progress streams when a job in this process records a stage"""
+
+    def __init__(self, max_streams: int = MAX_STREAMS):
+        self._versions: Dict[int, int] = {}
+        self._condition = threading.Condition()
+        self._streams = threading.BoundedSemaphore(max_streams)
+
+    def notify(self, job_id: int):
+        """Signal that a job's progress changed"""
+        with self._condition:
+            self._versions[job_id] = self._versions.get(job_id, 0) + 1
+            self._condition.notify_all()
+
+    def version(self, job_id: int) -> int:
+        """Change counter of a job, to pass to wait()"""
+        with self._condition:
+            return self._versions.get(job_id, 0)
+
+    def wait(self, job_id: int, version: int, timeout: float) -> bool:
+        """Wait for a change after version; False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._versions.get(job_id, 0) != version, timeout)
+
+    def forget(self, job_id: int):
+        """Drop a finished job's counter, after its last notify()"""
+        with self._condition:
+            self._versions.pop(job_id, None)
+
+    def open_stream(self) -> bool:
+        """Reserve a stream slot; False when the process has no slot free"""
+        return self._streams.acquire(blocking=False)
+
+    def close_stream(self):
+        """Give back a stream slot"""
+        self._streams.release()
@@ -0,0 +1,235 @@
+"""
+Configurable readiness scoring model.
+
+A readiness score is a dot product between a per-requirement weight vector
+(importance share x category weight) and a credit vector (skill relatedness
+x level-gap credit). Many analyses can be rescored in one batched pass.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from skill_relatedness import SkillRelatedness, get_skill_relatedness
+
+LEVEL_HIERARCHY = {'basic': 1, 'intermediate': 2, 'advanced': 3}
+
+DEFAULT_SCORING_CONFIG: Dict[str, Any] = {
+    # Share of the total score for each importance group; unlisted importances
+    # fall into the default group
+    'importance_weights': {'critical': 0.8, 'preferred': 0.2},
+    'default_importance': 'preferred',
+    # Relative weight of a requirement within its importance group
+    'category_weights': {},
+    'default_category_weight': 1.0,
+    # Credit kept for a matched skill that is N levels below the requirement
+    'level_gap_credit': {'0': 1.0, '1': 1.0, '2': 1.0},
+    # Readiness labels, highest threshold first
+    'readiness_levels': [
+        {'min_score': 90, 'label': 'Excellent'},
+        {'min_score': 80, 'label': 'Strong'},
+        {'min_score': 70, 'label': 'Good'},
+        {'min_score': 60, 'label': 'Fair'},
+        {'min_score': 0, 'label': 'Needs Improvement'}
+    ],
+    # Bands shown on the analysis page and used for summary recommendations
+    'readiness_bands': [
+        {'min_score': 80, 'icon': '🟢', 'message': 'Ready to apply! Minor improvements suggested',
+         'recommendation': "You're well-positioned for this role"},
+        {'min_score': 60, 'icon': '🟡', 'message': 'Good foundation, key skills missing',
+         'recommendation': 'Strengthen your application by improving key skills'},
+        {'min_score': 0, 'icon': '🔴', 'message': 'Significant skill development needed',
+         'recommendation': 'Focus on developing critical missing skills first'}
+    ]
+}
+
+SkillPair = Tuple[List[Dict], List[Dict]]
+
+
+class ScoringModel:
+    """Weights and readiness thresholds used to score resume/job matches"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 relatedness: Optional[SkillRelatedness] = None):
+        config = config or {}
+        unknown_keys = set(config) - set(DEFAULT_SCORING_CONFIG)
+        if unknown_keys:
+            raise ValueError(f"Unknown scoring config keys: {', '.join(sorted(unknown_keys))}")
+
+        self.config = {**DEFAULT_SCORING_CONFIG, **config}
+        self.relatedness = relatedness or get_skill_relatedness()
+
+        self.importance_weights: Dict[str, float] = dict(self.config['importance_weights'])
+        self.default_importance: str = self.config['default_importance']
+        self.category_weights: Dict[str, float] = dict(self.config['category_weights'])
+        self.default_category_weight = float(self.config['default_category_weight'])
+        self.level_gap_credit = {int(gap): float(credit) for gap, credit in self.config['level_gap_credit'].items()}
+        self.readiness_levels = sorted(self.config['readiness_levels'], key=lambda l: l['min_score'], reverse=True)
+        self.readiness_bands = sorted(self.config['readiness_bands'], key=lambda b: b['min_score'], reverse=True)
+
+        if self.default_importance not in self.importance_weights:
+            raise ValueError(f"Default importance '{self.default_importance}' has no weight")
+
+        # Relatedness matrix with an extra zero row/column that absorbs -1 IDs
+        size = len(self.relatedness.skills)
+        self._padded_matrix = np.zeros((size + 1, size + 1), dtype=self.relatedness.matrix.dtype)
+        self._padded_matrix[:size, :size] = self.relatedness.matrix
+
+    @classmethod
+    def from_file(cls, path: str, relatedness: Optional[SkillRelatedness] = None) -> 'ScoringModel':
+        """Load a scoring model from a JSON config file (missing keys use defaults)"""
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls(json.load(file), relatedness)
+
+    def score(self, resume_skills: List[Dict], required_skills: List[Dict]) -> float:
+        """Calculate the readiness score (0-100) for one analysis"""
+        if not required_skills:
+            return 100.0
+        return float(self.score_batch([(resume_skills, required_skills)])[0])
+
+    def score_batch(self, pairs: Sequence[SkillPair]) -> np.ndarray:
+        """Score many (resume_skills, required_skills) pairs in one vectorized pass"""
+        if len(pairs) == 0:
+            return np.zeros(0)
+
+        weights, credit, empty_rows = self._weights_and_credit(pairs)
+        scores = np.einsum('ij,ij->i', weights, credit) * 100
+        scores[empty_rows] = 100.0
+        return np.round(scores, 1)
+
+    def score_with_skills(self, resume_skills: List[Dict], required_skills: List[Dict],
+                          acquired: Sequence[Dict]) -> float:
+        """Readiness score once the acquired skills ({'name', 'level'}) are added to the resume.
+
+        A skill already on the resume keeps the higher of its two levels. This is
+        a full rescore, so related requirements gain credit too.
+        """
+        return self.score(with_skills(resume_skills, acquired), required_skills)
+
+    def skill_deltas(self, resume_skills: List[Dict], required_skills: List[Dict]) -> Dict[str, float]:
+        """Score gained by acquiring each required skill alone, keyed by lowercase name.
+
+        Each delta is score(resume + skill) - score(resume). Acquiring a skill
+        also raises the credit of related requirements, so the gains of several
+        skills overlap and their sum only approximates the combined gain; use
+        score_with_skills for that.
+        """
+        if not required_skills:
+            return {}
+        names = list(dict.fromkeys(skill['name'].lower() for skill in required_skills))
+        levels = {skill['name'].lower(): skill.get('level', 'basic') for skill in required_skills}
+        pairs = [(resume_skills or [], required_skills)]
+        pairs += [(with_skills(resume_skills, [{'name': name, 'level': levels[name]}]), required_skills)
+                  for name in names]
+        scores = self.score_batch(pairs)
+        return {name: round(float(score - scores[0]), 4) for name, score in zip(names, scores[1:])}
+
+    def _weights_and_credit(self, pairs: Sequence[SkillPair]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-requirement weight and credit matrices for a batch of pairs"""
+        rows = len(pairs)
+
+        width = max(1, max(len(required) for _, required in pairs))
+        depth = max(1, max(len(resume) for resume, _ in pairs))
+
+        # Padded skill-ID matrices; -1 marks skills outside the taxonomy and padding
+        required_ids = np.full((rows, width), -1, dtype=np.intp)
+        resume_ids = np.full((rows, depth), -1, dtype=np.intp)
+        # Batch-local name IDs for exact matching of skills outside the taxonomy
+        required_names = np.full((rows, width), -1, dtype=np.intp)
+        resume_names = np.full((rows, depth), -2, dtype=np.intp)
+        weights = np.zeros((rows, width))
+        level_credit = np.ones((rows, width))
+        empty_rows = np.zeros(rows, dtype=bool)
+
+        name_ids: Dict[str, int] = {}
+        for row, (resume_skills, required_skills) in enumerate(pairs):
+            if not required_skills:
+                empty_rows[row] = True
+                continue
+
+            resume_levels = {}
+            for col, skill in enumerate(resume_skills):
+                name = skill['name'].lower()
+                resume_levels[name] = skill.get('level', 'basic')
+                resume_ids[row, col] = self.relatedness.index.get(name, -1)
+                resume_names[row, col] = name_ids.setdefault(name, len(name_ids))
+
+            weights[row, :len(required_skills)] = self._requirement_weights(required_skills)
+            for col, skill in enumerate(required_skills):
+                name = skill['name'].lower()
+                required_ids[row, col] = self.relatedness.index.get(name, -1)
+                required_names[row, col] = name_ids.setdefault(name, len(name_ids))
+                if name in resume_levels:
+                    gap = (LEVEL_HIERARCHY.get(skill.get('level', 'basic'), 1)
+                           - LEVEL_HIERARCHY.get(resume_levels[name], 1))
+                    level_credit[row, col] = self._level_credit(gap)
+
+        # Relatedness lookup for every (requirement, resume skill) pair
+        similarity = self._padded_matrix[required_ids[:, :, None], resume_ids[:, None, :]].max(axis=2)
+        exact = (required_names[:, :, None] == resume_names[:, None, :]).any(axis=2)
+        credit = np.maximum(similarity, exact) * level_credit
+        return weights, credit, empty_rows
+
+    def _requirement_weights(self, required_skills: List[Dict]) -> np.ndarray:
+        """Weight of each requirement: its importance group's share split by category weight"""
+        groups = [self._importance_group(skill.get('importance')) for skill in required_skills]
+        category = np.array([
+            self.category_weights.get(skill.get('category'), self.default_category_weight)
+            for skill in required_skills
+        ], dtype=float)
+
+        weights = np.zeros(len(required_skills))
+        for group, share in self.importance_weights.items():
+            mask = np.array([g == group for g in groups])
+            total = category[mask].sum()
+            if total > 0:
+                weights[mask] = share * category[mask] / total
+        return weights
+
+    def _importance_group(self, importance: Optional[str]) -> str:
+        """Map an importance to a weighted group"""
+        return importance if importance in self.importance_weights else self.default_importance
+
+    def _level_credit(self, gap: int) -> float:
+        """Credit kept for a skill that is `gap` levels short of the requirement"""
+        if gap <= 0:
+            return 1.0
+        return self.level_gap_credit.get(gap, self.level_gap_credit.get(max(self.level_gap_credit), 1.0))
+
+    def readiness_level(self, score: float) -> str:
+        """Get readiness level label based on score"""
+        for level in self.readiness_levels:
+            if score >= level['min_score']:
+                return level['label']
+        return self.readiness_levels[-1]['label']
+
+    def readiness_band(self, score: float) -> Dict[str, str]:
+        """Get the readiness band (icon, message, recommendation) for a score"""
+        for band in self.readiness_bands:
+            if score >= band['min_score']:
+                return band
+        return self.readiness_bands[-1]
+
+
+def with_skills(resume_skills: List[Dict], acquired: Sequence[Dict]) -> List[Dict]:
+    """Resume skills with acquired skills added, keeping the higher level of a skill listed twice"""
+    merged = {skill['name'].lower(): skill for skill in resume_skills or []}
+    for skill in acquired:
+        name = skill['name'].lower()
+        current = merged.get(name)
+        if current is None or (LEVEL_HIERARCHY.get(skill.get('level', 'basic'), 1)
+                               > LEVEL_HIERARCHY.get(current.get('level', 'basic'), 1)):
+            merged[name] = {**(current or {}), **skill}
+    return list(merged.values())
+
+
+@lru_cache(maxsize=None)
+def get_scoring_model(path: Optional[str] = None) -> ScoringModel:
+    """Get the per-process scoring model, from SCORING_MODEL_PATH when set"""
+    path = path or os.environ.get('SCORING_MODEL_PATH')
+    if path:
+        return ScoringModel.from_file(path)
+    return ScoringModel()
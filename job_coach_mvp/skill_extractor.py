@@ -1,7 +1,9 @@
 import re
 import nltk
+from functools import lru_cache
 from typing import List, Dict, Any
 import json
+from pipeline_timing import span
 
 # Download required NLTK data
 try:
@@ -69,6 +71,10 @@ class SkillExtractor:
     
     def __init__(self):
         self.all_skills = self._flatten_skills()
+        # Word-boundary patterns compiled once, so matching doesn't depend on re's cache
+        self._skill_patterns = [
+            (skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b')) for skill in self.all_skills
+        ]
     
     def _flatten_skills(self) -> List[str]:
         """Flatten all skills into a single list for easier matching"""
@@ -86,20 +92,19 @@ class SkillExtractor:
         text = resume_text.lower()
         
         # Find skills in the text
-        found_skills = []
-        for skill in self.all_skills:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text):
-                # Determine skill level based on context
-                level = self._determine_skill_level(text, skill.lower())
-                found_skills.append({
+        with span('analysis.match_skills'):
+            matched_skills = self._match_skills(text)
+        
+        # Determine skill level based on context
+        with span('analysis.classify_skills'):
+            return [
+                {
                     'name': skill,
-                    'level': level,
+                    'level': self._determine_skill_level(text, skill.lower()),
                     'category': self._get_skill_category(skill)
-                })
-        
-        return found_skills
+                }
+                for skill in matched_skills
+            ]
     
     def extract_requirements_from_job_description(self, job_text: str) -> List[Dict[str, Any]]:
         """Extract required skills from job description"""
@@ -110,19 +115,23 @@ class SkillExtractor:
         text = job_text.lower()
         
         # Find skills in the text
-        required_skills = []
-        for skill in self.all_skills:
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text):
-                # Determine importance based on context
-                importance = self._determine_skill_importance(text, skill.lower())
-                required_skills.append({
+        with span('analysis.match_skills'):
+            matched_skills = self._match_skills(text)
+        
+        # Determine importance based on context
+        with span('analysis.classify_skills'):
+            return [
+                {
                     'name': skill,
-                    'importance': importance,
+                    'importance': self._determine_skill_importance(text, skill.lower()),
                     'category': self._get_skill_category(skill)
-                })
-        
-        return required_skills
+                }
+                for skill in matched_skills
+            ]
+    
+    def _match_skills(self, text: str) -> List[str]:
+        """Find taxonomy skills mentioned in lowercased text"""
+        return [skill for skill, pattern in self._skill_patterns if pattern.search(text)]
     
     def _determine_skill_level(self, text: str, skill: str) -> str:
         """Determine skill level based on context"""
@@ -222,3 +231,9 @@ class SkillExtractor:
             return 'High School'
         
         return 'Unknown'
+
+
+@lru_cache(maxsize=None)
+def get_skill_extractor() -> SkillExtractor:
+    """Get the per-process skill extractor shared by every analyzer"""
+    return SkillExtractor()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Skill relatedness matrix for partial-credit readiness scoring.
+
+The matrix is built offline from the skill taxonomy and a hand-curated
+adjacency graph, saved to data/skill_relatedness.npz and loaded once per
+worker. Scoring then becomes a vector lookup instead of a graph walk.
+
+Rebuild after changing the taxonomy or SKILL_RELATIONS:
+    python skill_relatedness.py
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from skill_extractor import SkillExtractor
+
+DEFAULT_MATRIX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_relatedness.npz')
+
+# Similarity below this is treated as unrelated (no partial credit)
+MIN_SIMILARITY = 0.25
+
+# Weighted, undirected edges of the skill adjacency graph
+SKILL_RELATIONS: List[Tuple[str, str, float]] = [
+    # Programming languages
+    ('JavaScript', 'TypeScript', 0.8),
+    ('Java', 'Kotlin', 0.6),
+    ('Java', 'Scala', 0.5),
+    ('Java', 'C#', 0.5),
+    ('C++', 'C#', 0.4),
+    ('C++', 'Rust', 0.4),
+    ('Shell', 'Bash', 0.9),
+    ('Bash', 'PowerShell', 0.4),
+    ('Python', 'R', 0.3),
+    ('Python', 'Ruby', 0.3),
+    ('Swift', 'Kotlin', 0.3),
+
+    # Web frameworks
+    ('Django', 'Flask', 0.6),
+    ('Python', 'Django', 0.4),
+    ('Python', 'Flask', 0.4),
+    ('React', 'Angular', 0.5),
+    ('React', 'Vue.js', 0.6),
+    ('Angular', 'Vue.js', 0.5),
+    ('JavaScript', 'React', 0.4),
+    ('JavaScript', 'Node.js', 0.5),
+    ('Node.js', 'Express.js', 0.7),
+    ('Ruby', 'Ruby on Rails', 0.6),
+    ('PHP', 'Laravel', 0.6),
+    ('Java', 'Spring', 0.5),
+    ('C#', 'ASP.NET', 0.5),
+    ('Django', 'Ruby on Rails', 0.3),
+    ('Django', 'Laravel', 0.3),
+    ('HTML', 'CSS', 0.5),
+    ('CSS', 'Sass', 0.6),
+    ('CSS', 'Less', 0.6),
+    ('Sass', 'Less', 0.7),
+    ('Bootstrap', 'Tailwind CSS', 0.6),
+    ('CSS', 'Tailwind CSS', 0.4),
+    ('jQuery', 'JavaScript', 0.4),
+    ('Webpack', 'Babel', 0.4),
+    ('npm', 'yarn', 0.8),
+
+    # Data & analytics
+    ('SQL', 'PostgreSQL', 0.7),
+    ('SQL', 'MySQL', 0.7),
+    ('PostgreSQL', 'MySQL', 0.7),
+    ('MongoDB', 'Cassandra', 0.4),
+    ('MongoDB', 'Redis', 0.3),
+    ('Elasticsearch', 'MongoDB', 0.3),
+    ('Tableau', 'Power BI', 0.7),
+    ('Tableau', 'Looker', 0.6),
+    ('Power BI', 'Looker', 0.6),
+    ('Excel', 'Data Analysis', 0.4),
+    ('Data Analysis', 'Data Visualization', 0.5),
+    ('Data Visualization', 'Tableau', 0.5),
+    ('Machine Learning', 'Deep Learning', 0.6),
+    ('Machine Learning', 'Scikit-learn', 0.6),
+    ('Deep Learning', 'TensorFlow', 0.6),
+    ('Deep Learning', 'PyTorch', 0.6),
+    ('TensorFlow', 'PyTorch', 0.7),
+    ('Pandas', 'NumPy', 0.6),
+    ('Pandas', 'Data Analysis', 0.5),
+    ('Matplotlib', 'Seaborn', 0.7),
+    ('Apache Spark', 'Hadoop', 0.6),
+
+    # Cloud & DevOps
+    ('AWS', 'Azure', 0.6),
+    ('AWS', 'Google Cloud', 0.6),
+    ('AWS', 'GCP', 0.6),
+    ('Azure', 'Google Cloud', 0.6),
+    ('Azure', 'GCP', 0.6),
+    ('Google Cloud', 'GCP', 1.0),
+    ('Docker', 'Kubernetes', 0.4),
+    ('Jenkins', 'GitLab CI', 0.6),
+    ('Jenkins', 'GitHub Actions', 0.6),
+    ('GitLab CI', 'GitHub Actions', 0.7),
+    ('CI/CD', 'Jenkins', 0.6),
+    ('CI/CD', 'GitLab CI', 0.6),
+    ('CI/CD', 'GitHub Actions', 0.6),
+    ('Terraform', 'Ansible', 0.4),
+    ('Ansible', 'Chef', 0.6),
+    ('Ansible', 'Puppet', 0.6),
+    ('Chef', 'Puppet', 0.7),
+    ('Linux', 'Ubuntu', 0.8),
+    ('Linux', 'CentOS', 0.8),
+    ('Linux', 'Red Hat', 0.8),
+    ('Ubuntu', 'CentOS', 0.6),
+    ('CentOS', 'Red Hat', 0.8),
+    ('Serverless', 'Lambda', 0.7),
+    ('AWS', 'Lambda', 0.4),
+    ('DevOps', 'CI/CD', 0.5),
+
+    # Design & UX
+    ('Figma', 'Sketch', 0.7),
+    ('Figma', 'Adobe XD', 0.7),
+    ('Sketch', 'Adobe XD', 0.7),
+    ('Figma', 'Framer', 0.5),
+    ('Sketch', 'InVision', 0.4),
+    ('Adobe Photoshop', 'Adobe Illustrator', 0.5),
+    ('Wireframing', 'Prototyping', 0.6),
+    ('UI/UX', 'User Research', 0.4),
+    ('UI/UX', 'Wireframing', 0.5),
+    ('Accessibility', 'WCAG', 0.8),
+    ('Design Thinking', 'User-Centered Design', 0.6),
+
+    # Soft skills
+    ('Leadership', 'Mentoring', 0.5),
+    ('Leadership', 'Project Management', 0.4),
+    ('Teamwork', 'Collaboration', 0.8),
+    ('Communication', 'Presentation Skills', 0.5),
+    ('Problem Solving', 'Critical Thinking', 0.6),
+
+    # Tools & platforms
+    ('Git', 'GitHub', 0.7),
+    ('Git', 'GitLab', 0.7),
+    ('Git', 'Bitbucket', 0.7),
+    ('GitHub', 'GitLab', 0.7),
+    ('GitHub', 'Bitbucket', 0.6),
+    ('Jira', 'Trello', 0.5),
+    ('Jira', 'Asana', 0.5),
+    ('Trello', 'Asana', 0.6),
+    ('Asana', 'Monday.com', 0.6),
+    ('Confluence', 'Notion', 0.5),
+    ('Slack', 'Microsoft Teams', 0.7),
+    ('VS Code', 'IntelliJ', 0.5),
+    ('VS Code', 'Sublime Text', 0.6),
+    ('IntelliJ', 'Eclipse', 0.6),
+    ('Vim', 'Emacs', 0.6),
+    ('Postman', 'Swagger', 0.5),
+
+    # Methodologies
+    ('Agile', 'Scrum', 0.7),
+    ('Agile', 'Kanban', 0.6),
+    ('Scrum', 'Kanban', 0.6),
+    ('Lean', 'Six Sigma', 0.5),
+    ('Test-Driven Development', 'BDD', 0.6),
+]
+
+
+def taxonomy_skills() -> List[str]:
+    """Get the unique taxonomy skills in a stable order (their index is the skill ID)"""
+    return list(dict.fromkeys(SkillExtractor().all_skills))
+
+
+def build_relatedness_matrix(skills: List[str],
+                             relations: Iterable[Tuple[str, str, float]] = SKILL_RELATIONS,
+                             min_similarity: float = MIN_SIMILARITY) -> np.ndarray:
+    """Build a dense skill x skill similarity matrix from the adjacency graph.
+
+    Direct edges are extended by one hop using the max-product path
+    (e.g. PostgreSQL -> SQL -> MySQL), and weak similarities are pruned.
+    """
+    index = {skill: i for i, skill in enumerate(skills)}
+    size = len(skills)
+
+    direct = np.zeros((size, size), dtype=np.float32)
+    for source, target, weight in relations:
+        if source not in index or target not in index:
+            raise ValueError(f"Unknown skill in relation: {source} - {target}")
+        i, j = index[source], index[target]
+        direct[i, j] = direct[j, i] = max(direct[i, j], weight)
+    np.fill_diagonal(direct, 1.0)
+
+    # Best two-hop path for every pair. Each skill links only its own
+    # neighbours, so this is O(edges) work instead of an O(n^3) broadcast.
+    matrix = direct.copy()
+    for k in range(size):
+        neighbours = np.flatnonzero(direct[k])
+        if neighbours.size > 1:
+            weights = direct[k, neighbours]
+            block = np.ix_(neighbours, neighbours)
+            matrix[block] = np.maximum(matrix[block], np.outer(weights, weights))
+    matrix[matrix < min_similarity] = 0.0
+    np.fill_diagonal(matrix, 1.0)
+
+    return matrix
+
+
+def save_relatedness_matrix(path: str = DEFAULT_MATRIX_PATH) -> str:
+    """Build the matrix from the current taxonomy and save it for workers to load"""
+    skills = taxonomy_skills()
+    matrix = build_relatedness_matrix(skills)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez_compressed(path, skills=np.array(skills), matrix=matrix)
+    return path
+
+
+class SkillRelatedness:
+    """Precomputed skill similarity lookup indexed by skill ID"""
+
+    def __init__(self, skills: List[str], matrix: np.ndarray):
+        if matrix.shape != (len(skills), len(skills)):
+            raise ValueError("Relatedness matrix shape does not match skill list")
+        self.skills = tuple(skills)
+        self.matrix = matrix
+        self.index: Dict[str, int] = {skill.lower(): i for i, skill in enumerate(self.skills)}
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MATRIX_PATH) -> 'SkillRelatedness':
+        """Load a matrix built by save_relatedness_matrix"""
+        with np.load(path) as data:
+            return cls([str(skill) for skill in data['skills']], data['matrix'])
+
+    def skill_ids(self, skill_names: Iterable[str]) -> np.ndarray:
+        """Map skill names to IDs (-1 for skills outside the taxonomy)"""
+        return np.array([self.index.get(name.lower(), -1) for name in skill_names], dtype=np.intp)
+
+    def similarity(self, skill_a: str, skill_b: str) -> float:
+        """Similarity between two skills (exact name match for unknown skills)"""
+        i, j = self.index.get(skill_a.lower(), -1), self.index.get(skill_b.lower(), -1)
+        if i < 0 or j < 0:
+            return 1.0 if skill_a.lower() == skill_b.lower() else 0.0
+        return float(self.matrix[i, j])
+
+
+@lru_cache(maxsize=None)
+def get_skill_relatedness(path: Optional[str] = None) -> SkillRelatedness:
+    """Get the per-process relatedness matrix, loading it on first use.
+
+    Falls back to building in memory when the saved matrix is missing or was
+    built from a different taxonomy.
+    """
+    path = path or DEFAULT_MATRIX_PATH
+    skills = taxonomy_skills()
+    if os.path.exists(path):
+        relatedness = SkillRelatedness.load(path)
+        if list(relatedness.skills) == skills:
+            return relatedness
+    return SkillRelatedness(skills, build_relatedness_matrix(skills))
+
+
+if __name__ == '__main__':
+    output_path = save_relatedness_matrix()
+    print(f"Saved skill relatedness matrix to {output_path}")
@@ -5,6 +5,7 @@ document.addEventListener('DOMContentLoaded', function() {
     initializeFormHandling();
     initializeAnimations();
     initializeProgressBars();
+    initializeTaskToggles();
 });
 
 function initializeFormHandling() {
@@ -108,6 +109,95 @@ function markTaskComplete(taskId) {
     }
 }
 
+// Task toggles: changes made within TASK_TOGGLE_DELAY ms are sent as one
+// JSON request and the page is updated in place from the response
+const TASK_TOGGLE_DELAY = 250;
+
+function initializeTaskToggles() {
+    const plan = document.getElementById('task-plan');
+    if (!plan) return;
+
+    const url = plan.dataset.tasksUrl;
+    let pending = {};
+    let timer = null;
+    let inFlight = false;
+
+    document.querySelectorAll('.task-item .task-toggle').forEach(checkbox => {
+        checkbox.addEventListener('change', function() {
+            pending[this.closest('.task-item').dataset.taskId] = this.checked;
+            clearTimeout(timer);
+            timer = setTimeout(flush, TASK_TOGGLE_DELAY);
+        });
+    });
+
+    function flush() {
+        if (inFlight) {
+            timer = setTimeout(flush, TASK_TOGGLE_DELAY);
+            return;
+        }
+        const changes = pending;
+        pending = {};
+        if (Object.keys(changes).length === 0) return;
+
+        inFlight = true;
+        fetch(url, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json', 'Accept': 'application/json'},
+            body: JSON.stringify({tasks: changes})
+        })
+            .then(response => response.json().then(body => {
+                if (!response.ok) throw new Error(body.error || 'Could not save your progress.');
+                applyTaskState(body);
+            }))
+            .catch(error => {
+                showNotification(error.message || 'Could not save your progress.', 'error');
+                // Show the plan as the server has it
+                setTimeout(() => window.location.reload(), 1500);
+            })
+            .finally(() => {
+                inFlight = false;
+            });
+    }
+
+    function applyTaskState(state) {
+        const completed = new Set(state.completed_tasks);
+        document.querySelectorAll('.task-item').forEach(item => {
+            const taskId = item.dataset.taskId;
+            const done = completed.has(taskId);
+            item.classList.toggle('bg-green-50', done);
+            item.classList.toggle('border-green-200', done);
+
+            // Leave boxes changed while this request was in flight as the user set them
+            const checkbox = item.querySelector('.task-toggle');
+            if (checkbox && !(taskId in pending)) {
+                checkbox.checked = done;
+            }
+
+            const timeline = item.querySelector('.task-timeline');
+            if (timeline && state.timelines[taskId]) {
+                timeline.textContent = state.timelines[taskId];
+            }
+        });
+
+        document.getElementById('completed-count').textContent = completed.size;
+        document.getElementById('remaining-count').textContent = state.total_tasks - completed.size;
+        document.getElementById('plan-timeline').textContent = state.plan_timeline || 'TBD';
+
+        const progressBar = document.querySelector('.overall-progress');
+        if (progressBar && state.total_tasks) {
+            progressBar.style.width = `${Math.round(completed.size / state.total_tasks * 100)}%`;
+        }
+
+        const readiness = document.getElementById('updated-readiness');
+        const showScore = completed.size > 0 && state.updated_readiness_score !== null;
+        readiness.classList.toggle('hidden', !showScore);
+        if (showScore) {
+            document.getElementById('updated-readiness-score').textContent =
+                Math.min(state.updated_readiness_score, 100).toFixed(1);
+        }
+    }
+}
+
 function updateProgress() {
     const tasks = document.querySelectorAll('.task-item');
     const completedTasks = document.querySelectorAll('.task-item input[type="checkbox"]:checked');
@@ -0,0 +1,18 @@
+// Tailwind build used by build_assets.py. Keep the theme in step with the
+// CDN fallback config in templates/base.html.
+module.exports = {
+  content: ['./templates/**/*.html', './static/js/**/*.js'],
+  theme: {
+    extend: {
+      fontFamily: {
+        'inter': ['Inter', 'system-ui', 'sans-serif'],
+      },
+      colors: {
+        primary: '#3B82F6',
+        success: '#10B981',
+        warning: '#F59E0B',
+        danger: '#EF4444',
+      },
+    },
+  },
+};
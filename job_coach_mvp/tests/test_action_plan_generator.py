@@ -151,6 +151,107 @@ class TestActionPlanGenerator:
         docs = self.generator._get_official_documentation('NonExistentSkill')
         assert docs is None
     
+    def test_uses_pinned_catalog(self):
+        """Test that resources and templates come from the learning catalog"""
+        from learning_catalog import LearningCatalog
+        catalog = LearningCatalog({
+            'courses': [
+                {'id': 'linkedin:rust:intermediate', 'skill': 'Rust', 'level': 'intermediate',
+                 'platform': 'LinkedIn Learning', 'title': 'Rust Essential Training',
+                 'url': 'https://example.com/rust', 'duration': '3h', 'instructor': 'Instructor'}
+            ],
+            'documentation': {'Rust': 'https://doc.rust-lang.org/'},
+            'task_templates': {'Rust': {'intermediate': {
+                'title': 'Build a Rust CLI', 'description': 'Ship a small tool',
+                'estimated_hours': 12, 'timeline': 'Week 1-2', 'priority': 'high'}}}
+        })
+        generator = ActionPlanGenerator(catalog=catalog)
+        
+        task = generator._create_task_for_missing_skill('Rust', {'skill': 'Rust', 'importance': 'critical'})
+        
+        assert task['title'] == 'Build a Rust CLI'
+        assert task['estimated_hours'] == 12
+        assert [r['platform'] for r in task['resources']] == ['Official', 'LinkedIn Learning']
+    
+    def test_target_level_follows_gap(self):
+        """Test that the job's required level drives resource selection"""
+        gap = {'skill': 'Python', 'importance': 'critical', 'type': 'missing', 'target_level': 'advanced'}
+        
+        task = self.generator._create_task_for_missing_skill('Python', gap)
+        
+        assert task['target_level'] == 'advanced'
+        assert task['id'] == 'task_python_advanced'
+        linkedin = [r for r in task['resources'] if r['platform'] == 'LinkedIn Learning']
+        assert linkedin[0]['name'] == 'LinkedIn Learning: Python Design Patterns'
+        assert self.generator._determine_target_level({'skill': 'Go'}) == 'intermediate'
+    
+    def test_identical_gaps_share_cached_template(self):
+        """Test that identical gap sets reuse one plan template"""
+        generator = ActionPlanGenerator()
+        gaps = [
+            {'skill': 'React', 'importance': 'critical', 'type': 'missing', 'description': 'first user'},
+            {'skill': 'Docker', 'importance': 'preferred', 'type': 'missing'}
+        ]
+        
+        first = generator.generate_action_plan(1, gaps)
+        # Fields that don't affect the plan are ignored, and input order only matters within an importance
+        second = generator.generate_action_plan(2, [dict(gaps[1]), dict(gaps[0], description='second user')])
+        
+        assert generator.cache_misses == 1
+        assert generator.cache_hits == 1
+        assert first['analysis_id'] == 1
+        assert second['analysis_id'] == 2
+        assert first['tasks'] == second['tasks']
+        
+        # Callers get private copies
+        first['tasks'][0]['completed'] = True
+        first['tasks'][0]['resources'].clear()
+        third = generator.generate_action_plan(3, gaps)
+        assert third['tasks'][0]['completed'] is False
+        assert third['tasks'][0]['resources']
+    
+    def test_plan_cache_keys_on_catalog_version_and_evicts(self):
+        """Test that a catalog change misses the cache and old templates are evicted"""
+        from learning_catalog import LearningCatalog
+        generator = ActionPlanGenerator(cache_size=1)
+        gaps = [{'skill': 'React', 'importance': 'critical', 'type': 'missing'}]
+        
+        generator.generate_action_plan(1, gaps)
+        generator._catalog = LearningCatalog({'documentation': {'React': 'https://example.com/react'}})
+        plan = generator.generate_action_plan(1, gaps)
+        
+        assert generator.cache_misses == 2
+        assert [r['url'] for r in plan['tasks'][0]['resources']] == ['https://example.com/react']
+        assert len(generator._templates) == 1
+    
+    def test_compact_and_hydrate_tasks(self):
+        """Test that stored task references round-trip and are much smaller"""
+        import json
+        gaps = [
+            {'skill': skill, 'importance': 'critical', 'type': 'missing'}
+            for skill in ['Python', 'React', 'AWS', 'Docker', 'Kubernetes', 'Git', 'SQL', 'Rust']
+        ] + [{'skill': 'Python', 'importance': 'preferred', 'type': 'level_gap',
+              'current_level': 'basic', 'target_level': 'advanced'}]
+        plan = self.generator.generate_action_plan(1, gaps)
+        
+        stored = self.generator.compact_tasks(plan['tasks'])
+        hydrated = self.generator.hydrate_tasks(stored)
+        
+        assert hydrated == plan['tasks']
+        assert len(json.dumps(stored)) * 4 < len(json.dumps(plan['tasks']))
+    
+    def test_hydrate_passes_through_full_tasks(self):
+        """Test that plans stored before compaction still render"""
+        legacy = [{'id': 'task_go_intermediate', 'skill': 'Go', 'title': 'Learn Go', 'description': 'Old copy',
+                   'estimated_hours': 10, 'timeline': 'Week 1-3', 'priority': 'critical',
+                   'target_level': 'intermediate', 'resources': [], 'completed': False}]
+        
+        hydrated = self.generator.hydrate_tasks(legacy, ['task_go_intermediate'])
+        
+        assert hydrated[0]['description'] == 'Old copy'
+        assert hydrated[0]['completed'] is True
+        assert hydrated[0]['timeline'] == 'Completed'
+    
     def test_empty_skill_gaps(self):
         """Test action plan generation with no skill gaps"""
         action_plan = self.generator.generate_action_plan(1, [])
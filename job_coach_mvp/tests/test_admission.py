@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+from admission import AdmissionController, Overloaded
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+class TestAdmissionController:
+    
+    def test_fails_fast_when_queue_is_full(self):
+        """Test that saturated requests are refused with a retry hint"""
+        controller = AdmissionController(slots=1, queue_size=0, retry_after=7)
+        controller.acquire()
+        
+        with pytest.raises(Overloaded) as refused:
+            controller.acquire()
+        assert refused.value.retry_after == 7
+        assert controller.rejected == 1
+        
+        assert controller.saturated()
+        with pytest.raises(Overloaded):
+            controller.reject()
+        assert controller.rejected == 2
+        
+        controller.release()
+        assert not controller.saturated()
+        with controller.admit():
+            assert controller.in_flight == 1
+        assert controller.in_flight == 0
+    
+    def test_queued_request_times_out(self):
+        """Test that a queued request gives up after the queue timeout"""
+        controller = AdmissionController(slots=1, queue_size=4, queue_timeout=0.05)
+        controller.acquire()
+        
+        start = time.monotonic()
+        with pytest.raises(Overloaded):
+            controller.acquire()
+        assert time.monotonic() - start >= 0.05
+    
+    def test_reserved_slot_is_kept_for_cheap_work(self):
+        """Test that expensive work can't take the last slot"""
+        controller = AdmissionController(slots=2, queue_size=4, reserved=1)
+        controller.acquire(expensive=True)
+        
+        with pytest.raises(Overloaded):
+            controller.acquire(expensive=True, timeout=0)
+        controller.acquire(expensive=False, timeout=0)
+        assert controller.in_flight == 2
+    
+    def test_cheap_waiters_go_first(self):
+        """Test that a freed slot goes to waiting cheap work before expensive work"""
+        controller = AdmissionController(slots=2, queue_size=4, reserved=0)
+        controller.acquire()
+        controller.acquire()
+        order = []
+        
+        def worker(expensive):
+            with controller.admit(expensive, timeout=None):
+                order.append('expensive' if expensive else 'cheap')
+                time.sleep(0.05)
+        
+        expensive = threading.Thread(target=worker, args=(True,))
+        expensive.start()
+        _wait_until(lambda: controller._waiting[True] == 1)
+        cheap = threading.Thread(target=worker, args=(False,))
+        cheap.start()
+        _wait_until(lambda: controller._waiting[False] == 1)
+        
+        controller.release()
+        cheap.join(5)
+        controller.release()
+        expensive.join(5)
+        
+        assert order == ['cheap', 'expensive']
+    
+    def test_background_waiters_do_not_fill_the_queue(self):
+        """Test that workers blocking without a timeout leave the request queue free"""
+        controller = AdmissionController(slots=1, queue_size=1, queue_timeout=0.5)
+        controller.acquire()
+        background = threading.Thread(target=controller.acquire, args=(True, None))
+        background.start()
+        _wait_until(lambda: controller._waiting[True] == 1)
+        
+        waiter = threading.Thread(target=controller.acquire)
+        waiter.start()
+        _wait_until(lambda: controller._waiting[False] == 1)
+        controller.release()
+        waiter.join(5)
+        
+        assert controller.in_flight == 1
+        controller.release()
+        background.join(5)
+        assert controller.in_flight == 1
+    
+    def test_try_acquire_for_background_work(self):
+        """Test that background work takes only a free slot and is never counted as refused"""
+        controller = AdmissionController(slots=2, reserved=1)
+        assert controller.try_acquire()
+        assert not controller.try_acquire(expensive=True)
+        assert controller.try_acquire()
+        assert not controller.try_acquire(timeout=0.05)
+        assert (controller.in_flight, controller.rejected) == (2, 0)
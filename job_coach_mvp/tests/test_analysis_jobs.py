@@ -0,0 +1,137 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from admission import AdmissionController
+from analysis_jobs import AnalysisJobQueue, complete_job, DONE, FAILED, MAX_ATTEMPTS, QUEUED, RUNNING
+from app import app, db
+from models import Analysis, AnalysisJob
+
+@pytest.fixture
+def app_context():
+    """Create an application context with a fresh database"""
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        yield
+        db.session.remove()
+        db.drop_all()
+
+def _store_analysis(job):
+    """Handler that stores an empty analysis for the job"""
+    analysis = Analysis(resume_text=job.resume_path, job_description=job.job_description)
+    db.session.add(analysis)
+    db.session.flush()
+    complete_job(job, analysis.id)
+    db.session.commit()
+
+def _wait_for(job_id, statuses, timeout=5.0):
+    """Poll a job until it reaches one of the statuses"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        db.session.expire_all()
+        job = db.session.get(AnalysisJob, job_id)
+        if job.status in statuses:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} is still {job.status}")
+
+class TestAnalysisJobQueue:
+    
+    def test_workers_run_queued_jobs(self, app_context):
+        """Test that background workers complete enqueued jobs"""
+        queue = AnalysisJobQueue(app, _store_analysis, workers=2, poll_interval=0.05)
+        try:
+            jobs = [queue.enqueue(resume_path=f'resume-{index}.pdf', job_description='Python') for index in range(4)]
+            for job in jobs:
+                done = _wait_for(job.id, {DONE, FAILED})
+                assert done.status == DONE
+                assert done.attempts == 1
+                assert db.session.get(Analysis, done.analysis_id).resume_text == f'resume-{jobs.index(job)}.pdf'
+        finally:
+            queue.stop(timeout=5)
+    
+    def test_handler_errors_fail_the_job(self, app_context):
+        """Test that a handler exception is stored on the failed job"""
+        def broken(job):
+            raise ValueError('Error processing resume: bad file')
+        
+        queue = AnalysisJobQueue(app, broken, eager=True)
+        job = queue.enqueue(resume_path='resume.pdf', job_description='Python')
+        
+        assert job.status == FAILED
+        assert job.error == 'Error processing resume: bad file'
+        assert job.finished_at is not None
+    
+    def test_expired_lease_is_reclaimed(self, app_context):
+        """Test that a job left running by a dead worker is picked up again"""
+        stale = AnalysisJob(status=RUNNING, attempts=1, resume_path='resume.pdf', job_description='Python',
+                            lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+                            progress=[{'stage': 'skills_matched'}])
+        live = AnalysisJob(status=RUNNING, attempts=1, resume_path='other.pdf', job_description='Python',
+                           lease_expires_at=datetime.utcnow() + timedelta(minutes=5),
+                           progress=[{'stage': 'skills_matched'}])
+        db.session.add_all([live, stale])
+        db.session.commit()
+        
+        queue = AnalysisJobQueue(app, _store_analysis)
+        assert queue.claim_next() == stale.id
+        assert queue.claim_next() is None
+        
+        db.session.expire_all()
+        assert db.session.get(AnalysisJob, stale.id).attempts == 2
+        assert db.session.get(AnalysisJob, live.id).attempts == 1
+        # The retry records its stages afresh
+        assert db.session.get(AnalysisJob, stale.id).progress is None
+        assert db.session.get(AnalysisJob, live.id).progress == [{'stage': 'skills_matched'}]
+    
+    def test_claims_are_exclusive(self, app_context):
+        """Test that each queued job is claimed once"""
+        db.session.add_all([AnalysisJob(status=QUEUED, attempts=0, job_description='Python') for _ in range(3)])
+        db.session.commit()
+        
+        queue = AnalysisJobQueue(app, _store_analysis)
+        claimed = [queue.claim_next() for _ in range(4)]
+        
+        assert claimed[3] is None
+        assert len(set(claimed[:3])) == 3
+    
+    def test_repeatedly_interrupted_job_fails(self, app_context):
+        """Test that a job whose worker keeps dying is eventually failed"""
+        job = AnalysisJob(status=RUNNING, attempts=MAX_ATTEMPTS, resume_path='resume.pdf', job_description='Python',
+                          lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+        db.session.add(job)
+        db.session.commit()
+        
+        queue = AnalysisJobQueue(app, _store_analysis, poll_interval=0.05)
+        queue.start()
+        try:
+            failed = _wait_for(job.id, {DONE, FAILED})
+        finally:
+            queue.stop(timeout=5)
+        
+        assert failed.status == FAILED
+        assert 'interrupted' in failed.error
+        assert failed.analysis_id is None
+    
+    def test_cheap_jobs_claimed_first_with_a_slot(self, app_context):
+        """Test that workers claim only jobs they hold a slot for, cheap ones first"""
+        large = AnalysisJob(status=QUEUED, attempts=0, job_description='Python', upload_bytes=5_000_000)
+        small = AnalysisJob(status=QUEUED, attempts=0, job_description='Python', upload_bytes=20_000)
+        db.session.add_all([large, small])
+        db.session.commit()
+        controller = AdmissionController(slots=2, reserved=1)
+        queue = AnalysisJobQueue(app, _store_analysis, admission=controller, large_job_bytes=1_000_000)
+        
+        # The large job may not take the last slot, and it isn't claimed while it can't run
+        controller.acquire()
+        assert queue._claim_admitted() == small.id
+        assert queue._claim_admitted() is None
+        db.session.expire_all()
+        assert db.session.get(AnalysisJob, large.id).status == QUEUED
+        assert controller.in_flight == 2
+        
+        controller.release()
+        controller.release()
+        assert queue._claim_admitted() == large.id
+        assert controller.in_flight == 1
@@ -0,0 +1,146 @@
+import json
+import pytest
+import api as api_module
+from admission import AdmissionController
+from app import app, db, analysis_queue, plan_prefetcher
+from models import Analysis
+
+JOB = 'Python and Docker experience is required. Kubernetes is a plus.'
+TOKEN = 'test-token'
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app"""
+    app.config['TESTING'] = True
+    analysis_queue.eager = True
+    plan_prefetcher.eager = True
+    app.config['API_TOKEN'] = TOKEN
+    
+    with app.test_client() as client:
+        client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {TOKEN}'
+        with app.app_context():
+            db.create_all()
+            yield client
+            db.drop_all()
+
+def _lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+class TestApi:
+    
+    def test_batch_streams_ndjson_in_order(self, client):
+        """Test that each submitted pair yields one NDJSON line"""
+        pairs = [
+            {'id': 'learner-1', 'resume_text': 'Developer with Python and Git experience', 'job_description': JOB},
+            {'id': 'learner-2', 'resume_text': 'Python developer'},
+            {'id': 'learner-3', 'resume_text': 'Docker administrator', 'job_description': JOB, 'hours_per_week': 5}
+        ]
+        
+        response = client.post('/api/v1/analyses', json=pairs)
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        results = _lines(response)
+        assert [result['id'] for result in results] == ['learner-1', 'learner-2', 'learner-3']
+        assert {gap['skill'] for gap in results[0]['skill_gaps']} >= {'Docker'}
+        assert results[0]['action_plan']['tasks']
+        assert all('score_delta' in task for task in results[0]['action_plan']['tasks'])
+        assert 'job_description' in results[1]['error']
+        assert 'readiness_score' in results[2]
+        assert Analysis.query.count() == 0
+    
+    def test_batch_accepts_ndjson_and_options(self, client):
+        """Test NDJSON request bodies and analysis-only batches"""
+        body = '\n'.join(json.dumps({'id': i, 'resume_text': 'Python developer', 'job_description': JOB})
+                         for i in range(2)) + '\n\n'
+        
+        response = client.post('/api/v1/analyses', data=body, content_type='application/x-ndjson')
+        assert [result['id'] for result in _lines(response)] == [0, 1]
+        
+        response = client.post('/api/v1/analyses', json={'pairs': [
+            {'id': 'a', 'resume_text': 'Python developer', 'job_description': JOB}
+        ], 'include_plan': False})
+        assert 'action_plan' not in _lines(response)[0]
+    
+    def test_batch_rejects_invalid_requests(self, client, monkeypatch):
+        """Test batch validation errors and the pair limit"""
+        monkeypatch.setattr(api_module, 'API_MAX_PAIRS', 2)
+        pair = {'resume_text': 'Python developer', 'job_description': JOB}
+        
+        assert client.post('/api/v1/analyses', json=[pair] * 3).status_code == 413
+        assert client.post('/api/v1/analyses', json=[]).status_code == 400
+        assert client.post('/api/v1/analyses', json={'pairs': 'nope'}).status_code == 400
+        response = client.post('/api/v1/analyses', data='{broken', content_type='application/json')
+        assert response.status_code == 400
+        assert 'Invalid JSON' in response.get_json()['error']
+    
+    def test_batch_ignores_file_paths(self, client):
+        """Test that pairs over HTTP can't read files from the server"""
+        response = client.post('/api/v1/analyses', json=[{'id': 'x', 'resume_path': 'test_resume.txt',
+                                                          'job_description': JOB}])
+        assert _lines(response) == [{'id': 'x', 'error': 'Record needs resume_text'}]
+    
+    def test_stored_analysis_and_plan(self, client):
+        """Test reading a stored analysis and its action plan"""
+        analysis = Analysis(
+            resume_text='Python developer',
+            job_description=JOB,
+            extracted_skills=[],
+            required_skills=[{'name': 'Docker', 'importance': 'critical', 'category': 'DevOps'}],
+            skill_gaps=[{'skill': 'Docker', 'importance': 'critical', 'type': 'missing'}],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        
+        assert client.get(f'/api/v1/analyses/{analysis.id}/action-plan').status_code == 404
+        client.get(f'/action-plan/{analysis.id}')
+        
+        stored = client.get(f'/api/v1/analyses/{analysis.id}').get_json()
+        assert stored['skill_gaps'][0]['skill'] == 'Docker'
+        assert stored['readiness_score'] == 0.0
+        
+        plan = client.get(f'/api/v1/analyses/{analysis.id}/action-plan').get_json()
+        assert plan['tasks'][0]['skill'] == 'Docker'
+        assert plan['tasks'][0]['resources']
+        assert plan['tasks'][0]['timeline'].startswith('Week')
+        assert plan['completed_tasks'] == []
+        
+        missing = client.get('/api/v1/analyses/999')
+        assert missing.status_code == 404
+        assert 'error' in missing.get_json()
+    
+    def test_batch_refused_when_saturated(self, client, monkeypatch):
+        """Test that a saturated process refuses batches with Retry-After and frees slots per pair"""
+        controller = AdmissionController(slots=1, queue_size=0, retry_after=3)
+        monkeypatch.setitem(app.extensions, 'admission', controller)
+        pair = {'resume_text': 'Python developer', 'job_description': JOB}
+        
+        response = client.post('/api/v1/analyses', json=[pair, pair])
+        assert response.status_code == 200
+        assert len(_lines(response)) == 2
+        assert controller.in_flight == 0
+        
+        controller.acquire()
+        response = client.post('/api/v1/analyses', json=[pair])
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '3'
+        assert 'busy' in response.get_json()['error']
+        
+        # An unread stream holds no slot
+        controller.release()
+        client.post('/api/v1/analyses', json=[pair], buffered=False)
+        assert controller.in_flight == 0
+    
+    def test_requires_api_token(self, client, monkeypatch):
+        """Test that requests without the configured bearer token are refused"""
+        pair = {'resume_text': 'Python developer', 'job_description': JOB}
+        
+        anonymous = client.post('/api/v1/analyses', json=[pair], headers={'Authorization': ''})
+        assert anonymous.status_code == 401
+        assert anonymous.headers['WWW-Authenticate'] == 'Bearer'
+        wrong = client.get('/api/v1/analyses/1', headers={'Authorization': 'Bearer nope'})
+        assert wrong.status_code == 401
+        
+        monkeypatch.setitem(app.config, 'API_TOKEN', None)
+        assert client.get('/api/v1/analyses/1').status_code == 503
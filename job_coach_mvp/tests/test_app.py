@@ -1,18 +1,31 @@
+import os
 import pytest
-from app import app, db
-from models import Analysis
+import runpy
+import shutil
+import app as app_module
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from app import app, db, analysis_queue, plan_prefetcher, create_app, reset_db_after_fork, action_plan_generator, gap_analyzer
+from metrics import DB_QUERY_LATENCY
+from models import Analysis, ActionPlan, AnalysisJob
+from pipeline_timing import STAGE_TIMINGS
+from progress import ProgressBroker
+from warmup import Warmup
 
 @pytest.fixture
 def client():
     """Create a test client for the Flask app"""
     app.config['TESTING'] = True
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    # Run analyses and generate plans inline so nothing runs after the test's teardown
+    analysis_queue.eager = True
+    plan_prefetcher.eager = True
     
     with app.test_client() as client:
         with app.app_context():
             db.create_all()
             yield client
-        db.drop_all()
+            db.drop_all()
 
 @pytest.fixture
 def app_context():
@@ -91,3 +104,676 @@ class TestApp:
         assert analysis is not None
         assert 'Python developer' in analysis.resume_text
         assert 'Senior Python Developer' in analysis.job_description
+    
+    def test_upload_records_stage_timings(self, client):
+        """Test that an upload stores its pipeline stage breakdown"""
+        from io import BytesIO
+        from docx import Document
+        
+        document = Document()
+        document.add_paragraph('Python developer with 3 years experience using Flask and Git')
+        resume = BytesIO()
+        document.save(resume)
+        resume.seek(0)
+        
+        data = {
+            'resume_file': (resume, 'resume.docx'),
+            'job_description': 'Senior Python Developer position requiring Python, Django, and AWS'
+        }
+        
+        response = client.post('/upload', data=data, content_type='multipart/form-data')
+        assert response.status_code == 302
+        
+        analysis = Analysis.query.order_by(Analysis.id.desc()).first()
+        assert analysis is not None
+        for stage in ['upload.save_file', 'upload.extract_text', 'upload.clean_text',
+                      'analysis.match_skills', 'analysis.classify_skills', 'analysis.score_gaps', 'total']:
+            assert stage in analysis.stage_timings
+    
+    def test_rescore_analyses_command(self, client):
+        """Test bulk rescoring of stored analyses"""
+        analysis = Analysis(
+            resume_text='Python developer',
+            job_description='Python required',
+            extracted_skills=[{'name': 'Python', 'level': 'basic', 'category': 'Programming'}],
+            required_skills=[{'name': 'Python', 'importance': 'critical', 'category': 'Programming'}],
+            skill_gaps=[],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        # A plan stored under an older model, with Docker done
+        plan = ActionPlan(
+            analysis_id=analysis.id,
+            tasks=[{'id': 'task_python', 'skill': 'Python', 'score_delta': 50.0},
+                   {'id': 'task_docker', 'skill': 'Docker', 'score_delta': 5.0}],
+            completed_tasks=['task_docker'],
+            updated_readiness_score=5.0
+        )
+        db.session.add(plan)
+        db.session.commit()
+        
+        result = app.test_cli_runner().invoke(args=['rescore-analyses'])
+        
+        assert result.exit_code == 0
+        assert 'Rescored analyses' in result.output
+        assert db.session.get(Analysis, analysis.id).readiness_score == 80.0
+        db.session.expire_all()
+        plan = ActionPlan.query.filter_by(analysis_id=analysis.id).one()
+        deltas = {task['skill']: task['score_delta'] for task in plan.tasks}
+        assert deltas == {'Python': 0.0, 'Docker': 0.0}
+        assert plan.updated_readiness_score == 80.0
+    
+    def test_toggle_and_budget_reschedule_plan(self, client):
+        """Test that toggling a task and changing the weekly budget reschedule the plan"""
+        from app import action_plan_generator
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Kubernetes and Docker required',
+            skill_gaps=[
+                {'skill': 'Kubernetes', 'importance': 'critical', 'type': 'missing'},
+                {'skill': 'Docker', 'importance': 'preferred', 'type': 'missing'}
+            ],
+            readiness_score=50.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        
+        def timelines():
+            plan = ActionPlan.query.filter_by(analysis_id=analysis.id).first()
+            tasks = action_plan_generator.hydrate_tasks(plan.tasks, plan.completed_tasks, plan.hours_per_week)
+            return {task['skill']: task['timeline'] for task in tasks}
+        
+        client.get(f'/action-plan/{analysis.id}')
+        # Docker is a prerequisite, so it comes first despite its lower priority
+        assert timelines()['Docker'].startswith('Week 1')
+        assert not timelines()['Kubernetes'].startswith('Week 1')
+        
+        plan = ActionPlan.query.filter_by(analysis_id=analysis.id).first()
+        docker_id = next(task['id'] for task in plan.tasks if task['skill'] == 'Docker')
+        client.post(f'/complete-task/{analysis.id}/{docker_id}')
+        assert timelines()['Docker'] == 'Completed'
+        assert timelines()['Kubernetes'].startswith('Week 1')
+        
+        response = client.post(f'/action-plan/{analysis.id}/hours-per-week', data={'hours_per_week': '40'})
+        assert response.status_code == 302
+        assert ActionPlan.query.filter_by(analysis_id=analysis.id).first().hours_per_week == 40
+        assert timelines()['Kubernetes'] == 'Week 1'
+        
+        client.post(f'/action-plan/{analysis.id}/hours-per-week', data={'hours_per_week': '0'})
+        assert ActionPlan.query.filter_by(analysis_id=analysis.id).first().hours_per_week == 40
+    
+    def test_action_plan_stores_task_references(self, client):
+        """Test that plans store catalog references and render full tasks"""
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python required',
+            skill_gaps=[{'skill': 'Python', 'importance': 'critical', 'type': 'missing'}],
+            readiness_score=50.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        
+        response = client.get(f'/action-plan/{analysis.id}')
+        
+        assert response.status_code == 200
+        assert b'Python Essential Training' in response.data or b'Advanced Python' in response.data
+        stored = ActionPlan.query.filter_by(analysis_id=analysis.id).first().tasks[0]
+        assert 'title' not in stored
+        assert 'resources' not in stored
+        assert stored['resource_ids'][0] == 'docs:Python'
+    
+    def test_regenerate_writes_only_changes(self, client):
+        """Test that regenerating keeps surviving progress and skips no-op writes"""
+        from sqlalchemy import event
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python and Docker required',
+            extracted_skills=[],
+            required_skills=[
+                {'name': 'Python', 'importance': 'critical', 'category': 'Programming'},
+                {'name': 'Docker', 'importance': 'preferred', 'category': 'DevOps'}
+            ],
+            skill_gaps=[
+                {'skill': 'Python', 'importance': 'critical', 'type': 'missing'},
+                {'skill': 'Docker', 'importance': 'preferred', 'type': 'missing'}
+            ],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        client.get(f'/action-plan/{analysis.id}')
+        client.post(f'/complete-task/{analysis.id}/task_python_intermediate')
+        client.post(f'/complete-task/{analysis.id}/task_docker_intermediate')
+        
+        updates = []
+        def count_updates(conn, cursor, statement, *args):
+            if statement.startswith('UPDATE'):
+                updates.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', count_updates)
+        try:
+            response = client.get(f'/generate-action-plan/{analysis.id}', follow_redirects=True)
+            assert b'already up to date' in response.data
+            assert updates == []
+            
+            analysis.skill_gaps = [{'skill': 'Python', 'importance': 'critical', 'type': 'missing'}]
+            db.session.commit()
+            updates.clear()
+            client.get(f'/generate-action-plan/{analysis.id}')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count_updates)
+        
+        plan = ActionPlan.query.filter_by(analysis_id=analysis.id).first()
+        assert [task['id'] for task in plan.tasks] == ['task_python_intermediate']
+        assert plan.completed_tasks == ['task_python_intermediate']
+        assert plan.updated_readiness_score == 80.0
+        assert len(updates) == 1
+    
+    def test_upload_prefetches_action_plan(self, client):
+        """Test that the action plan is stored before it is first viewed"""
+        from io import BytesIO
+        from docx import Document
+        document = Document()
+        document.add_paragraph('Software engineer with Python and Git experience')
+        buffer = BytesIO()
+        document.save(buffer)
+        buffer.seek(0)
+        
+        response = client.post('/upload', data={
+            'job_description': 'Python, Docker and Kubernetes experience required',
+            'resume_file': (buffer, 'resume.docx')
+        }, content_type='multipart/form-data')
+        
+        assert response.status_code == 302
+        analysis_id = int(response.headers['Location'].rsplit('/', 1)[1])
+        plan = ActionPlan.query.filter_by(analysis_id=analysis_id).first()
+        assert plan is not None
+        assert {task['skill'] for task in plan.tasks} >= {'Docker', 'Kubernetes'}
+        assert client.get(f'/action-plan/{analysis_id}').status_code == 200
+        assert ActionPlan.query.filter_by(analysis_id=analysis_id).count() == 1
+    
+    def test_toggle_projects_readiness(self, client):
+        """Test that toggles rescore the resume with the completed tasks' skills"""
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python and Docker required',
+            extracted_skills=[{'name': 'Git', 'level': 'basic', 'category': 'Tools'}],
+            required_skills=[
+                {'name': 'Python', 'importance': 'critical', 'category': 'Programming'},
+                {'name': 'Git', 'importance': 'critical', 'category': 'Tools'},
+                {'name': 'Docker', 'importance': 'preferred', 'category': 'DevOps'}
+            ],
+            skill_gaps=[
+                {'skill': 'Python', 'importance': 'critical', 'type': 'missing'},
+                {'skill': 'Docker', 'importance': 'preferred', 'type': 'missing'}
+            ],
+            readiness_score=40.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        client.get(f'/action-plan/{analysis.id}')
+        plan = ActionPlan.query.filter_by(analysis_id=analysis.id).first()
+        assert plan.updated_readiness_score == 40.0
+        assert {task['skill']: task['score_delta'] for task in plan.tasks} == {'Python': 40.0, 'Docker': 20.0}
+        
+        client.post(f'/complete-task/{analysis.id}/task_docker_intermediate')
+        assert ActionPlan.query.filter_by(analysis_id=analysis.id).first().updated_readiness_score == 60.0
+        
+        client.post(f'/complete-task/{analysis.id}/task_python_intermediate')
+        assert ActionPlan.query.filter_by(analysis_id=analysis.id).first().updated_readiness_score == 100.0
+        client.post(f'/complete-task/{analysis.id}/task_docker_intermediate')
+        assert ActionPlan.query.filter_by(analysis_id=analysis.id).first().updated_readiness_score == 80.0
+    
+    def test_toggle_counts_related_requirements(self, client):
+        """Test that completing a skill also credits related requirements"""
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Django and Flask required',
+            extracted_skills=[],
+            required_skills=[
+                {'name': 'Django', 'importance': 'critical', 'category': 'Web Development'},
+                {'name': 'Flask', 'importance': 'critical', 'category': 'Web Development'}
+            ],
+            skill_gaps=[
+                {'skill': 'Django', 'importance': 'critical', 'type': 'missing'},
+                {'skill': 'Flask', 'importance': 'critical', 'type': 'missing'}
+            ],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        client.get(f'/action-plan/{analysis.id}')
+        
+        client.post(f'/complete-task/{analysis.id}/task_flask_intermediate')
+        
+        plan = ActionPlan.query.filter_by(analysis_id=analysis.id).first()
+        flask_task = [{'name': 'Flask', 'level': 'intermediate'}]
+        expected = gap_analyzer.scoring_model.score_with_skills([], analysis.required_skills, flask_task)
+        assert plan.updated_readiness_score == expected > 40.0
+    
+    def test_upload_runs_analysis_job(self, client):
+        """Test that uploads are analyzed by a job that links its analysis"""
+        from io import BytesIO
+        from docx import Document
+        document = Document()
+        document.add_paragraph('Software engineer with Python and Git experience')
+        buffer = BytesIO()
+        document.save(buffer)
+        buffer.seek(0)
+        
+        response = client.post('/upload', data={
+            'job_description': 'Python and Docker experience required',
+            'resume_file': (buffer, 'resume.docx')
+        }, content_type='multipart/form-data')
+        
+        job = AnalysisJob.query.order_by(AnalysisJob.id.desc()).first()
+        assert job.status == 'done'
+        assert job.attempts == 1
+        assert response.headers['Location'].endswith(f'/analysis/{job.analysis_id}')
+        assert not os.path.exists(job.resume_path)
+        
+        status = client.get(f'/jobs/{job.id}/status').get_json()
+        assert status == {'id': job.id, 'status': 'done', 'analysis_url': f'/analysis/{job.analysis_id}'}
+        assert client.get(f'/jobs/{job.id}').headers['Location'].endswith(f'/analysis/{job.analysis_id}')
+    
+    def test_failed_analysis_job_shows_error(self, client):
+        """Test that a resume that can't be read fails its job with a message"""
+        from io import BytesIO
+        response = client.post('/upload', data={
+            'job_description': 'Python and Docker experience required',
+            'resume_file': (BytesIO(b'not a real document'), 'resume.docx')
+        }, content_type='multipart/form-data')
+        
+        job = AnalysisJob.query.order_by(AnalysisJob.id.desc()).first()
+        assert job.status == 'failed'
+        assert job.analysis_id is None
+        assert response.headers['Location'].endswith(f'/jobs/{job.id}')
+        
+        page = client.get(f'/jobs/{job.id}')
+        assert page.status_code == 200
+        assert b'Error processing resume' in page.data
+        assert client.get(f'/jobs/{job.id}/status').get_json()['status'] == 'failed'
+        assert client.get('/jobs/999/status').status_code == 404
+    
+    def test_analysis_page_conditional_get(self, client):
+        """Test that unchanged analysis pages answer revalidation with 304"""
+        analysis = Analysis(resume_text='Developer', job_description='Python required', readiness_score=40.0)
+        db.session.add(analysis)
+        db.session.commit()
+        
+        response = client.get(f'/analysis/{analysis.id}')
+        etag = response.headers['ETag']
+        assert response.status_code == 200
+        assert 'Last-Modified' not in response.headers
+        assert 'no-cache' in response.headers['Cache-Control']
+        
+        assert client.get(f'/analysis/{analysis.id}', headers={'If-None-Match': etag}).status_code == 304
+        
+        analysis.readiness_score = 55.0
+        db.session.commit()
+        rescored = client.get(f'/analysis/{analysis.id}', headers={'If-None-Match': etag})
+        assert rescored.status_code == 200
+        assert rescored.headers['ETag'] != etag
+        # A date-only revalidation can't vouch for the rescored page
+        since = {'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'}
+        assert client.get(f'/analysis/{analysis.id}', headers=since).status_code == 200
+    
+    def test_action_plan_conditional_get_and_page_cache(self, client):
+        """Test plan validators, cached renders and invalidation on toggle"""
+        from app import page_cache
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python required',
+            extracted_skills=[],
+            required_skills=[{'name': 'Python', 'importance': 'critical', 'category': 'Programming'}],
+            skill_gaps=[{'skill': 'Python', 'importance': 'critical', 'type': 'missing'}],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        
+        client.get(f'/action-plan/{analysis.id}')
+        first = client.get(f'/action-plan/{analysis.id}')
+        etag = first.headers['ETag']
+        hits = page_cache.hits
+        again = client.get(f'/action-plan/{analysis.id}')
+        assert again.data == first.data
+        assert page_cache.hits == hits + 1
+        assert client.get(f'/action-plan/{analysis.id}', headers={'If-None-Match': etag}).status_code == 304
+        
+        # The page shown with the toggle's flash message isn't cached or validated
+        toggled = client.post(f'/complete-task/{analysis.id}/task_python_intermediate', follow_redirects=True)
+        assert b'Task marked as complete!' in toggled.data
+        assert 'ETag' not in toggled.headers
+        
+        changed = client.get(f'/action-plan/{analysis.id}', headers={'If-None-Match': etag})
+        assert changed.status_code == 200
+        assert changed.headers['ETag'] != etag
+        assert b'Task marked as complete!' not in changed.data
+    
+    def test_task_toggle_without_javascript(self, client):
+        """Test the plan page keeps a plain form submit for each task"""
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python required',
+            extracted_skills=[],
+            required_skills=[{'name': 'Python', 'importance': 'critical', 'category': 'Programming'}],
+            skill_gaps=[{'skill': 'Python', 'importance': 'critical', 'type': 'missing'}],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        
+        page = client.get(f'/action-plan/{analysis.id}').data.decode()
+        action = f'action="/complete-task/{analysis.id}/task_python_intermediate"'
+        assert action in page
+        assert 'Mark done' in page.split(action, 1)[1].split('</form>', 1)[0]
+        
+        toggled = client.post(f'/complete-task/{analysis.id}/task_python_intermediate', follow_redirects=True)
+        assert 'Undo' in toggled.data.decode().split(action, 1)[1].split('</form>', 1)[0]
+    
+    def test_update_tasks_json_batch(self, client):
+        """Test toggling several tasks in one JSON request with a single write"""
+        from sqlalchemy import event
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python and Docker required',
+            extracted_skills=[],
+            required_skills=[
+                {'name': 'Python', 'importance': 'critical', 'category': 'Programming'},
+                {'name': 'Docker', 'importance': 'preferred', 'category': 'DevOps'}
+            ],
+            skill_gaps=[
+                {'skill': 'Python', 'importance': 'critical', 'type': 'missing'},
+                {'skill': 'Docker', 'importance': 'preferred', 'type': 'missing'}
+            ],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        client.get(f'/action-plan/{analysis.id}')
+        url = f'/action-plan/{analysis.id}/tasks'
+        
+        statements = []
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            response = client.post(url, json={'tasks': {'task_python_intermediate': True,
+                                                        'task_docker_intermediate': True}})
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        
+        assert response.status_code == 200
+        state = response.get_json()
+        assert set(state['completed_tasks']) == {'task_python_intermediate', 'task_docker_intermediate'}
+        assert state['updated_readiness_score'] == 100.0
+        assert state['total_tasks'] == 2
+        assert set(state['timelines'].values()) == {'Completed'}
+        assert state['plan_timeline'] == 'Done'
+        assert sum(statement.lstrip().upper().startswith('UPDATE') for statement in statements) == 1
+        
+        state = client.post(url, json={'tasks': {'task_docker_intermediate': False}}).get_json()
+        assert state['completed_tasks'] == ['task_python_intermediate']
+        assert state['updated_readiness_score'] == 80.0
+        assert state['timelines']['task_docker_intermediate'].startswith('Week')
+        
+        # Setting a task to the state it already has writes nothing
+        assert client.post(url, json={'tasks': {'task_python_intermediate': True}}).status_code == 200
+        assert ActionPlan.query.filter_by(analysis_id=analysis.id).first().version_id == 3
+        
+        assert client.post(url, json={'tasks': {'task_unknown': True}}).status_code == 400
+        assert client.post(url, json={'tasks': {'task_python_intermediate': 'yes'}}).status_code == 400
+        assert client.post(url, data='not json').status_code == 400
+        assert client.post('/action-plan/999/tasks', json={'tasks': {'a': True}}).status_code == 404
+    
+    def test_create_app_prepares_shared_state(self, app_context):
+        """Test that the factory creates tables and shared state and can run twice"""
+        db.drop_all()
+        
+        assert create_app() is app
+        assert create_app() is app
+        assert os.path.isdir(app.config['UPLOAD_FOLDER'])
+        assert Analysis.query.count() == 0
+        assert action_plan_generator.gap_analyzer is gap_analyzer
+        
+        reset_db_after_fork()
+        assert AnalysisJob.query.count() == 0
+    
+    def test_create_app_upgrades_old_schema(self, app_context):
+        """Test that tables from the first release gain the new columns and unique plan index"""
+        db.drop_all()
+        with db.engine.begin() as connection:
+            connection.execute(text('CREATE TABLE analysis (id INTEGER PRIMARY KEY, resume_text TEXT, '
+                                    'job_description TEXT, extracted_skills JSON, required_skills JSON, '
+                                    'skill_gaps JSON, readiness_score FLOAT, created_at DATETIME)'))
+            connection.execute(text('CREATE TABLE action_plan (id INTEGER PRIMARY KEY, analysis_id INTEGER, '
+                                    'tasks JSON, completed_tasks JSON, updated_readiness_score FLOAT, '
+                                    'created_at DATETIME)'))
+            connection.execute(text("INSERT INTO analysis (id, readiness_score) VALUES (1, 40.0)"))
+            connection.execute(text("INSERT INTO action_plan (id, analysis_id, tasks) VALUES (1, 1, '[]'), (2, 1, '[]')"))
+        
+        create_app()
+        
+        plan = ActionPlan.query.filter_by(analysis_id=1).one()
+        assert (plan.id, plan.version_id, plan.hours_per_week) == (1, 1, 10)
+        plan.completed_tasks = ['task_python']
+        db.session.commit()
+        assert plan.version_id == 2
+        assert db.session.get(Analysis, 1).stage_timings is None
+        
+        db.session.add(ActionPlan(analysis_id=1, tasks=[]))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+        db.drop_all()
+    
+    def test_gunicorn_config(self, monkeypatch):
+        """Test the preloaded worker settings and their overrides"""
+        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'gunicorn.conf.py')
+        monkeypatch.delenv('WEB_CONCURRENCY', raising=False)
+        config = runpy.run_path(config_path)
+        assert config['wsgi_app'] == 'wsgi:app'
+        assert config['preload_app'] is True
+        assert config['workers'] == min(config['available_cores'](), config['MAX_DEFAULT_WORKERS']) >= 1
+        
+        monkeypatch.setenv('WEB_CONCURRENCY', '3')
+        monkeypatch.setenv('GUNICORN_THREADS', '8')
+        config = runpy.run_path(config_path)
+        assert (config['workers'], config['threads']) == (3, 8)
+    
+    def test_gunicorn_cores_follow_cgroup_quota(self, tmp_path):
+        """Test that the default worker count honours cgroup v2 and v1 CPU quotas"""
+        config = runpy.run_path(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'gunicorn.conf.py'))
+        cgroup_cpu_limit, available_cores = config['cgroup_cpu_limit'], config['available_cores']
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+        
+        (tmp_path / 'cpu.max').write_text('50000 100000\n')
+        assert cgroup_cpu_limit(str(tmp_path)) == 0.5
+        assert available_cores(str(tmp_path)) == 1
+        (tmp_path / 'cpu.max').write_text('max 100000\n')
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+        
+        (tmp_path / 'cpu.max').unlink()
+        (tmp_path / 'cpu').mkdir()
+        (tmp_path / 'cpu' / 'cpu.cfs_quota_us').write_text('150000\n')
+        (tmp_path / 'cpu' / 'cpu.cfs_period_us').write_text('100000\n')
+        assert cgroup_cpu_limit(str(tmp_path)) == 1.5
+        (tmp_path / 'cpu' / 'cpu.cfs_quota_us').write_text('-1\n')
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+    
+    def test_ready_after_warmup(self, client, monkeypatch):
+        """Test that /ready answers 503 until the process has warmed up"""
+        warmup = Warmup(app, app_module.warmup.steps)
+        monkeypatch.setattr(app_module, 'warmup', warmup)
+        monkeypatch.setattr(warmup, 'start', lambda: None)
+        
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert response.get_json()['status'] == 'pending'
+        assert client.get('/health').status_code == 200
+        
+        # The sample analysis stays out of the metrics
+        assert Analysis.query.count() == 0
+        stages = STAGE_TIMINGS.snapshot()
+        cache_stats = (action_plan_generator.cache_hits, action_plan_generator.cache_misses)
+        queries = DB_QUERY_LATENCY.histogram('SELECT').snapshot()['count']
+        warmup.run()
+        assert STAGE_TIMINGS.snapshot() == stages
+        assert (action_plan_generator.cache_hits, action_plan_generator.cache_misses) == cache_stats
+        assert DB_QUERY_LATENCY.histogram('SELECT').snapshot()['count'] == queries
+        
+        response = client.get('/ready')
+        assert response.status_code == 200
+        assert set(response.get_json()['steps']) == {'skill_matcher', 'catalogs', 'database', 'synthetic_analysis'}
+        assert Analysis.query.count() == 0
+    
+    def test_upload_refused_when_backlog_is_full(self, client, monkeypatch):
+        """Test that uploads get 503 with Retry-After while the job backlog is full"""
+        db.session.add(AnalysisJob(status='queued', attempts=0, job_description='Python'))
+        db.session.commit()
+        monkeypatch.setattr(app_module, 'MAX_PENDING_JOBS', 2)
+        monkeypatch.setattr(app_module, 'LARGE_UPLOAD_BYTES', 10)
+        
+        # Large uploads are refused once the backlog is half full
+        response = client.post('/upload', data={'job_description': 'Python developer with Docker skills'})
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == str(app_module.admission.retry_after)
+        assert b'try again' in response.data
+        
+        monkeypatch.setattr(app_module, 'LARGE_UPLOAD_BYTES', 10_000_000)
+        assert client.post('/upload', data={'job_description': 'Python'}).status_code == 302
+        
+        monkeypatch.setattr(app_module, 'MAX_PENDING_JOBS', 1)
+        assert client.post('/upload', data={'job_description': 'Python'}).status_code == 503
+        assert client.get('/upload').status_code == 200
+    
+    def test_job_progress_events(self, client, tmp_path):
+        """Test that a finished job streams its pipeline stages as server-sent events"""
+        resume_path = tmp_path / 'resume.txt'
+        shutil.copy(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_resume.txt'), resume_path)
+        job = analysis_queue.enqueue(resume_path=str(resume_path),
+                                     job_description='Python, Docker and Kubernetes experience required')
+        assert job.status == 'done'
+        
+        response = client.get(f'/jobs/{job.id}/events')
+        assert response.mimetype == 'text/event-stream'
+        body = response.get_data(as_text=True)
+        events = [line.split(': ', 1)[1] for line in body.splitlines() if line.startswith('event: ')]
+        assert events == ['skills_matched', 'gaps_computed', 'plan_ready', 'done']
+        assert f'/analysis/{job.analysis_id}' in body
+        
+        # EventSource reconnects resume after the last event received
+        response = client.get(f'/jobs/{job.id}/events', headers={'Last-Event-ID': '2'})
+        assert response.get_data(as_text=True).count('event: ') == 1
+        assert client.get('/jobs/999/events').status_code == 404
+    
+    def test_finished_jobs_drop_progress_counters(self, client, tmp_path, monkeypatch):
+        """Test that the worker drops a job's progress counter whether or not it was streamed"""
+        def resume():
+            resume_path = tmp_path / f'resume-{len(os.listdir(tmp_path))}.txt'
+            shutil.copy(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_resume.txt'), resume_path)
+            return str(resume_path)
+        
+        done = analysis_queue.enqueue(resume_path=resume(),
+                                      job_description='Python, Docker and Kubernetes experience required')
+        assert done.status == 'done'
+        assert done.progress
+        assert app_module.progress_broker.version(done.id) == 0
+        
+        def fail_after_a_stage(resume_text, job_description, on_stage):
+            on_stage('skills_matched', {'skills': 1, 'required': 1})
+            raise RuntimeError('analysis failed')
+        
+        monkeypatch.setattr(gap_analyzer, 'analyze_skills', fail_after_a_stage)
+        failed = analysis_queue.enqueue(resume_path=resume(), job_description='Python')
+        assert failed.status == 'failed'
+        assert failed.progress
+        assert app_module.progress_broker.version(failed.id) == 0
+    
+    def test_job_progress_falls_back_to_polling(self, client, monkeypatch):
+        """Test that a process with no free stream tells the page to poll"""
+        job = AnalysisJob(status='failed', attempts=1, job_description='Python', error='bad file')
+        db.session.add(job)
+        db.session.commit()
+        
+        response = client.get(f'/jobs/{job.id}/events')
+        assert 'event: failed' in response.get_data(as_text=True)
+        
+        monkeypatch.setattr(app_module, 'progress_broker', ProgressBroker(max_streams=0))
+        body = client.get(f'/jobs/{job.id}/events').get_data(as_text=True)
+        assert body.startswith('event: unavailable')
+        assert f'/jobs/{job.id}/status' in body
+    
+    def test_concurrent_plan_writes_conflict(self, client):
+        """Test that every plan write answers a concurrent change with a conflict, not a 500"""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python required',
+            extracted_skills=[],
+            required_skills=[{'name': 'Python', 'importance': 'critical', 'category': 'Programming'}],
+            skill_gaps=[{'skill': 'Python', 'importance': 'critical', 'type': 'missing'}],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        client.get(f'/action-plan/{analysis.id}')
+        
+        def race():
+            # Another request updates the plan just before this one writes it
+            def bump(session, flush_context, instances):
+                session.connection().execute(text('UPDATE action_plan SET version_id = version_id + 1 '
+                                                  'WHERE analysis_id = :id'), {'id': analysis.id})
+            event.listen(Session, 'before_flush', bump, once=True)
+        
+        race()
+        toggled = client.post(f'/complete-task/{analysis.id}/task_python_intermediate', follow_redirects=True)
+        assert toggled.status_code == 200
+        assert b'changed in another window' in toggled.data
+        race()
+        budget = client.post(f'/action-plan/{analysis.id}/hours-per-week', data={'hours_per_week': '5'},
+                             follow_redirects=True)
+        assert b'changed in another window' in budget.data
+        race()
+        response = client.post(f'/action-plan/{analysis.id}/tasks', json={'tasks': {'task_python_intermediate': True}})
+        assert response.status_code == 409
+        
+        db.session.expire_all()
+        plan = ActionPlan.query.filter_by(analysis_id=analysis.id).first()
+        assert plan.completed_tasks == []
+        assert plan.hours_per_week == 10
+    
+    def test_one_action_plan_per_analysis(self, client, monkeypatch):
+        """Test that plan creation from any route or process stores a single plan"""
+        from sqlalchemy.exc import IntegrityError
+        analysis = Analysis(
+            resume_text='Developer',
+            job_description='Python required',
+            extracted_skills=[],
+            required_skills=[{'name': 'Python', 'importance': 'critical', 'category': 'Programming'}],
+            skill_gaps=[{'skill': 'Python', 'importance': 'critical', 'type': 'missing'}],
+            readiness_score=0.0
+        )
+        db.session.add(analysis)
+        db.session.commit()
+        analysis_id = analysis.id
+        
+        # Another process stores its plan while this one is generating
+        generate = app_module._generate_plan_data
+        def racing_generate(analysis, *args):
+            with app.app_context():
+                db.session.add(ActionPlan(analysis_id=analysis_id, tasks=[], completed_tasks=[]))
+                db.session.commit()
+            return generate(analysis, *args)
+        monkeypatch.setattr(app_module, '_generate_plan_data', racing_generate)
+        
+        assert client.get(f'/generate-action-plan/{analysis_id}').status_code == 302
+        assert ActionPlan.query.filter_by(analysis_id=analysis_id).count() == 1
+        assert ActionPlan.query.filter_by(analysis_id=analysis_id).first().tasks == []
+        
+        db.session.add(ActionPlan(analysis_id=analysis_id, tasks=[], completed_tasks=[]))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
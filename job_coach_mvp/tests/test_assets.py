@@ -0,0 +1,75 @@
+import gzip
+import os
+
+import pytest
+import assets
+import build_assets
+from app import app
+
+@pytest.fixture
+def built(tmp_path, monkeypatch):
+    """Build assets into a temporary directory with a stand-in Tailwind"""
+    dist_dir = str(tmp_path / 'dist')
+    manifest = build_assets.build(dist_dir, tailwind=lambda: '.bg-primary{background-color:#3b82f6}')
+    monkeypatch.setattr(assets, 'manifest', assets.AssetManifest(dist_dir))
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client, dist_dir, manifest
+
+class TestAssets:
+    
+    def test_build_fingerprints_and_precompresses(self, built):
+        """Test that bundles are content-named and written with gzip copies"""
+        _, dist_dir, manifest = built
+        
+        assert manifest['css/app.css'].startswith('css/app.') and manifest['css/app.css'].endswith('.css')
+        css_path = os.path.join(dist_dir, manifest['css/app.css'])
+        with open(css_path, 'rb') as file:
+            css = file.read()
+        assert css.startswith(b'.bg-primary{')
+        assert b'.btn-loading' in css
+        with open(css_path + '.gz', 'rb') as file:
+            assert gzip.decompress(file.read()) == css
+        assert build_assets.fingerprint('css/app.css', css) == manifest['css/app.css']
+    
+    def test_pages_use_the_bundle_without_third_parties(self, built):
+        """Test that a built bundle replaces the Tailwind CDN and web fonts"""
+        client, _, manifest = built
+        
+        html = client.get('/').get_data(as_text=True)
+        
+        assert f"/assets/{manifest['css/app.css']}" in html
+        assert f"/assets/{manifest['js/main.js']}" in html
+        assert 'cdn.tailwindcss.com' not in html
+        assert 'fonts.googleapis.com' not in html
+    
+    def test_assets_are_immutable_and_negotiated(self, built):
+        """Test cache headers and precompressed responses"""
+        client, _, manifest = built
+        url = f"/assets/{manifest['css/app.css']}"
+        
+        response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.mimetype == 'text/css'
+        assert 'immutable' in response.headers['Cache-Control']
+        assert 'max-age=31536000' in response.headers['Cache-Control']
+        assert 'Accept-Encoding' in response.headers['Vary']
+        
+        plain = client.get(url)
+        assert 'Content-Encoding' not in plain.headers
+        assert plain.data.startswith(b'.bg-primary{')
+        
+        assert client.get(url + '.gz').status_code == 404
+        assert client.get('/assets/css/missing.css').status_code == 404
+    
+    def test_unbuilt_assets_fall_back_to_static(self, tmp_path, monkeypatch):
+        """Test that without a build pages use the CDN and content-hashed source files"""
+        monkeypatch.setattr(assets, 'manifest', assets.AssetManifest(str(tmp_path)))
+        with app.test_request_context():
+            url = assets.asset_url('js/main.js')
+        assert url.startswith('/static/js/main.js?v=')
+        
+        with app.test_client() as client:
+            html = client.get('/').get_data(as_text=True)
+        assert 'cdn.tailwindcss.com' in html
+        assert '/static/css/style.css?v=' in html
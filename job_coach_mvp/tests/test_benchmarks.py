@@ -0,0 +1,114 @@
+from benchmarks.corpus import (
+    KB, generate_job_description, generate_resume, generate_taxonomy, write_docx, write_pdf
+)
+from benchmarks.run_benchmarks import _percentile, compare, measure, missing_baselines
+from benchmarks.load_test import RouteStats, _multipart
+from text_processor import TextProcessor
+
+class TestBenchmarkCorpus:
+    
+    def test_text_generation_is_deterministic(self):
+        """Test that the same seed produces identical text of the requested size"""
+        assert generate_resume(4 * KB, seed=7) == generate_resume(4 * KB, seed=7)
+        assert generate_resume(4 * KB, seed=7) != generate_resume(4 * KB, seed=8)
+        assert len(generate_job_description(2 * KB)) == 2 * KB
+    
+    def test_taxonomy_generation(self):
+        """Test that synthetic taxonomies have the requested number of unique skills"""
+        taxonomy = generate_taxonomy(2000, seed=1)
+        skills = [skill for category in taxonomy.values() for skill in category]
+        
+        assert len(skills) == 2000
+        assert len({skill.lower() for skill in skills}) == 2000
+        assert 'Python' in skills
+        assert taxonomy == generate_taxonomy(2000, seed=1)
+    
+    def test_generated_pdf_is_readable(self, tmp_path):
+        """Test that generated PDFs parse with the real extractor"""
+        path = write_pdf(str(tmp_path / 'resume.pdf'), pages=2)
+        
+        text = TextProcessor.extract_text_from_file(path)
+        assert len(text) > 1000
+        
+        with open(path, 'rb') as first, open(write_pdf(str(tmp_path / 'again.pdf'), pages=2), 'rb') as second:
+            assert first.read() == second.read()
+    
+    def test_generated_docx_is_readable(self, tmp_path):
+        """Test that generated DOCX files parse with the real extractor"""
+        path = write_docx(str(tmp_path / 'resume.docx'), 4 * KB)
+        
+        text = TextProcessor.extract_text_from_file(path)
+        assert abs(len(text) - 4 * KB) < 100
+
+class TestBenchmarkRunner:
+    
+    def test_measure_reports_latency_and_throughput(self):
+        """Test latency summary fields"""
+        result = measure(lambda: sum(range(100)), min_iterations=5, time_budget=0, payload_bytes=KB)
+        
+        assert result['iterations'] >= 5
+        assert result['p50_ms'] <= result['p99_ms']
+        assert result['ops_per_sec'] > 0
+        assert result['mb_per_sec'] > 0
+    
+    def test_compare_flags_regressions(self):
+        """Test regression detection against a baseline"""
+        baseline = {'fast': {'p50_ms': 10.0}, 'slow': {'p50_ms': 10.0}}
+        results = {
+            'fast': {'p50_ms': 11.0},
+            'slow': {'p50_ms': 20.0},
+            'new': {'p50_ms': 50.0}
+        }
+        
+        regressions = compare(results, baseline, threshold=0.25)
+        
+        assert len(regressions) == 1
+        assert regressions[0].startswith('slow')
+    
+    def test_percentile_uses_nearest_rank(self):
+        """Test nearest-rank percentiles, including ranks that fall on .5"""
+        values = [1, 2, 3, 4, 5, 6]
+        
+        assert _percentile(values, 0.25) == 2
+        assert _percentile(values, 0.50) == 3
+        assert _percentile(values, 0.75) == 5
+        assert _percentile(values, 0.99) == 6
+        assert _percentile([1, 2, 3, 4], 0.50) == 2
+        assert _percentile([7], 0.01) == 7
+    
+    def test_missing_baselines_are_listed(self):
+        """Test that cases with no baseline entry are reported rather than passing"""
+        baseline = {'fast': {'p50_ms': 10.0}}
+        results = {'fast': {'p50_ms': 11.0}, 'new': {'p50_ms': 50.0}}
+        
+        assert missing_baselines(results, baseline) == ['new']
+        assert missing_baselines(results, {}) == ['fast', 'new']
+
+class TestLoadTest:
+    
+    def test_route_stats_summary(self):
+        """Test per-route throughput, percentiles and error rate"""
+        stats = RouteStats()
+        for latency in [0.01, 0.02, 0.03, 0.04]:
+            stats.record('/analysis/<id>', latency, True)
+        stats.record('/upload', 0.5, False)
+        stats.record('/upload', 0.1, True)
+        
+        summary = stats.summary(elapsed=2.0)
+        
+        assert summary['/analysis/<id>']['requests'] == 4
+        assert summary['/analysis/<id>']['throughput_rps'] == 2.0
+        assert summary['/analysis/<id>']['p50_ms'] == 20.0
+        assert summary['/analysis/<id>']['p99_ms'] == 40.0
+        assert summary['/analysis/<id>']['error_rate'] == 0
+        assert summary['/upload']['error_rate'] == 0.5
+    
+    def test_multipart_encoding(self):
+        """Test that multipart bodies carry fields and files"""
+        body, content_type = _multipart({'job_description': 'Python required'}, {'resume_file': ('r.docx', b'data')})
+        
+        boundary = content_type.split('boundary=')[1]
+        assert body.startswith(f'--{boundary}'.encode())
+        assert b'name="job_description"' in body
+        assert b'filename="r.docx"' in body
+        assert body.endswith(f'--{boundary}--\r\n'.encode())
@@ -0,0 +1,54 @@
+import json
+from cohort_batch import CohortWorker, generate_cohort_plans, main, read_ndjson
+
+JOB = 'Python and Docker experience is required. Kubernetes is a plus.'
+
+def _records(count):
+    return [
+        {'id': f'learner-{i}', 'resume_text': f'Developer with {i} years of Python experience', 'job_description': JOB}
+        for i in range(count)
+    ]
+
+class TestCohortBatch:
+    
+    def test_generates_plans_in_input_order(self):
+        """Test in-process batch generation"""
+        records = _records(3) + [{'id': 'broken', 'resume_text': 'Python developer'}]
+        
+        results = list(generate_cohort_plans(records))
+        
+        assert [result['id'] for result in results] == ['learner-0', 'learner-1', 'learner-2', 'broken']
+        assert results[0]['action_plan']['analysis_id'] == 'learner-0'
+        assert {gap['skill'] for gap in results[0]['skill_gaps']} >= {'Docker'}
+        assert 'readiness_score' in results[0]
+        assert 'job_description' in results[3]['error']
+    
+    def test_shares_state_across_the_batch(self):
+        """Test that job requirements and plan templates are reused"""
+        worker = CohortWorker()
+        for index, record in enumerate(_records(3)):
+            worker.process(index, record)
+        
+        assert len(worker._requirements) == 1
+        assert worker.action_plan_generator.cache_hits == 2
+    
+    def test_process_pool_matches_in_process(self):
+        """Test that parallel generation yields the same results in order"""
+        records = _records(6)
+        
+        serial = list(generate_cohort_plans(records))
+        parallel = list(generate_cohort_plans(iter(records), workers=2, window=3))
+        
+        assert parallel == serial
+    
+    def test_cli_streams_ndjson(self, tmp_path):
+        """Test the NDJSON command line entry point"""
+        source = tmp_path / 'cohort.ndjson'
+        output = tmp_path / 'plans.ndjson'
+        source.write_text('\n'.join(json.dumps(record) for record in _records(2)) + '\n\n')
+        
+        assert main([str(source), '-o', str(output), '--workers', '1', '--hours-per-week', '20']) == 0
+        
+        results = list(read_ndjson(output.read_text().splitlines()))
+        assert [result['id'] for result in results] == ['learner-0', 'learner-1']
+        assert results[0]['action_plan']['tasks']
@@ -72,6 +72,25 @@ class TestGapAnalyzer:
         score = self.analyzer._calculate_readiness_score(resume_skills, [])
         assert score == 100.0
     
+    def test_readiness_score_partial_credit(self):
+        """Test that related skills earn partial credit"""
+        resume_skills = [
+            {'name': 'Flask', 'level': 'intermediate', 'category': 'Web Development'},
+            {'name': 'MySQL', 'level': 'basic', 'category': 'Data & Analytics'}
+        ]
+        
+        required_skills = [
+            {'name': 'Django', 'importance': 'critical', 'category': 'Web Development'},
+            {'name': 'PostgreSQL', 'importance': 'critical', 'category': 'Data & Analytics'}
+        ]
+        
+        score = self.analyzer._calculate_readiness_score(resume_skills, required_skills)
+        assert 0 < score < 80.0
+        
+        # Unrelated skills still get no credit
+        unrelated = [{'name': 'Figma', 'level': 'basic', 'category': 'Design & UX'}]
+        assert self.analyzer._calculate_readiness_score(unrelated, required_skills) == 0.0
+    
     def test_skill_gap_calculation(self):
         """Test skill gap calculation"""
         resume_skills = [
@@ -155,3 +174,13 @@ class TestGapAnalyzer:
         assert result['readiness_score'] == 100.0  # No requirements = perfect score
         assert result['experience_years'] == 0
         assert result['education_level'] == 'Unknown'
+    
+    def test_stage_callbacks(self):
+        """Test that analysis reports its matching and gap stages"""
+        stages = []
+        result = self.analyzer.analyze_skills("Python developer", "Python and Docker required",
+                                              on_stage=lambda stage, details: stages.append((stage, details)))
+        
+        assert [stage for stage, _ in stages] == ['skills_matched', 'gaps_computed']
+        assert stages[0][1]['required'] == len(result['required_skills'])
+        assert stages[1][1] == {'gaps': len(result['skill_gaps']), 'readiness_score': result['readiness_score']}
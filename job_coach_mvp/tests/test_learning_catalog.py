@@ -0,0 +1,132 @@
+import json
+import os
+import pytest
+from learning_catalog import CatalogLoader, LearningCatalog, get_catalog
+
+def _catalog_data(title='Python Essential Training'):
+    return {
+        'version': 'test',
+        'courses': [
+            {'id': 'linkedin:python:beginner', 'skill': 'Python', 'level': 'beginner',
+             'platform': 'LinkedIn Learning', 'title': title, 'url': 'https://example.com/python',
+             'duration': '4h', 'instructor': 'Instructor'}
+        ],
+        'documentation': {'Python': 'https://docs.python.org/3/'},
+        'task_templates': {
+            'Python': {'beginner': {'title': 'Learn Python', 'description': 'Basics',
+                                    'estimated_hours': 10, 'timeline': 'Week 1', 'priority': 'high'}}
+        }
+    }
+
+def _write(path, data, mtime):
+    path.write_text(json.dumps(data))
+    os.utime(path, (mtime, mtime))
+
+class TestLearningCatalog:
+    
+    def test_default_catalog_lookups(self):
+        """Test lookups against the shipped catalog"""
+        catalog = get_catalog()
+        
+        course = catalog.course('Python', 'beginner', 'LinkedIn Learning')
+        assert course['title'] == 'Python Essential Training'
+        assert catalog.course('Python', 'beginner', 'YouTube')['channel'] == 'Programming with Mosh'
+        assert catalog.course('Python', 'expert', 'LinkedIn Learning') is None
+        
+        assert catalog.documentation_url('React') == 'https://react.dev/'
+        assert catalog.task_template('Kubernetes', 'beginner')['estimated_hours'] == 20
+        assert catalog.courses_by_id['linkedin:python:beginner'] is course
+    
+    def test_resources_fall_back_to_nearest_level(self):
+        """Test nearest-level resolution of plan resources"""
+        catalog = get_catalog()
+        
+        resources = catalog.resources('React', 'intermediate')
+        assert [r['platform'] for r in resources] == ['Official', 'LinkedIn Learning', 'YouTube']
+        assert resources[1]['name'] == 'LinkedIn Learning: React.js Essential Training'
+        
+        # Ties go to the easier level; aliases share the same entry
+        assert catalog.resources('Python', 'basic') is catalog.resources('Python', 'beginner')
+        assert catalog.resources('AWS', 'advanced')[1]['url'] == catalog.course('AWS', 'intermediate', 'LinkedIn Learning')['url']
+        
+        assert catalog.resources('Kubernetes', 'advanced')[0]['platform'] == 'Official'
+        assert catalog.resources('Unknown Skill', 'beginner') == ()
+    
+    def test_resources_for_specialised_tracks(self):
+        """Test that track requests prefer the track and standard requests prefer standard courses"""
+        catalog = get_catalog()
+        
+        networking = catalog.resources('Docker', 'networking')
+        assert networking[1]['url'] == catalog.course('Docker', 'networking', 'LinkedIn Learning')['url']
+        
+        intermediate = catalog.resources('Docker', 'intermediate')
+        assert intermediate[1]['url'] == catalog.course('Docker', 'intermediate', 'LinkedIn Learning')['url']
+        
+        # A track with no YouTube course falls back to the standard YouTube course
+        data_science = catalog.resources('Python', 'data_science')
+        assert data_science[2]['url'] == catalog.course('Python', 'intermediate', 'YouTube')['url']
+    
+    def test_catalog_is_immutable(self):
+        """Test that catalog entries cannot be modified"""
+        catalog = LearningCatalog(_catalog_data())
+        
+        with pytest.raises(TypeError):
+            catalog.course('Python', 'beginner', 'LinkedIn Learning')['title'] = 'Changed'
+        with pytest.raises(TypeError):
+            catalog.documentation['Rust'] = 'https://www.rust-lang.org/'
+    
+    def test_version_tracks_content(self):
+        """Test that any content change produces a new version"""
+        first = LearningCatalog(_catalog_data())
+        same = LearningCatalog(_catalog_data())
+        changed = LearningCatalog(_catalog_data(title='Python Training'))
+        
+        assert first.version == same.version
+        assert first.version != changed.version
+        assert first.label == 'test'
+    
+    def test_invalid_courses_rejected(self):
+        """Test validation of catalog courses"""
+        data = _catalog_data()
+        data['courses'].append(dict(data['courses'][0]))
+        with pytest.raises(ValueError, match="Duplicate"):
+            LearningCatalog(data)
+        
+        data = _catalog_data()
+        del data['courses'][0]['url']
+        with pytest.raises(ValueError, match="missing fields"):
+            LearningCatalog(data)
+    
+    def test_hot_reload(self, tmp_path):
+        """Test that the loader picks up file changes and keeps the last good catalog"""
+        path = tmp_path / 'catalog.json'
+        _write(path, _catalog_data(), 1000)
+        loader = CatalogLoader(str(path), check_interval=0)
+        
+        first = loader.get()
+        assert loader.get() is first
+        
+        _write(path, _catalog_data(title='Python Training'), 2000)
+        second = loader.get()
+        assert second is not first
+        assert second.course('Python', 'beginner', 'LinkedIn Learning')['title'] == 'Python Training'
+        
+        path.write_text('{not json')
+        os.utime(path, (3000, 3000))
+        assert loader.get() is second
+        
+        # A redeploy that briefly removes the file keeps the loaded catalog
+        path.unlink()
+        assert loader.get() is second
+        with pytest.raises(OSError):
+            CatalogLoader(str(path)).get()
+    
+    def test_reload_check_interval(self, tmp_path):
+        """Test that the file is not re-checked within the interval"""
+        path = tmp_path / 'catalog.json'
+        _write(path, _catalog_data(), 1000)
+        loader = CatalogLoader(str(path), check_interval=3600)
+        
+        first = loader.get()
+        _write(path, _catalog_data(title='Python Training'), 2000)
+        assert loader.get() is first
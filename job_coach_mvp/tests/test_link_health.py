@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from action_plan_generator import ActionPlanGenerator
+from learning_catalog import LearningCatalog
+from link_health import DEAD_AFTER_CONNECT_FAILURES, LinkHealth, LinkHealthLoader, check_catalog_links, check_urls, load_cache
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Stub site: /ok has an ETag, /gone is 404, /nohead rejects HEAD, /error is 500, /slow sleeps"""
+    
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path, self.headers.get('If-None-Match')))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if self.path.startswith('/slow'):
+                time.sleep(0.05)
+            if self.path == '/ok' and self.headers.get('If-None-Match') == '"v1"':
+                status = 304
+            elif self.path == '/gone':
+                status = 404
+            elif self.path == '/nohead' and self.command == 'HEAD':
+                status = 405
+            elif self.path == '/error':
+                status = 500
+            else:
+                status = 200
+            self.send_response(status)
+            if self.path == '/ok':
+                self.send_header('ETag', '"v1"')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.active -= 1
+    
+    do_HEAD = _respond
+    do_GET = _respond
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    """Run the stub site on a free local port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.active = server.max_active = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+class TestLinkHealth:
+    
+    def test_classifies_links(self, stub_server):
+        """Test live, dead and inconclusive results"""
+        server, base = stub_server
+        urls = [f'{base}/ok', f'{base}/gone', f'{base}/nohead', f'{base}/error', 'http://127.0.0.1:1/refused']
+        
+        entries = asyncio.run(check_urls(urls, {}))
+        
+        assert entries[f'{base}/ok']['ok'] is True
+        assert entries[f'{base}/ok']['etag'] == '"v1"'
+        assert entries[f'{base}/gone']['ok'] is False
+        assert entries[f'{base}/nohead']['ok'] is True
+        assert ('GET', '/nohead', None) in server.requests
+        assert f'{base}/error' not in entries
+        assert entries['http://127.0.0.1:1/refused']['ok'] is True
+        assert LinkHealth(entries).dead_urls == {f'{base}/gone'}
+    
+    def test_connection_failures_need_repeating(self, stub_server):
+        """Test that a link is dead only after failing to connect on consecutive runs"""
+        _, base = stub_server
+        refused = 'http://127.0.0.1:1/refused'
+        urls = [f'{base}/ok', refused]
+        
+        entries = {}
+        for run in range(DEAD_AFTER_CONNECT_FAILURES):
+            assert not LinkHealth(entries).is_dead(refused)
+            entries = asyncio.run(check_urls(urls, entries, force=True))
+        assert entries[refused]['connect_failures'] == DEAD_AFTER_CONNECT_FAILURES
+        assert LinkHealth(entries).is_dead(refused)
+    
+    def test_local_outage_is_inconclusive(self):
+        """Test that a run where nothing connects changes nothing"""
+        urls = ['http://127.0.0.1:1/a', 'http://127.0.0.1:1/b']
+        assert asyncio.run(check_urls(urls, {})) == {}
+    
+    def test_cached_results_and_conditional_requests(self, stub_server):
+        """Test that fresh results are reused and rechecks are conditional"""
+        server, base = stub_server
+        entries = asyncio.run(check_urls([f'{base}/ok'], {}))
+        server.requests.clear()
+        
+        assert asyncio.run(check_urls([f'{base}/ok'], entries)) == entries
+        assert server.requests == []
+        
+        rechecked = asyncio.run(check_urls([f'{base}/ok'], entries, force=True))
+        assert server.requests == [('HEAD', '/ok', '"v1"')]
+        assert rechecked[f'{base}/ok']['status'] == 304
+        assert rechecked[f'{base}/ok']['ok'] is True
+        assert rechecked[f'{base}/ok']['etag'] == '"v1"'
+    
+    def test_concurrency_is_bounded(self, stub_server):
+        """Test that no more than `concurrency` requests are in flight"""
+        server, base = stub_server
+        
+        asyncio.run(check_urls([f'{base}/slow/{i}' for i in range(8)], {}, concurrency=2))
+        
+        assert len(server.requests) == 8
+        assert server.max_active <= 2
+    
+    def test_plans_exclude_dead_links(self, stub_server, tmp_path):
+        """Test that resources whose links are dead are left out of plans"""
+        server, base = stub_server
+        catalog = LearningCatalog({
+            'courses': [
+                {'id': 'linkedin:rust:intermediate', 'skill': 'Rust', 'level': 'intermediate',
+                 'platform': 'LinkedIn Learning', 'title': 'Rust Essential Training',
+                 'url': f'{base}/gone', 'duration': '3h', 'instructor': 'Instructor'}
+            ],
+            'documentation': {'Rust': f'{base}/ok'}
+        })
+        cache_path = str(tmp_path / 'link_health.json')
+        gaps = [{'skill': 'Rust', 'importance': 'critical', 'type': 'missing'}]
+        
+        before = ActionPlanGenerator(catalog=catalog, link_health=LinkHealth({})).generate_action_plan(1, gaps)
+        health = check_catalog_links(catalog, cache_path)
+        generator = ActionPlanGenerator(catalog=catalog, link_health=LinkHealthLoader(cache_path).get())
+        plan = generator.generate_action_plan(1, gaps)
+        
+        assert len(before['tasks'][0]['resources']) == 2
+        assert health.dead_urls == {f'{base}/gone'}
+        assert load_cache(cache_path)[f'{base}/gone']['status'] == 404
+        assert [r['url'] for r in plan['tasks'][0]['resources']] == [f'{base}/ok']
+        
+        stored = generator.compact_tasks(before['tasks'])
+        assert [r['url'] for r in generator.hydrate_tasks(stored)[0]['resources']] == [f'{base}/ok']
@@ -0,0 +1,95 @@
+import time
+import pytest
+from flask import Flask, Response
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import app, db, analysis_queue, plan_prefetcher
+from metrics import Counter, HistogramFamily, REQUEST_LATENCY, REQUESTS, instrument_app, render_metrics
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app"""
+    app.config['TESTING'] = True
+    analysis_queue.eager = True
+    plan_prefetcher.eager = True
+    
+    with app.test_client() as client:
+        with app.app_context():
+            db.create_all()
+            yield client
+            db.drop_all()
+
+class TestMetrics:
+    
+    def test_counter_and_histogram_exposition(self):
+        """Test the Prometheus text format of counters and histograms"""
+        counter = Counter('demo_total', 'Demo counter.', ('route',))
+        counter.inc('/a')
+        counter.inc('/a', amount=2)
+        assert counter.render() == ['# HELP demo_total Demo counter.', '# TYPE demo_total counter',
+                                    'demo_total{route="/a"} 3']
+        
+        histogram = HistogramFamily('demo_seconds', 'Demo latency.', ('route',), buckets=(0.1, 1.0))
+        histogram.observe(0.05, '/a')
+        histogram.observe(0.5, '/a')
+        lines = histogram.render()
+        assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'demo_seconds_bucket{route="/a",le="1.0"} 2' in lines
+        assert 'demo_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+        assert 'demo_seconds_count{route="/a"} 2' in lines
+    
+    def test_metrics_endpoint(self, client):
+        """Test that requests, queries, caches and uploads are exposed"""
+        from io import BytesIO
+        from docx import Document
+        before = REQUESTS.value('/analysis/<int:analysis_id>', 'GET', '404')
+        client.get('/analysis/999')
+        assert REQUESTS.value('/analysis/<int:analysis_id>', 'GET', '404') == before + 1
+        
+        document = Document()
+        document.add_paragraph('Python developer with Git experience')
+        resume = BytesIO()
+        document.save(resume)
+        resume.seek(0)
+        client.post('/upload', data={'job_description': 'Python and Docker required',
+                                     'resume_file': (resume, 'resume.docx')}, content_type='multipart/form-data')
+        
+        response = client.get('/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain')
+        text = response.get_data(as_text=True)
+        assert 'job_coach_http_requests_total{route="/analysis/<int:analysis_id>",method="GET",status="404"}' in text
+        assert 'job_coach_http_request_duration_seconds_bucket{route="/upload",le="+Inf"}' in text
+        assert 'job_coach_upload_size_bytes_count{format="docx"}' in text
+        assert 'job_coach_db_query_duration_seconds_count{statement="SELECT"}' in text
+        assert 'job_coach_cache_hits_total{cache="plan_template"}' in text
+        assert 'job_coach_pipeline_stage_duration_seconds_count{stage="upload.extract_text"}' in text
+        assert render_metrics().endswith('\n')
+    
+    def test_failed_query_leaves_no_start_time(self, client):
+        """Test that a statement that errors doesn't leave its start time on the connection"""
+        with db.engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text('SELECT * FROM no_such_table'))
+            assert not connection.info.get('query_start_times')
+            connection.execute(text('SELECT 1'))
+            assert not connection.info.get('query_start_times')
+    
+    def test_streamed_response_timed_until_sent(self):
+        """Test that a streamed response's latency covers generating its body"""
+        streaming_app = Flask(__name__)
+        instrument_app(streaming_app)
+        
+        @streaming_app.route('/slow-stream')
+        def slow_stream():
+            def body():
+                time.sleep(0.2)
+                yield 'done'
+            return Response(body())
+        
+        response = streaming_app.test_client().get('/slow-stream')
+        assert response.get_data(as_text=True) == 'done'
+        response.close()
+        snapshot = REQUEST_LATENCY.histogram('/slow-stream').snapshot()
+        assert snapshot['count'] == 1
+        assert snapshot['sum'] >= 0.2
@@ -0,0 +1,42 @@
+from page_cache import PageCache, make_etag, render_version
+
+class TestPageCache:
+    
+    def test_renders_once_per_validator(self):
+        """Test that pages are rendered on a miss and reused on a hit"""
+        cache = PageCache()
+        renders = []
+        
+        def render():
+            renders.append(1)
+            return '<html>plan</html>'
+        
+        assert cache.get_or_render(1, 'v1', render) == '<html>plan</html>'
+        assert cache.get_or_render(1, 'v1', render) == '<html>plan</html>'
+        cache.get_or_render(1, 'v2', render)
+        
+        assert len(renders) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+    
+    def test_invalidate_and_eviction(self):
+        """Test per-analysis invalidation and the LRU bound"""
+        cache = PageCache(max_size=2)
+        cache.get_or_render(1, 'a', lambda: 'one')
+        cache.get_or_render(2, 'b', lambda: 'two')
+        
+        cache.invalidate(1)
+        assert cache.get_or_render(1, 'a', lambda: 'one again') == 'one again'
+        assert cache.get_or_render(2, 'b', lambda: 'stale') == 'two'
+        
+        cache.get_or_render(3, 'c', lambda: 'three')
+        assert cache.get_or_render(1, 'a', lambda: 'evicted') == 'evicted'
+    
+    def test_etags_depend_on_every_part(self, tmp_path):
+        """Test validators and render fingerprints"""
+        assert make_etag('action-plan', 1, 1) == make_etag('action-plan', 1, 1)
+        assert make_etag('action-plan', 1, 1) != make_etag('action-plan', 1, 2)
+        
+        (tmp_path / 'page.html').write_text('v1')
+        before = render_version(str(tmp_path))
+        (tmp_path / 'page.html').write_text('v2')
+        assert render_version(str(tmp_path)) != before
@@ -0,0 +1,79 @@
+import pytest
+import pipeline_timing
+from pipeline_timing import Histogram, StageTimings, span, start_trace, STAGE_TIMINGS
+
+class TestPipelineTiming:
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        STAGE_TIMINGS.reset()
+    
+    def test_histogram_buckets(self):
+        """Test cumulative histogram buckets and quantiles"""
+        histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+        for value in [0.005, 0.05, 0.05, 0.5, 5.0]:
+            histogram.observe(value)
+        
+        snapshot = histogram.snapshot()
+        assert snapshot['count'] == 5
+        assert snapshot['sum'] == pytest.approx(5.605)
+        assert [count for _, count in snapshot['buckets']] == [1, 3, 4, 5]
+        
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == float('inf')
+        assert Histogram().quantile(0.5) is None
+    
+    def test_span_records_histogram_and_trace(self):
+        """Test that spans feed both the stage histograms and the active trace"""
+        with start_trace() as trace:
+            with span('upload.extract_text'):
+                pass
+            with span('analysis.match_skills'):
+                pass
+            with span('analysis.match_skills'):
+                pass
+        
+        breakdown = trace.breakdown()
+        assert set(breakdown) == {'upload.extract_text', 'analysis.match_skills', 'total'}
+        assert breakdown['total'] >= breakdown['analysis.match_skills']
+        
+        snapshot = STAGE_TIMINGS.snapshot()
+        assert snapshot['analysis.match_skills']['count'] == 2
+        assert snapshot['upload.extract_text']['count'] == 1
+    
+    def test_span_without_trace(self):
+        """Test that spans outside a trace still record histograms"""
+        with span('plan.generate'):
+            pass
+        
+        assert STAGE_TIMINGS.histogram('plan.generate').snapshot()['count'] == 1
+    
+    def test_span_records_on_exception(self):
+        """Test that failing stages are still timed"""
+        with start_trace() as trace:
+            with pytest.raises(ValueError):
+                with span('upload.extract_text'):
+                    raise ValueError("bad file")
+        
+        assert 'upload.extract_text' in trace.breakdown()
+    
+    def test_disabled_spans_are_no_ops(self, monkeypatch):
+        """Test that disabled timing records nothing"""
+        monkeypatch.setattr(pipeline_timing, 'ENABLED', False)
+        
+        with start_trace() as trace:
+            with span('upload.extract_text'):
+                pass
+        
+        assert span('a') is span('b')
+        assert trace.breakdown() == {'total': 0.0}
+        assert STAGE_TIMINGS.snapshot() == {}
+    
+    def test_stage_timings_reset(self):
+        """Test that recorded timings can be cleared"""
+        timings = StageTimings()
+        timings.observe('plan.db_commit', 0.01)
+        assert 'plan.db_commit' in timings.snapshot()
+        
+        timings.reset()
+        assert timings.snapshot() == {}
@@ -0,0 +1,43 @@
+from plan_diff import PlanDiff
+
+def _task(task_id, priority='critical', resource_ids=None):
+    return {'id': task_id, 'skill': task_id, 'priority': priority, 'resource_ids': resource_ids or []}
+
+class TestPlanDiff:
+    
+    def test_identical_plans(self):
+        """Test that an unchanged plan produces an empty diff"""
+        tasks = [_task('a'), _task('b')]
+        
+        diff = PlanDiff(tasks, [dict(task) for task in tasks])
+        
+        assert diff.is_empty
+        assert diff.summary() == 'no changes'
+    
+    def test_added_removed_changed(self):
+        """Test task level differences"""
+        old = [_task('a'), _task('b'), _task('c')]
+        new = [_task('a'), _task('b', priority='preferred'), _task('d')]
+        
+        diff = PlanDiff(old, new)
+        
+        assert diff.added == ['d']
+        assert diff.removed == ['c']
+        assert diff.changed == ['b']
+        assert not diff.is_empty
+        assert diff.summary() == '1 added, 1 removed, 1 changed'
+    
+    def test_reorder_only(self):
+        """Test that a new order alone still counts as a change"""
+        diff = PlanDiff([_task('a'), _task('b')], [_task('b'), _task('a')])
+        
+        assert diff.reordered
+        assert not diff.is_empty
+        assert diff.summary() == 'tasks reordered'
+    
+    def test_prune_completed(self):
+        """Test that completion state is kept only for surviving tasks"""
+        diff = PlanDiff([_task('a'), _task('b'), _task('c')], [_task('c'), _task('a')])
+        
+        assert diff.prune_completed(['c', 'b', 'a', 'gone']) == ['c', 'a']
+        assert diff.prune_completed(None) == []
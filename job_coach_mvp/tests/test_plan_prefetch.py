@@ -0,0 +1,66 @@
+import threading
+import time
+from plan_prefetch import SingleFlightPrefetcher
+
+class TestPlanPrefetch:
+    
+    def test_concurrent_submits_share_one_run(self):
+        """Test that requests for an in-flight key wait on the same work"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def generate(key):
+            calls.append(key)
+            started.set()
+            release.wait(5)
+            return f'plan-{key}'
+        
+        prefetcher = SingleFlightPrefetcher(generate)
+        first = prefetcher.submit(1)
+        started.wait(5)
+        second = prefetcher.submit(1)
+        
+        assert second is first
+        assert prefetcher.in_flight(1) is first
+        release.set()
+        assert first.result(5) == 'plan-1'
+        assert calls == [1]
+    
+    def test_finished_keys_run_again(self):
+        """Test that a completed key is forgotten"""
+        calls = []
+        prefetcher = SingleFlightPrefetcher(calls.append)
+        
+        prefetcher.submit('a').result(5)
+        # The done callback may still be running in the worker thread
+        deadline = time.monotonic() + 5
+        while prefetcher.in_flight('a') is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert prefetcher.wait('a') is False
+        prefetcher.submit('a').result(5)
+        assert calls == ['a', 'a']
+    
+    def test_eager_mode_runs_inline(self):
+        """Test that eager mode runs in the caller and reports errors on the future"""
+        def generate(key):
+            if key == 'bad':
+                raise ValueError('boom')
+            return threading.current_thread()
+        
+        prefetcher = SingleFlightPrefetcher(generate, eager=True)
+        
+        assert prefetcher.submit('ok').result() is threading.current_thread()
+        assert isinstance(prefetcher.submit('bad').exception(), ValueError)
+    
+    def test_executor_recreated_after_fork(self, monkeypatch):
+        """Test that a forked process gets its own thread pool"""
+        prefetcher = SingleFlightPrefetcher(lambda key: key)
+        prefetcher.submit(1).result(5)
+        executor = prefetcher._executor
+        
+        monkeypatch.setattr('plan_prefetch.os.getpid', lambda: -1)
+        
+        assert prefetcher.submit(2).result(5) == 2
+        assert prefetcher._executor is not executor
@@ -0,0 +1,83 @@
+import time
+import pytest
+from plan_scheduler import (
+    COMPLETED_TIMELINE, apply_schedule, format_week_range, format_weeks, order_tasks, schedule_tasks, weeks_needed
+)
+
+def _task(skill, hours, priority='preferred'):
+    return {'id': f'task_{skill.lower()}', 'skill': skill, 'estimated_hours': hours, 'priority': priority}
+
+class TestPlanScheduler:
+    
+    def test_orders_by_priority_then_plan_order(self):
+        """Test that more important tasks are scheduled first"""
+        tasks = [_task('Git', 5), _task('AWS', 5, 'critical'), _task('SQL', 5), _task('React', 5, 'high')]
+        
+        assert order_tasks(tasks, {}) == [1, 3, 0, 2]
+    
+    def test_prerequisites_come_first(self):
+        """Test that a prerequisite is scheduled before its dependents regardless of priority"""
+        tasks = [_task('Kubernetes', 20, 'critical'), _task('Docker', 15, 'preferred'), _task('AWS', 10, 'high')]
+        prerequisites = {'Kubernetes': ['Docker']}
+        
+        assert order_tasks(tasks, prerequisites) == [2, 1, 0]
+        
+        # Prerequisites that aren't part of the plan are ignored
+        assert order_tasks([tasks[0], tasks[2]], prerequisites) == [0, 1]
+    
+    def test_prerequisite_cycle_keeps_every_task(self):
+        """Test that a cycle doesn't drop tasks"""
+        tasks = [_task('A', 5), _task('B', 5, 'critical'), _task('C', 5)]
+        
+        assert order_tasks(tasks, {'A': ['B'], 'B': ['A']}) == [2, 1, 0]
+    
+    def test_packs_tasks_into_weekly_budget(self):
+        """Test that tasks share weeks instead of overlapping claims"""
+        tasks = [_task('Python', 15, 'critical'), _task('Git', 5, 'high'), _task('SQL', 12)]
+        
+        schedule = schedule_tasks(tasks, hours_per_week=10)
+        
+        assert schedule['timelines'] == {
+            'task_python': 'Week 1-2',
+            'task_git': 'Week 2',
+            'task_sql': 'Week 3-4'
+        }
+        assert schedule['total_weeks'] == 4
+        assert schedule_tasks(tasks, hours_per_week=40)['timelines']['task_sql'] == 'Week 1'
+    
+    def test_completed_tasks_free_capacity(self):
+        """Test that completed tasks are skipped when rescheduling"""
+        tasks = [_task('Python', 15, 'critical'), _task('Git', 5, 'high')]
+        
+        scheduled = apply_schedule(tasks, 10, completed=['task_python'])
+        
+        assert [task['timeline'] for task in scheduled] == [COMPLETED_TIMELINE, 'Week 1']
+        assert 'timeline' not in tasks[0]
+        assert schedule_tasks(tasks, 10, completed=['task_python', 'task_git'])['total_weeks'] == 0
+    
+    def test_invalid_budget(self):
+        """Test that a non-positive budget is rejected"""
+        with pytest.raises(ValueError):
+            schedule_tasks([_task('Git', 5)], hours_per_week=0)
+    
+    def test_formatting(self):
+        """Test timeline labels"""
+        assert weeks_needed(25, 10) == 3
+        assert weeks_needed(0, 10) == 1
+        assert format_weeks(1) == '1 week'
+        assert format_weeks(3) == '3 weeks'
+        assert format_weeks(10) == '2.5 months'
+        assert format_week_range(2, 2) == 'Week 2'
+        assert format_week_range(2, 4) == 'Week 2-4'
+    
+    def test_large_plan_is_fast(self):
+        """Test scheduling hundreds of chained tasks"""
+        tasks = [_task(f'Skill{i}', 3, ['critical', 'high', 'preferred'][i % 3]) for i in range(500)]
+        prerequisites = {f'Skill{i}': [f'Skill{i - 1}'] for i in range(1, 500, 2)}
+        
+        start = time.perf_counter()
+        schedule = schedule_tasks(tasks, 10, prerequisites)
+        elapsed = time.perf_counter() - start
+        
+        assert len(schedule['timelines']) == 500
+        assert elapsed < 0.5
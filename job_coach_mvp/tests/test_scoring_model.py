@@ -0,0 +1,127 @@
+import json
+import pytest
+from scoring_model import ScoringModel
+
+class TestScoringModel:
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.model = ScoringModel()
+        self.resume_skills = [
+            {'name': 'Python', 'level': 'basic', 'category': 'Programming'},
+            {'name': 'Flask', 'level': 'intermediate', 'category': 'Web Development'}
+        ]
+        self.required_skills = [
+            {'name': 'Python', 'importance': 'critical', 'category': 'Programming', 'level': 'advanced'},
+            {'name': 'Django', 'importance': 'critical', 'category': 'Web Development'},
+            {'name': 'Figma', 'importance': 'preferred', 'category': 'Design & UX'}
+        ]
+    
+    def test_default_weights_match_critical_preferred_split(self):
+        """Test that defaults keep the 80/20 critical/preferred weighting"""
+        required = [
+            {'name': 'Python', 'importance': 'critical', 'category': 'Programming'},
+            {'name': 'Figma', 'importance': 'preferred', 'category': 'Design & UX'}
+        ]
+        assert self.model.score(self.resume_skills, required) == 80.0
+        assert self.model.score(self.resume_skills, []) == 100.0
+    
+    def test_category_weights(self):
+        """Test that category weights shift weight within an importance group"""
+        model = ScoringModel({'category_weights': {'Programming': 3.0}})
+        
+        # Python carries 3/4 of the critical share, Django (partial credit) 1/4
+        default_score = self.model.score(self.resume_skills, self.required_skills)
+        weighted_score = model.score(self.resume_skills, self.required_skills)
+        assert weighted_score > default_score
+    
+    def test_level_gap_credit(self):
+        """Test that matched skills below the required level lose credit"""
+        model = ScoringModel({'level_gap_credit': {'1': 0.75, '2': 0.5}})
+        
+        required = [{'name': 'Python', 'importance': 'critical', 'category': 'Programming', 'level': 'advanced'}]
+        assert self.model.score(self.resume_skills, required) == 80.0
+        assert model.score(self.resume_skills, required) == 40.0
+    
+    def test_score_batch_matches_single_scores(self):
+        """Test that batch scoring equals scoring rows one at a time"""
+        pairs = [
+            (self.resume_skills, self.required_skills),
+            ([], self.required_skills),
+            (self.resume_skills, []),
+            ([{'name': 'COBOL', 'level': 'basic'}], [{'name': 'COBOL', 'importance': 'critical', 'category': 'Other'}])
+        ]
+        
+        scores = self.model.score_batch(pairs)
+        
+        assert list(scores) == [self.model.score(resume, required) for resume, required in pairs]
+        assert scores[1] == 0.0
+        assert scores[2] == 100.0
+        assert scores[3] == 80.0
+    
+    def test_skill_deltas_are_single_skill_gains(self):
+        """Test that each delta is the score gained by acquiring that skill alone"""
+        base = self.model.score(self.resume_skills, self.required_skills)
+        deltas = self.model.skill_deltas(self.resume_skills, self.required_skills)
+        
+        assert set(deltas) == {skill['name'].lower() for skill in self.required_skills}
+        acquired = [{'name': 'Django', 'level': 'basic'}]
+        assert self.model.score_with_skills(self.resume_skills, self.required_skills, acquired) == \
+            pytest.approx(base + deltas['django'])
+        assert self.model.skill_deltas(self.resume_skills, []) == {}
+    
+    def test_related_skill_gains_overlap(self):
+        """Test that acquiring one skill credits related requirements, so gains don't add up"""
+        required = [
+            {'name': 'Django', 'importance': 'critical', 'category': 'Web Development'},
+            {'name': 'Flask', 'importance': 'critical', 'category': 'Web Development'}
+        ]
+        deltas = self.model.skill_deltas([], required)
+        flask = self.model.score_with_skills([], required, [{'name': 'Flask', 'level': 'intermediate'}])
+        both = self.model.score_with_skills([], required, [{'name': 'Flask', 'level': 'basic'},
+                                                           {'name': 'Django', 'level': 'basic'}])
+        
+        assert flask == deltas['flask'] > 40.0
+        assert both == 80.0 < deltas['flask'] + deltas['django']
+    
+    def test_score_with_skills_keeps_higher_level(self):
+        """Test that an acquired skill never lowers the level already on the resume"""
+        required = [{'name': 'Python', 'importance': 'critical', 'category': 'Programming', 'level': 'advanced'}]
+        model = ScoringModel({'level_gap_credit': {'1': 0.75, '2': 0.5}})
+        resume = [{'name': 'Python', 'level': 'intermediate'}]
+        
+        assert model.score_with_skills(resume, required, [{'name': 'Python', 'level': 'basic'}]) == 60.0
+        assert model.score_with_skills(resume, required, [{'name': 'Python', 'level': 'advanced'}]) == 80.0
+    
+    def test_readiness_level_and_band(self):
+        """Test readiness ladder lookups"""
+        assert self.model.readiness_level(95) == 'Excellent'
+        assert self.model.readiness_level(60) == 'Fair'
+        assert self.model.readiness_level(10) == 'Needs Improvement'
+        
+        assert self.model.readiness_band(85)['icon'] == '🟢'
+        assert self.model.readiness_band(65)['icon'] == '🟡'
+        assert self.model.readiness_band(10)['icon'] == '🔴'
+    
+    def test_from_file(self, tmp_path):
+        """Test loading a scoring model from configuration"""
+        config_path = tmp_path / 'scoring.json'
+        config_path.write_text(json.dumps({
+            'importance_weights': {'critical': 0.6, 'preferred': 0.4},
+            'readiness_levels': [{'min_score': 50, 'label': 'Ready'}, {'min_score': 0, 'label': 'Not Ready'}]
+        }))
+        
+        model = ScoringModel.from_file(str(config_path))
+        
+        required = [{'name': 'Python', 'importance': 'critical', 'category': 'Programming'}]
+        assert model.score(self.resume_skills, required) == 60.0
+        assert model.readiness_level(55) == 'Ready'
+        assert model.readiness_band(85)['icon'] == '🟢'
+    
+    def test_invalid_config(self):
+        """Test that invalid configuration is rejected"""
+        with pytest.raises(ValueError, match="Unknown scoring config keys"):
+            ScoringModel({'critical_weight': 0.8})
+        
+        with pytest.raises(ValueError, match="has no weight"):
+            ScoringModel({'importance_weights': {'critical': 1.0}})
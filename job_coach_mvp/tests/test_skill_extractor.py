@@ -1,5 +1,6 @@
 import pytest
-from skill_extractor import SkillExtractor
+from gap_analyzer import GapAnalyzer
+from skill_extractor import SkillExtractor, get_skill_extractor
 
 class TestSkillExtractor:
     
@@ -134,3 +135,9 @@ class TestSkillExtractor:
         
         requirements = self.extractor.extract_requirements_from_job_description(None)
         assert requirements == []
+    
+    def test_shared_extractor(self):
+        """Test that analyzers share one extractor with precompiled patterns"""
+        assert get_skill_extractor() is get_skill_extractor()
+        assert GapAnalyzer().skill_extractor is get_skill_extractor()
+        assert len(get_skill_extractor()._skill_patterns) == len(get_skill_extractor().all_skills)
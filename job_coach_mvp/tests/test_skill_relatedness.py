@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+from skill_relatedness import (
+    SkillRelatedness, build_relatedness_matrix, save_relatedness_matrix,
+    get_skill_relatedness, taxonomy_skills
+)
+
+class TestSkillRelatedness:
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.relatedness = get_skill_relatedness()
+    
+    def test_matrix_covers_taxonomy(self):
+        """Test that every taxonomy skill has an ID and full self-similarity"""
+        skills = taxonomy_skills()
+        assert list(self.relatedness.skills) == skills
+        assert self.relatedness.matrix.shape == (len(skills), len(skills))
+        assert np.allclose(np.diag(self.relatedness.matrix), 1.0)
+        assert np.allclose(self.relatedness.matrix, self.relatedness.matrix.T)
+    
+    def test_related_skills_get_partial_similarity(self):
+        """Test that adjacent skills are similar but not identical"""
+        assert 0 < self.relatedness.similarity('Flask', 'Django') < 1
+        assert 0 < self.relatedness.similarity('MySQL', 'PostgreSQL') < 1
+        assert self.relatedness.similarity('Python', 'Figma') == 0.0
+        assert self.relatedness.similarity('python', 'Python') == 1.0
+    
+    def test_two_hop_similarity(self):
+        """Test that similarity extends one hop through the graph"""
+        # Kotlin -> Java -> Scala
+        assert self.relatedness.similarity('Kotlin', 'Scala') == pytest.approx(0.6 * 0.5)
+    
+    def test_two_hop_matches_dense_max_product(self):
+        """Test the neighbour-wise two-hop pass against the dense max-product"""
+        skills = [f'skill-{i}' for i in range(12)]
+        relations = [(skills[i], skills[(i * 5 + 3) % 12], 0.3 + (i % 7) / 10) for i in range(12) if i != (i * 5 + 3) % 12]
+        
+        direct = build_relatedness_matrix(skills, relations, min_similarity=0.0)
+        one_hop = np.zeros_like(direct)
+        for source, target, weight in relations:
+            i, j = skills.index(source), skills.index(target)
+            one_hop[i, j] = one_hop[j, i] = max(one_hop[i, j], weight)
+        np.fill_diagonal(one_hop, 1.0)
+        dense = np.maximum(one_hop, np.max(one_hop[:, :, None] * one_hop[None, :, :], axis=1))
+        
+        assert np.allclose(direct, dense)
+    
+    def test_unknown_relation_skill_rejected(self):
+        """Test that relations must reference taxonomy skills"""
+        with pytest.raises(ValueError, match="Unknown skill"):
+            build_relatedness_matrix(['Python'], [('Python', 'COBOL', 0.5)])
+    
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test that the offline build can be loaded back"""
+        path = save_relatedness_matrix(str(tmp_path / 'relatedness.npz'))
+        loaded = SkillRelatedness.load(path)
+        
+        assert loaded.skills == self.relatedness.skills
+        assert np.allclose(loaded.matrix, self.relatedness.matrix)
@@ -0,0 +1,64 @@
+import os
+import threading
+
+from app import app
+from warmup import Warmup, FAILED, PENDING, READY, WARMING
+
+class TestWarmup:
+    
+    def test_steps_run_once_and_are_timed(self):
+        """Test that warm-up runs each step once and reports its duration"""
+        calls = []
+        warmup = Warmup(app, [('first', lambda: calls.append('first')), ('second', lambda: calls.append('second'))])
+        assert warmup.status() == {'status': PENDING}
+        
+        warmup.run()
+        warmup.run()
+        
+        assert calls == ['first', 'second']
+        assert warmup.ready
+        assert set(warmup.status()['steps']) == {'first', 'second'}
+    
+    def test_failed_step_is_reported_and_retried(self):
+        """Test that a failing step leaves the process unready until a retry succeeds"""
+        attempts = []
+        
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError('database unavailable')
+        
+        warmup = Warmup(app, [('database', flaky)])
+        warmup.run()
+        assert warmup.status()['status'] == FAILED
+        assert 'database unavailable' in warmup.status()['error']
+        
+        warmup.run()
+        assert warmup.ready
+    
+    def test_background_start(self):
+        """Test that start() warms up in a thread and isn't repeated while running"""
+        release = threading.Event()
+        calls = []
+        warmup = Warmup(app, [('slow', lambda: calls.append(release.wait(5)))])
+        
+        warmup.start()
+        warmup.start()
+        assert warmup.state == WARMING
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name == 'warmup':
+                thread.join(5)
+        
+        assert warmup.ready
+        assert calls == [True]
+    
+    def test_forked_process_starts_cold(self, monkeypatch):
+        """Test that a process doesn't inherit its parent's readiness"""
+        warmup = Warmup(app, [])
+        warmup.run()
+        assert warmup.state == READY
+        
+        monkeypatch.setattr(os, 'getpid', lambda: -1)
+        assert warmup.state == PENDING
+        assert not warmup.ready
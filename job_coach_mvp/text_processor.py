@@ -9,26 +9,36 @@ class TextProcessor:
     @staticmethod
     def extract_text_from_file(file_path):
         """Extract text from uploaded file based on file extension"""
+        return TextProcessor.extract_text_and_pages(file_path)[0]
+    
+    @staticmethod
+    def extract_text_and_pages(file_path):
+        """Extract text and the page count (PDF only, otherwise None) from an uploaded file"""
         file_extension = os.path.splitext(file_path)[1].lower()
         
         if file_extension == '.pdf':
-            return TextProcessor._extract_from_pdf(file_path)
+            return TextProcessor._extract_pages_from_pdf(file_path)
         elif file_extension in ['.docx', '.doc']:
-            return TextProcessor._extract_from_docx(file_path)
+            return TextProcessor._extract_from_docx(file_path), None
         elif file_extension in ['.txt']:
-            return TextProcessor._extract_from_txt(file_path)
+            return TextProcessor._extract_from_txt(file_path), None
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
     
     @staticmethod
     def _extract_from_pdf(file_path):
         """Extract text from PDF using pdfplumber"""
+        return TextProcessor._extract_pages_from_pdf(file_path)[0]
+    
+    @staticmethod
+    def _extract_pages_from_pdf(file_path):
+        """Extract text and page count from PDF using pdfplumber"""
         try:
             with pdfplumber.open(file_path) as pdf:
                 text = ""
                 for page in pdf.pages:
                     text += page.extract_text() or ""
-                return text.strip()
+                return text.strip(), len(pdf.pages)
         except Exception as e:
             raise ValueError(f"Error extracting text from PDF: {str(e)}")
     
@@ -0,0 +1,101 @@
+"""
+Process warm-up and readiness.
+
+/health answers as soon as Flask is up, but a cold process still pays for
+lazy imports, NLTK lookups, catalog loading and its first database
+connection on its first real request. Warmup runs those steps ahead of
+traffic, in a background thread of each process (gunicorn's post_fork, or the
+first request the process sees), and /ready reports 503 until they have all
+finished, so load balancers and the keep-alive ping can tell a warm process
+from a cold one. Warm-up runs unrecorded (see pipeline_timing), so its sample
+analysis doesn't show up in /metrics.
+
+A failed warm-up is retried the next time start() is called.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pipeline_timing import unrecorded
+
+logger = logging.getLogger(__name__)
+
+PENDING, WARMING, READY, FAILED = 'pending', 'warming', 'ready', 'failed'
+
+Step = Tuple[str, Callable[[], object]]
+
+
+class Warmup:
+    """Named warm-up steps run once per process"""
+
+    def __init__(self, app, steps: List[Step]):
+        self.app = app
+        self.steps = steps
+        self._state = PENDING
+        self._error: Optional[str] = None
+        self._timings: Dict[str, float] = {}
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> bool:
+        """Whether the recorded state belongs to this process (a fork inherits the parent's)"""
+        return self._pid == os.getpid()
+
+    @property
+    def state(self) -> str:
+        return self._state if self._current() else PENDING
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    def status(self) -> Dict[str, object]:
+        """Readiness report for /ready"""
+        state = self.state
+        report: Dict[str, object] = {'status': state}
+        if state != PENDING:
+            report['steps'] = dict(self._timings)
+        if state == FAILED:
+            report['error'] = self._error
+        return report
+
+    def _begin(self) -> bool:
+        """Claim this process's warm-up unless it is running or done"""
+        with self._lock:
+            if self._current() and self._state in (WARMING, READY):
+                return False
+            self._pid = os.getpid()
+            self._state = WARMING
+            self._error = None
+            self._timings = {}
+            return True
+
+    def start(self):
+        """Warm up this process in a background thread"""
+        if self.state in (WARMING, READY) or not self._begin():
+            return
+        threading.Thread(target=self._run, name='warmup', daemon=True).start()
+
+    def run(self):
+        """Warm up this process inline"""
+        if self._begin():
+            self._run()
+
+    def _run(self):
+        try:
+            # The sample work must not skew request metrics
+            with self.app.app_context(), unrecorded():
+                for name, step in self.steps:
+                    start = time.perf_counter()
+                    step()
+                    self._timings[name] = round((time.perf_counter() - start) * 1000, 2)
+        except Exception as e:
+            logger.exception("Warm-up failed")
+            self._error = f"{type(e).__name__}: {e}"
+            self._state = FAILED
+        else:
+            logger.info("Warm-up finished in %.0f ms", sum(self._timings.values()))
+            self._state = READY
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for gunicorn (see gunicorn.conf.py):
+
+    gunicorn -c gunicorn.conf.py
+"""
+
+from app import create_app
+
+app = create_app()